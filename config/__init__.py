@@ -7,6 +7,11 @@ from config.settings import (
     OUTPUT_DIR
 )
 from config.database_config import DatabaseConfig
+from config.cache_config import CacheConfig
+from config.latex_config import LatexCompileConfig
+from config.job_config import JobConfig
+from config.executor_config import ExecutorConfig
+from config.ranking_config import RankingConfig
 from config.logger_config import setup_logger
 
 __all__ = [
@@ -17,5 +22,10 @@ __all__ = [
     'PROMPTS_DIR',
     'OUTPUT_DIR',
     'DatabaseConfig',
+    'CacheConfig',
+    'LatexCompileConfig',
+    'JobConfig',
+    'ExecutorConfig',
+    'RankingConfig',
     'setup_logger'
 ]
@@ -0,0 +1,119 @@
+"""Cache configuration module."""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+from config.settings import PROJECT_ROOT
+
+
+@dataclass
+class SectionCacheConfig:
+    """Section content cache settings."""
+
+    collection: str
+    ttl_seconds: int
+    max_memory_entries: int
+    enabled: bool
+
+
+@dataclass
+class LatexFormatCacheConfig:
+    """Precompiled pdflatex format cache settings."""
+
+    directory: Path
+    enabled: bool
+
+
+@dataclass
+class PdfCacheConfig:
+    """Content-addressed compiled PDF cache settings."""
+
+    directory: Path
+    max_bytes: int
+    collection: str
+    ttl_seconds: int  # Lifetime of entries in the shared MongoDB tier
+    use_mongo: bool
+    enabled: bool
+
+
+@dataclass
+class TemplateRegistryConfig:
+    """In-process tex header / preamble registry settings."""
+
+    refresh_seconds: float
+
+
+class CacheConfig:
+    """Cache configuration handler."""
+
+    # Cache of generated section / cover letter content
+    SECTION_CACHE = SectionCacheConfig(
+        collection="section_cache",
+        ttl_seconds=int(os.getenv("SECTION_CACHE_TTL_SECONDS", 7 * 24 * 3600)),
+        max_memory_entries=int(os.getenv("SECTION_CACHE_MAX_ENTRIES", 512)),
+        enabled=os.getenv("SECTION_CACHE_ENABLED", "true").lower() == "true"
+    )
+
+    # Precompiled preamble formats (.fmt) for pdflatex
+    LATEX_FORMAT_CACHE = LatexFormatCacheConfig(
+        directory=Path(os.getenv("LATEX_FORMAT_CACHE_DIR", PROJECT_ROOT / ".cache" / "latex_formats")),
+        enabled=os.getenv("LATEX_FORMAT_CACHE_ENABLED", "true").lower() == "true"
+    )
+
+    # Compiled PDFs keyed by tex source, compiler version and assets
+    PDF_CACHE = PdfCacheConfig(
+        directory=Path(os.getenv("PDF_CACHE_DIR", PROJECT_ROOT / ".cache" / "pdfs")),
+        max_bytes=int(os.getenv("PDF_CACHE_MAX_MB", 256)) * 1024 * 1024,
+        collection="pdf_cache",
+        ttl_seconds=int(os.getenv("PDF_CACHE_TTL_SECONDS", 7 * 24 * 3600)),
+        use_mongo=os.getenv("PDF_CACHE_USE_MONGO", "false").lower() == "true",
+        enabled=os.getenv("PDF_CACHE_ENABLED", "true").lower() == "true"
+    )
+
+    # How often the template registry polls MongoDB for edited headers / preambles
+    TEMPLATE_REGISTRY = TemplateRegistryConfig(
+        refresh_seconds=float(os.getenv("TEMPLATE_REFRESH_SECONDS", 60))
+    )
+
+    @classmethod
+    def get_section_cache_config(cls) -> SectionCacheConfig:
+        """
+        Get section cache configuration.
+
+        Returns:
+            SectionCacheConfig: Section cache settings
+        """
+        return cls.SECTION_CACHE
+
+    @classmethod
+    def get_latex_format_cache_config(cls) -> LatexFormatCacheConfig:
+        """
+        Get precompiled LaTeX format cache configuration.
+
+        Returns:
+            LatexFormatCacheConfig: Format cache settings
+        """
+        return cls.LATEX_FORMAT_CACHE
+
+
+    @classmethod
+    def get_pdf_cache_config(cls) -> PdfCacheConfig:
+        """
+        Get compiled PDF cache configuration.
+
+        Returns:
+            PdfCacheConfig: PDF cache settings
+        """
+        return cls.PDF_CACHE
+
+
+    @classmethod
+    def get_template_registry_config(cls) -> TemplateRegistryConfig:
+        """
+        Get template registry configuration.
+
+        Returns:
+            TemplateRegistryConfig: Template registry settings
+        """
+        return cls.TEMPLATE_REGISTRY
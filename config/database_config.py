@@ -1,5 +1,6 @@
 """Database configuration module."""
 
+import os
 from typing import Dict, Any
 from dataclasses import dataclass
 from config.config import MONGODB_URI, MONGODB_DATABASE
@@ -25,12 +26,16 @@ class DatabaseConfig:
             'profiles': "profiles",
             'resumes': "resumes",
             'cover_letters': "cover_letters",
-            'portfolios': "portfolios"
+            'portfolios': "portfolios",
+            'generation_jobs': "generation_jobs"
         },
         options={
-            'max_pool_size': 50,
-            'connect_timeout': 30000,
-            'server_selection_timeout': 5000
+            'max_pool_size': int(os.getenv("MONGODB_MAX_POOL_SIZE", 50)),
+            'min_pool_size': int(os.getenv("MONGODB_MIN_POOL_SIZE", 0)),
+            'max_idle_time': int(os.getenv("MONGODB_MAX_IDLE_TIME_MS", 300000)),
+            'connect_timeout': int(os.getenv("MONGODB_CONNECT_TIMEOUT_MS", 30000)),
+            'server_selection_timeout': int(os.getenv("MONGODB_SERVER_SELECTION_TIMEOUT_MS", 5000)),
+            'socket_timeout': int(os.getenv("MONGODB_SOCKET_TIMEOUT_MS", 60000))
         }
     )
     
@@ -0,0 +1,35 @@
+"""API execution layer configuration module."""
+
+import os
+from dataclasses import dataclass
+
+
+@dataclass
+class ExecutorPoolConfig:
+    """Settings for a bounded executor used by the API services."""
+
+    max_workers: int
+    max_queue: int
+    retry_after_seconds: int
+
+
+class ExecutorConfig:
+    """API executor configuration handler."""
+
+    # Blocking LLM calls from request handlers run on this pool instead of the event loop.
+    # Once max_workers are busy and max_queue are waiting, requests get 429 + Retry-After.
+    LLM = ExecutorPoolConfig(
+        max_workers=int(os.getenv("LLM_EXECUTOR_MAX_WORKERS", 8)),
+        max_queue=int(os.getenv("LLM_EXECUTOR_MAX_QUEUE", 16)),
+        retry_after_seconds=int(os.getenv("LLM_EXECUTOR_RETRY_AFTER_SECONDS", 30))
+    )
+
+    @classmethod
+    def get_llm_executor_config(cls) -> ExecutorPoolConfig:
+        """
+        Get LLM executor configuration.
+
+        Returns:
+            ExecutorPoolConfig: LLM executor settings
+        """
+        return cls.LLM
@@ -0,0 +1,65 @@
+"""Background generation job configuration module."""
+
+import os
+from dataclasses import dataclass
+
+
+@dataclass
+class GenerationJobConfig:
+    """Settings for background generation jobs."""
+
+    collection: str
+    events_collection: str
+    max_workers: int
+    progress_interval: float
+    event_poll_interval: float
+    event_ttl_seconds: int
+    dispatch: str
+    lease_seconds: float
+    heartbeat_interval: float
+    max_attempts: int
+    retry_delay_seconds: float
+    worker_poll_interval: float
+    batch_concurrency: int
+    runs_collection: str
+    run_ttl_seconds: int
+
+
+class JobConfig:
+    """Generation job configuration handler."""
+
+    # Jobs run in-process on a bounded pool; progress writes are throttled to one per interval.
+    # Progress / section events are streamed to clients from a separate collection.
+    # dispatch="queue" leaves jobs to `python -m src.worker` processes instead of the in-process
+    # pool. Either way a running job holds a lease that is renewed every heartbeat_interval; jobs
+    # whose lease expires (crashed worker) are leased again, up to max_attempts times. In thread
+    # mode the API process runs one lease loop of its own for these and for retried jobs, polling
+    # every worker_poll_interval, in addition to the max_workers pool.
+    # Every generation checkpoints its finished stages to a run document kept for run_ttl_seconds.
+    GENERATION_JOBS = GenerationJobConfig(
+        collection="generation_jobs",
+        events_collection="generation_job_events",
+        max_workers=int(os.getenv("GENERATION_JOB_WORKERS", 4)),
+        progress_interval=float(os.getenv("GENERATION_JOB_PROGRESS_INTERVAL_SECONDS", 0.5)),
+        event_poll_interval=float(os.getenv("GENERATION_JOB_EVENT_POLL_SECONDS", 0.25)),
+        event_ttl_seconds=int(os.getenv("GENERATION_JOB_EVENT_TTL_SECONDS", 24 * 3600)),
+        dispatch=os.getenv("GENERATION_JOB_DISPATCH", "thread"),
+        lease_seconds=float(os.getenv("GENERATION_JOB_LEASE_SECONDS", 120)),
+        heartbeat_interval=float(os.getenv("GENERATION_JOB_HEARTBEAT_SECONDS", 30)),
+        max_attempts=int(os.getenv("GENERATION_JOB_MAX_ATTEMPTS", 3)),
+        retry_delay_seconds=float(os.getenv("GENERATION_JOB_RETRY_DELAY_SECONDS", 30)),
+        worker_poll_interval=float(os.getenv("GENERATION_JOB_WORKER_POLL_SECONDS", 2)),
+        batch_concurrency=int(os.getenv("GENERATION_BATCH_CONCURRENCY", 4)),
+        runs_collection="generation_runs",
+        run_ttl_seconds=int(os.getenv("GENERATION_RUN_TTL_SECONDS", 7 * 24 * 3600))
+    )
+
+    @classmethod
+    def get_generation_job_config(cls) -> GenerationJobConfig:
+        """
+        Get generation job configuration.
+
+        Returns:
+            GenerationJobConfig: Generation job settings
+        """
+        return cls.GENERATION_JOBS
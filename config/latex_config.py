@@ -0,0 +1,45 @@
+"""LaTeX compilation configuration module."""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+
+@dataclass
+class CompileWorkerConfig:
+    """Settings for the LaTeX compile worker pool."""
+
+    max_workers: int
+    max_queue: int
+    queue_timeout: float
+    build_root: Optional[Path]
+    timeout_seconds: int
+    memory_limit_mb: int
+    retry_after_seconds: int
+
+
+class LatexCompileConfig:
+    """LaTeX compilation configuration handler."""
+
+    # Concurrent pdflatex processes, waiting jobs beyond those and per-job limits.
+    # Point LATEX_BUILD_ROOT at a tmpfs (e.g. /dev/shm) to keep builds off disk.
+    WORKERS = CompileWorkerConfig(
+        max_workers=int(os.getenv("LATEX_MAX_WORKERS", os.cpu_count() or 2)),
+        max_queue=int(os.getenv("LATEX_MAX_QUEUE", 16)),
+        queue_timeout=float(os.getenv("LATEX_QUEUE_TIMEOUT_SECONDS", 0)),
+        build_root=Path(os.environ["LATEX_BUILD_ROOT"]) if os.getenv("LATEX_BUILD_ROOT") else None,
+        timeout_seconds=int(os.getenv("LATEX_TIMEOUT_SECONDS", 60)),
+        memory_limit_mb=int(os.getenv("LATEX_MEMORY_LIMIT_MB", 1024)),
+        retry_after_seconds=int(os.getenv("LATEX_RETRY_AFTER_SECONDS", 10))
+    )
+
+    @classmethod
+    def get_worker_config(cls) -> CompileWorkerConfig:
+        """
+        Get compile worker pool configuration.
+
+        Returns:
+            CompileWorkerConfig: Worker pool settings
+        """
+        return cls.WORKERS
@@ -1,5 +1,7 @@
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional
+import re
+import tempfile
+from typing import Dict, Any, List, Optional, Tuple
 import os
 from dotenv import load_dotenv
 
@@ -12,6 +14,36 @@ class ModelConfig:
     max_tokens: Optional[int] = None
     default_options: Dict[str, Any] = field(default_factory=dict)
 
+@dataclass
+class HttpPoolConfig:
+    """Connection pool settings shared by all provider clients."""
+    max_connections: int
+    max_keepalive_connections: int
+    keepalive_expiry: float
+    http2: bool
+
+@dataclass
+class ResilienceConfig:
+    """Retry, circuit breaker, hedging and failover settings for LLM calls."""
+    max_retries: int
+    backoff_base_seconds: float
+    backoff_max_seconds: float
+    breaker_failure_threshold: int
+    breaker_reset_seconds: float
+    hedge_after_seconds: float
+    failover_chain: List[str]
+    latency_budget_seconds: float = 0.0  # 0 disables the per-resume budget
+
+@dataclass
+class RateLimitConfig:
+    """Client-side request and token budgets, enforced with token buckets."""
+    backend: str  # "memory", "file" or "mongo"
+    headroom: float
+    burst_seconds: float
+    file_path: str
+    collection: str
+    limits: Dict[str, Tuple[int, int]]  # provider -> (requests/minute, tokens/minute); 0 means unlimited
+
 class LLMConfig:
     # Provider configurations
     PROVIDER_CONFIG = {
@@ -58,6 +90,62 @@ class LLMConfig:
     # Default URIs and folder names
     OLLAMA_DEFAULT_URI = "http://localhost:11434"
 
+    # Maximum in-flight requests per provider, shared by every caller in the process.
+    # Can be overridden with e.g. CLAUDE_MAX_CONCURRENCY=2
+    MAX_CONCURRENT_REQUESTS = {
+        "OpenAI": 8,
+        "Claude": 4,
+        "Ollama": 1,
+        "Gemini": 4
+    }
+
+    # One pooled HTTP client per provider / API key lives for the whole process.
+    # HTTP/2 is used when the optional h2 package is installed.
+    HTTP_POOL = HttpPoolConfig(
+        max_connections=int(os.getenv("LLM_HTTP_MAX_CONNECTIONS", 32)),
+        max_keepalive_connections=int(os.getenv("LLM_HTTP_MAX_KEEPALIVE", 16)),
+        keepalive_expiry=float(os.getenv("LLM_HTTP_KEEPALIVE_SECONDS", 90)),
+        http2=os.getenv("LLM_HTTP2", "true").lower() == "true"
+    )
+
+    # Transient errors are retried with jittered exponential backoff (a longer Retry-After
+    # than LLM_BACKOFF_MAX_SECONDS moves on to the next provider instead of waiting).
+    # LLM_HEDGE_AFTER_SECONDS > 0 sends a duplicate request when the first is that slow.
+    # LLM_FAILOVER_CHAIN lists providers tried in order after the configured one, e.g. "OpenAI,Ollama".
+    # RESUME_LATENCY_BUDGET_SECONDS > 0 caps the section stage of a resume: AI sections not
+    # done by then are replaced with their hardcoded version.
+    RESILIENCE = ResilienceConfig(
+        max_retries=int(os.getenv("LLM_MAX_RETRIES", 3)),
+        backoff_base_seconds=float(os.getenv("LLM_BACKOFF_BASE_SECONDS", 1.0)),
+        backoff_max_seconds=float(os.getenv("LLM_BACKOFF_MAX_SECONDS", 30.0)),
+        breaker_failure_threshold=int(os.getenv("LLM_BREAKER_FAILURE_THRESHOLD", 5)),
+        breaker_reset_seconds=float(os.getenv("LLM_BREAKER_RESET_SECONDS", 60.0)),
+        hedge_after_seconds=float(os.getenv("LLM_HEDGE_AFTER_SECONDS", 0)),
+        failover_chain=[provider.strip() for provider in os.getenv("LLM_FAILOVER_CHAIN", "").split(",")
+                        if provider.strip()],
+        latency_budget_seconds=float(os.getenv("RESUME_LATENCY_BUDGET_SECONDS", 0))
+    )
+
+    # Per provider and model request / token budgets. Buckets refill continuously at
+    # headroom * limit, so sustained throughput stays just under the provider limit.
+    # Override per provider with e.g. CLAUDE_RPM / CLAUDE_TPM, or per model with
+    # CLAUDE_CLAUDE_3_5_SONNET_LATEST_TPM. LLM_RATE_LIMIT_BACKEND=file or mongo shares
+    # the buckets between worker processes / nodes.
+    RATE_LIMIT = RateLimitConfig(
+        backend=os.getenv("LLM_RATE_LIMIT_BACKEND", "memory").lower(),
+        headroom=float(os.getenv("LLM_RATE_LIMIT_HEADROOM", 0.9)),
+        burst_seconds=float(os.getenv("LLM_RATE_LIMIT_BURST_SECONDS", 10)),
+        file_path=os.getenv("LLM_RATE_LIMIT_FILE",
+                            os.path.join(tempfile.gettempdir(), "resume_builder_llm_rate_limits.json")),
+        collection="llm_rate_limits",
+        limits={
+            "OpenAI": (500, 30000),
+            "Claude": (50, 40000),
+            "Ollama": (0, 0),
+            "Gemini": (15, 1000000)
+        }
+    )
+
     # Error messages
     MISSING_API_KEY_ERROR = "Missing API key for {} service. Please set the appropriate environment variable."
     MISSING_URI_ERROR = "Missing URI for {} service. Using default: {}"
@@ -82,6 +170,49 @@ class LLMConfig:
             return value or cls.OLLAMA_DEFAULT_URI
         return value
 
+    @classmethod
+    def get_max_concurrency(cls, provider: str) -> int:
+        """Get the maximum number of concurrent requests allowed for a provider."""
+        default = cls.MAX_CONCURRENT_REQUESTS.get(provider, 1)
+        value = os.getenv(f"{provider.upper()}_MAX_CONCURRENCY")
+        try:
+            return max(1, int(value)) if value else default
+        except ValueError:
+            return default
+
+    @classmethod
+    def get_http_pool_config(cls) -> HttpPoolConfig:
+        """Get the connection pool settings for provider clients."""
+        return cls.HTTP_POOL
+
+    @classmethod
+    def get_resilience_config(cls) -> ResilienceConfig:
+        """Get the retry, circuit breaker, hedging and failover settings."""
+        return cls.RESILIENCE
+
+    @classmethod
+    def get_rate_limit_config(cls) -> RateLimitConfig:
+        """Get the client-side rate limiter settings."""
+        return cls.RATE_LIMIT
+
+    @classmethod
+    def get_rate_limits(cls, provider: str, model: str) -> Tuple[int, int]:
+        """
+        Get the (requests per minute, tokens per minute) budget for a provider's model.
+
+        Environment overrides are checked per model first, then per provider.
+        """
+        default_rpm, default_tpm = cls.RATE_LIMIT.limits.get(provider, (0, 0))
+        model_prefix = f"{provider}_{re.sub(r'[^A-Za-z0-9]+', '_', model or '')}".upper()
+        limits = []
+        for suffix, default in (("RPM", default_rpm), ("TPM", default_tpm)):
+            value = os.getenv(f"{model_prefix}_{suffix}") or os.getenv(f"{provider.upper()}_{suffix}")
+            try:
+                limits.append(max(0, int(value)) if value else default)
+            except ValueError:
+                limits.append(default)
+        return limits[0], limits[1]
+
     # Prompt templates
     SECTION_PROMPT_TEMPLATE = """
     {prompt}
@@ -0,0 +1,41 @@
+"""Portfolio relevance ranking configuration module."""
+
+import os
+from dataclasses import dataclass
+
+
+@dataclass
+class SectionRankingConfig:
+    """Settings for ranking portfolio items against the job description."""
+
+    enabled: bool
+    item_multiplier: float
+    bullet_multiplier: float
+    k1: float
+    b: float
+
+
+class RankingConfig:
+    """Relevance ranking configuration handler."""
+
+    # Sections with more items than the user's preference cap are cut down to the
+    # item_multiplier * cap best matches (and bullets to bullet_multiplier * cap) before
+    # they are sent to the LLM, which still makes the final choice. k1 and b are the
+    # usual BM25 parameters.
+    SECTION_RANKING = SectionRankingConfig(
+        enabled=os.getenv("SECTION_RANKING_ENABLED", "true").lower() == "true",
+        item_multiplier=float(os.getenv("SECTION_RANKING_ITEM_MULTIPLIER", 2.0)),
+        bullet_multiplier=float(os.getenv("SECTION_RANKING_BULLET_MULTIPLIER", 2.0)),
+        k1=float(os.getenv("SECTION_RANKING_BM25_K1", 1.5)),
+        b=float(os.getenv("SECTION_RANKING_BM25_B", 0.75))
+    )
+
+    @classmethod
+    def get_section_ranking_config(cls) -> SectionRankingConfig:
+        """
+        Get section ranking configuration.
+
+        Returns:
+            SectionRankingConfig: Section ranking settings
+        """
+        return cls.SECTION_RANKING
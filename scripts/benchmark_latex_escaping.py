@@ -0,0 +1,115 @@
+"""
+Benchmark LatexEscaper and sanitize_text against their previous implementations.
+
+Builds a synthetic portfolio of configurable size and times escaping every string in
+it, one call per string and with escape_tree, plus sanitize_text over the same text.
+
+    python -m scripts.benchmark_latex_escaping --jobs 200 --repeat 5
+"""
+
+import argparse
+import random
+import string
+import timeit
+import unicodedata
+
+from src.latex.utils.latex_escaper import LatexEscaper
+from src.latex.utils.sanitizer import sanitize_text
+
+WORDS = ["Python", "C++", "R&D", "100%", "$2M", "#1", "snake_case", "{braces}", "~approx", "x^2",
+         "<tags>", "Kubernetes", "café", "naïve", "latency", "p99", "MongoDB", "team", "of", "the"]
+
+
+def legacy_escape_text(text: str) -> str:
+    """LatexEscaper.escape_text before the rewrite."""
+    if not isinstance(text, str):
+        text = str(text)
+    if text.startswith('\\'):
+        return text
+    special_chars = {
+        '&': '\\&', '%': '\\%', '$': '\\$', '#': '\\#', '_': '\\_', '{': '\\{', '}': '\\}',
+        '~': '\\textasciitilde{}', '^': '\\textasciicircum{}', '<': '\\textless{}', '>': '\\textgreater{}'
+    }
+    for char, replacement in special_chars.items():
+        if not text.startswith('\\'):
+            text = text.replace(char, replacement)
+    return text
+
+
+def legacy_sanitize_text(text: str) -> str:
+    """sanitize_text before the rewrite."""
+    return ''.join(
+        char for char in unicodedata.normalize('NFKD', text)
+        if unicodedata.category(char)[0] != 'C'
+    )
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def build_portfolio(jobs: int, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    return {
+        'career_summary': {'job_titles': [sentence(rng, 3) for _ in range(5)], 'default_summary': sentence(rng, 80)},
+        'skills': [{sentence(rng, 2): [rng.choice(WORDS) for _ in range(15)]} for _ in range(jobs // 4 + 1)],
+        'work_experience': [
+            {
+                'job_title': sentence(rng, 3),
+                'company': sentence(rng, 2),
+                'location': rng.choice(string.ascii_uppercase) * 5,
+                'time': "2019 -- 2023",
+                'responsibilities': [sentence(rng, 25) for _ in range(6)],
+            }
+            for _ in range(jobs)
+        ],
+        'projects': [
+            {'name': sentence(rng, 3), 'technologies': sentence(rng, 4), 'bullet_points': [sentence(rng, 20) for _ in range(4)]}
+            for _ in range(jobs)
+        ],
+    }
+
+
+def collect_strings(data) -> list:
+    if isinstance(data, str):
+        return [data]
+    if isinstance(data, dict):
+        return [s for v in data.values() for s in collect_strings(v)]
+    if isinstance(data, (list, tuple)):
+        return [s for v in data for s in collect_strings(v)]
+    return []
+
+
+def report(label: str, legacy: float, current: float) -> None:
+    print(f"{label:<32}{legacy * 1000:>12.2f}{current * 1000:>12.2f}{legacy / current:>10.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--jobs', type=int, default=200, help="work experience / project entries")
+    parser.add_argument('--repeat', type=int, default=5, help="timing repetitions, best is reported")
+    args = parser.parse_args()
+
+    portfolio = build_portfolio(args.jobs)
+    texts = collect_strings(portfolio)
+    # The legacy loop stopped escaping once the text started with a backslash, so
+    # strings beginning with a special character were only partly escaped
+    comparable = [t for t in texts if not LatexEscaper.escape_text(t[:1]).startswith('\\')]
+    assert [legacy_escape_text(t) for t in comparable] == LatexEscaper.escape_many(comparable)
+    assert [legacy_sanitize_text(t) for t in texts] == [sanitize_text(t) for t in texts]
+
+    def best(fn) -> float:
+        return min(timeit.repeat(fn, number=1, repeat=args.repeat))
+
+    print(f"{len(texts)} strings, {sum(map(len, texts))} characters")
+    print(f"{'':<32}{'legacy (ms)':>12}{'new (ms)':>12}{'speedup':>10}")
+    report("escape_text per string", best(lambda: [legacy_escape_text(t) for t in texts]),
+           best(lambda: [LatexEscaper.escape_text(t) for t in texts]))
+    report("escape_tree whole portfolio", best(lambda: [legacy_escape_text(t) for t in collect_strings(portfolio)]),
+           best(lambda: LatexEscaper.escape_tree(portfolio)))
+    report("sanitize_text per string", best(lambda: [legacy_sanitize_text(t) for t in texts]),
+           best(lambda: [sanitize_text(t) for t in texts]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark cold pdflatex compiles against compiles with a precompiled preamble format.
+
+Uses the sample preambles in files/user_information.preambles.json, so no database
+is needed. Requires pdflatex and mylatexformat (texlive-latex-extra).
+
+    python -m scripts.benchmark_latex_formats --runs 5
+"""
+
+import argparse
+import json
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from config.settings import PROJECT_ROOT
+import src.generator  # noqa: F401 - must be imported before the compilers to avoid a circular import
+from src.latex.resume.resume_compiler import ResumeLatexCompiler
+from src.latex.cover_letter.cover_letter_compiler import CoverLetterLatexCompiler
+from src.latex.utils import LatexPlaceholder
+from src.latex.utils.format_cache import LatexFormatCache
+
+PREAMBLES_FILE = PROJECT_ROOT / "files" / "user_information.preambles.json"
+
+SAMPLE_RESUME = {
+    'career_summary': "\\section{Summary}\nSoftware engineer with ten years of experience.",
+    'skills': "\\section{Skills}\nPython, LaTeX, MongoDB",
+    'work_experience': "\\section{Experience}\nSenior Engineer at Example Corp.",
+}
+
+SAMPLE_COVER_LETTER = {
+    'NAME': "Jane Doe",
+    'PHONE': "555-0100",
+    'EMAIL': "jane@example.com",
+    'LINKEDIN': "https://linkedin.com/in/janedoe",
+    'GITHUB': "https://github.com/janedoe",
+    'ADDRESS': "Springfield",
+    'COMPANY_NAME': "Example Corp",
+    'JOB_TITLE': "Engineer",
+    'COVER_LETTER_CONTENT': "I am writing to apply for the Engineer position.",
+}
+
+
+def load_preambles() -> dict:
+    with open(PREAMBLES_FILE, encoding='utf-8') as f:
+        return {doc['type']: doc['content'] for doc in json.load(f)}
+
+
+def build_documents() -> dict:
+    preambles = load_preambles()
+    resume_compiler = ResumeLatexCompiler()
+    resume_tex = resume_compiler._generate_tex_content(preambles['resume_preamble'], SAMPLE_RESUME)
+    cover_letter_tex = LatexPlaceholder.replace_placeholders(preambles['cover_letter_preamble'], SAMPLE_COVER_LETTER)
+    # The benchmark has no signature image
+    cover_letter_tex = cover_letter_tex.replace("\\includegraphics[width=1in]{signature.jpg}", "")
+    return {
+        'ResumeLatexCompiler': (resume_compiler, resume_tex),
+        'CoverLetterLatexCompiler': (CoverLetterLatexCompiler(), cover_letter_tex),
+    }
+
+
+def time_compiles(compiler, tex_content: str, runs: int, output_dir: Path) -> list:
+    output_manager = SimpleNamespace(output_dir=output_dir)
+    timings = []
+    for i in range(runs):
+        tex_path = output_dir / f"bench_{i}.tex"
+        start = time.perf_counter()
+        pdf = compiler.compile_pdf(tex_path, tex_content, output_manager)
+        timings.append(time.perf_counter() - start)
+        if not pdf:
+            raise RuntimeError(f"{compiler.__class__.__name__} failed to compile")
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5, help="compiles per mode")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        format_cache = LatexFormatCache(cache_dir=tmp / "formats")
+
+        print(f"{'compiler':<26}{'mode':<8}{'mean (s)':>10}{'min (s)':>10}")
+        for name, (compiler, tex_content) in build_documents().items():
+            # Identical sources would otherwise be served from the PDF cache
+            compiler.pdf_cache = None
+            compiler.format_cache = None
+            cold = time_compiles(compiler, tex_content, args.runs, tmp)
+
+            compiler.format_cache = format_cache
+            start = time.perf_counter()
+            format_cache.prepare(tex_content)
+            build_time = time.perf_counter() - start
+            warm = time_compiles(compiler, tex_content, args.runs, tmp)
+
+            print(f"{name:<26}{'cold':<8}{statistics.mean(cold):>10.3f}{min(cold):>10.3f}")
+            print(f"{name:<26}{'format':<8}{statistics.mean(warm):>10.3f}{min(warm):>10.3f}"
+                  f"   (one-time format build {build_time:.2f}s, speedup x{statistics.mean(cold) / statistics.mean(warm):.1f})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark relevance ranking of long portfolio sections.
+
+Builds synthetic portfolios with many work experience and project entries, a few of
+which are planted to match the job description, and reports for each section the
+prompt tokens sent with and without ranking, the ranking time, and how many planted
+entries made the shortlist (quality proxy: it should always be all of them).
+
+    python -m scripts.benchmark_section_ranking --items 50 100 400 --repeat 5
+"""
+
+import argparse
+import random
+import timeit
+
+from src.generator.relevance_ranker import RelevanceRanker
+from src.generator.utils.prompt_serializer import serialize_section
+from src.llms.rate_limiter import estimate_tokens
+
+FILLER = ["managed", "stakeholders", "quarterly", "reporting", "migrated", "legacy", "systems", "improved",
+          "processes", "coordinated", "vendors", "budget", "documentation", "onboarding", "customers",
+          "meetings", "spreadsheets", "inventory", "logistics", "marketing", "campaigns", "sales"]
+RELEVANT = ["Python", "Kubernetes", "PostgreSQL", "FastAPI", "latency", "distributed", "microservices",
+            "AWS", "Terraform", "observability"]
+
+JOB_DESCRIPTION = (
+    "We are hiring a backend engineer to build distributed microservices in Python with FastAPI. "
+    "You will run services on Kubernetes in AWS, manage infrastructure with Terraform, tune "
+    "PostgreSQL, and own observability and latency for high-traffic APIs."
+)
+
+
+def sentence(rng: random.Random, words, length: int) -> str:
+    return " ".join(rng.choice(words) for _ in range(length))
+
+
+def build_section(section: str, items: int, planted: int, seed: int = 0) -> tuple:
+    rng = random.Random(seed)
+    relevant_positions = set(rng.sample(range(items), planted))
+    entries = []
+    for i in range(items):
+        words = FILLER + RELEVANT if i in relevant_positions else FILLER
+        bullets = [sentence(rng, words, 18) for _ in range(6)]
+        if section == 'work_experience':
+            entries.append({'job_title': f"Role {i}", 'company': f"Company {i}", 'location': "Remote",
+                            'time': "2018 -- 2020", 'responsibilities': bullets})
+        else:
+            entries.append({'name': f"Project {i}", 'technologies': sentence(rng, words, 3),
+                            'date': "2021", 'bullet_points': bullets})
+    return entries, relevant_positions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--items', type=int, nargs='+', default=[50, 100, 400], help="entries per section")
+    parser.add_argument('--planted', type=int, default=4, help="entries matching the job description")
+    parser.add_argument('--repeat', type=int, default=5, help="timing repetitions, best is reported")
+    args = parser.parse_args()
+
+    ranker = RelevanceRanker()
+    print(f"{'section':<18}{'items':>7}{'tokens before':>15}{'tokens after':>14}{'saved':>8}"
+          f"{'rank (ms)':>11}{'planted kept':>14}")
+    for section in ('work_experience', 'projects'):
+        for items in args.items:
+            entries, planted = build_section(section, items, args.planted)
+            for i in planted:
+                entries[i]['_planted'] = True
+            ranked = ranker.select(section, entries, JOB_DESCRIPTION)
+            kept = sum(1 for entry in ranked if entry.get('_planted'))
+
+            before = estimate_tokens(serialize_section(section, entries))
+            after = estimate_tokens(serialize_section(section, ranked))
+            seconds = min(timeit.repeat(lambda: ranker.select(section, entries, JOB_DESCRIPTION),
+                                        number=1, repeat=args.repeat))
+            print(f"{section:<18}{items:>7}{before:>15}{after:>14}{1 - after / before:>8.0%}"
+                  f"{seconds * 1000:>11.2f}{f'{kept}/{len(planted)}':>14}")
+
+
+if __name__ == '__main__':
+    main()
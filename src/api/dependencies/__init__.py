@@ -6,5 +6,6 @@ __all__ = [
     'get_cover_letter_service',
     'get_portfolio_service',
     'get_preferences_service',
-    'get_application_service'
+    'get_application_service',
+    'get_job_service'
 ] 
\ No newline at end of file
@@ -3,48 +3,71 @@ Service dependencies for FastAPI endpoints.
 """
 
 from typing import Generator, AsyncGenerator
+from fastapi import Depends
 from src.api.services.resume_service import ResumeService
 from src.api.services.cover_letter_service import CoverLetterService
 from src.api.services.portfolio_service import PortfolioService
 from src.api.services.preferences_service import PreferencesService
 from src.api.services.auth_service import AuthService
+from src.api.services.job_service import JobService
 from src.core.database.factory import get_async_unit_of_work
+from src.core.database.unit_of_work import AsyncMongoUnitOfWork
 
-async def get_auth_service() -> AsyncGenerator[AuthService, None]:
+async def get_auth_service(
+    uow: AsyncMongoUnitOfWork = Depends(get_async_unit_of_work)
+) -> AsyncGenerator[AuthService, None]:
     """Get auth service instance."""
-    service = AuthService()
+    service = AuthService(uow)
     try:
         yield service
     finally:
         pass
 
-async def get_resume_service() -> AsyncGenerator[ResumeService, None]:
+async def get_resume_service(
+    uow: AsyncMongoUnitOfWork = Depends(get_async_unit_of_work)
+) -> AsyncGenerator[ResumeService, None]:
     """Get resume service instance."""
-    service = ResumeService()
+    service = ResumeService(uow)
     try:
         yield service
     finally:
         pass
 
-async def get_cover_letter_service() -> AsyncGenerator[CoverLetterService, None]:
+async def get_cover_letter_service(
+    uow: AsyncMongoUnitOfWork = Depends(get_async_unit_of_work)
+) -> AsyncGenerator[CoverLetterService, None]:
     """Get cover letter service instance."""
-    service = CoverLetterService()
+    service = CoverLetterService(uow)
     try:
         yield service
     finally:
         pass
 
-async def get_portfolio_service() -> AsyncGenerator[PortfolioService, None]:
+async def get_portfolio_service(
+    uow: AsyncMongoUnitOfWork = Depends(get_async_unit_of_work)
+) -> AsyncGenerator[PortfolioService, None]:
     """Get portfolio service instance."""
-    service = PortfolioService()
+    service = PortfolioService(uow)
     try:
         yield service
     finally:
         pass
 
-async def get_preferences_service() -> AsyncGenerator[PreferencesService, None]:
+async def get_preferences_service(
+    uow: AsyncMongoUnitOfWork = Depends(get_async_unit_of_work)
+) -> AsyncGenerator[PreferencesService, None]:
     """Get preferences service instance."""
-    service = PreferencesService()
+    service = PreferencesService(uow)
+    try:
+        yield service
+    finally:
+        pass
+
+async def get_job_service(
+    uow: AsyncMongoUnitOfWork = Depends(get_async_unit_of_work)
+) -> AsyncGenerator[JobService, None]:
+    """Get generation job service instance."""
+    service = JobService(uow)
     try:
         yield service
     finally:
@@ -52,5 +75,5 @@ async def get_preferences_service() -> AsyncGenerator[PreferencesService, None]:
 
 async def get_uow():
     """Get async unit of work instance."""
-    async with get_async_unit_of_work() as uow:
+    async for uow in get_async_unit_of_work():
         yield uow
@@ -8,8 +8,9 @@ import sys
 from pathlib import Path
 from typing import Dict
 
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 # Add project root to Python path
 project_root = Path(__file__).parent.parent.parent
@@ -20,9 +21,18 @@ from src.api.routers import (
     resumes_router,
     cover_letters_router,
     portfolio_router,
-    preferences_router
+    preferences_router,
+    jobs_router
 )
 from src.api.middleware.auth import verify_token
+from src.api.services.execution import ServiceBusyError, get_executor_stats
+from src.core.database.factory import get_connection_stats, close_database_connections
+from src.llms.client_registry import ProviderClientRegistry
+from src.llms.rate_limiter import get_rate_limiter
+from src.llms.resilience import get_circuit_breaker_stats
+from src.llms.utils.usage import PromptCacheStats
+from src.worker import GenerationWorker
+from config.job_config import JobConfig
 from config.settings import settings
 
 
@@ -87,6 +97,12 @@ def create_app() -> FastAPI:
         tags=["preferences"],
         dependencies=[Depends(verify_token)]
     )
+    app.include_router(
+        jobs_router,
+        prefix=f"{settings.api_v1_prefix}/jobs",
+        tags=["jobs"],
+        dependencies=[Depends(verify_token)]
+    )
     app.include_router(
         portfolio_router,
         prefix=f"{settings.api_v1_prefix}/portfolio",
@@ -94,8 +110,62 @@ def create_app() -> FastAPI:
         dependencies=[Depends(verify_token)]
     )
 
+    @app.exception_handler(ServiceBusyError)
+    async def service_busy_handler(request: Request, exc: ServiceBusyError):
+        return JSONResponse(
+            status_code=429,
+            content={"detail": str(exc)},
+            headers={"Retry-After": str(exc.retry_after)}
+        )
+
     @app.get("/")
     async def root():
         return {"message": "Resume Builder API"}
 
+    @app.get("/metrics/database")
+    async def database_metrics():
+        return get_connection_stats()
+
+    @app.get("/metrics/executors")
+    async def executor_metrics():
+        return get_executor_stats()
+
+    @app.get("/metrics/llm-clients")
+    async def llm_client_metrics():
+        return ProviderClientRegistry.get_stats()
+
+    @app.get("/metrics/llm-circuits")
+    async def llm_circuit_metrics():
+        return get_circuit_breaker_stats()
+
+    @app.get("/metrics/llm-rate-limits")
+    async def llm_rate_limit_metrics():
+        return get_rate_limiter().get_stats()
+
+    @app.get("/metrics/llm-prompt-cache")
+    async def llm_prompt_cache_metrics():
+        return PromptCacheStats.get_stats()
+
+    @app.on_event("startup")
+    def start_generation_worker():
+        # dispatch_job only starts new jobs; this loop also picks up retried jobs, jobs whose
+        # lease expired and jobs queued before a restart
+        app.state.generation_worker = None
+        if JobConfig.get_generation_job_config().dispatch == "thread":
+            app.state.generation_worker = GenerationWorker(concurrency=1)
+            app.state.generation_worker.start()
+
+    @app.on_event("shutdown")
+    def stop_generation_worker():
+        if app.state.generation_worker:
+            app.state.generation_worker.stop()
+
+    @app.on_event("shutdown")
+    def shutdown_database():
+        close_database_connections()
+
+    @app.on_event("shutdown")
+    def shutdown_llm_clients():
+        ProviderClientRegistry.close_all()
+
     return app
\ No newline at end of file
@@ -1,12 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from typing import Dict, Optional, List
 from ..schemas.cover_letter import (
     CoverLetterRequest,
     CoverLetterResponse,
     CoverLetterGenerationOptions
 )
-from ..dependencies.services import get_cover_letter_service
+from ..schemas.job import JobAccepted
+from ..dependencies.services import get_cover_letter_service, get_job_service
 from ..services.cover_letter_service import CoverLetterService
+from ..services.job_service import JobService
+from ..services.execution import ServiceBusyError
+from src.generator.generator_manager import GenerationType
+from config.settings import settings
 from ..middleware.auth import verify_token
 
 router = APIRouter()
@@ -23,12 +28,40 @@ async def generate_cover_letter(
         cover_letter = await cover_letter_service.generate_cover_letter(
             user_id=user_id,
             job_description=request.job_description,
-            company_name=request.company_name,
-            job_title=request.job_title,
             resume_id=request.resume_id,
             options=options.dict() if options else None
         )
         return cover_letter
+    except ServiceBusyError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+@router.post("/jobs", response_model=JobAccepted, status_code=status.HTTP_202_ACCEPTED)
+async def submit_cover_letter_job(
+    request: CoverLetterRequest,
+    response: Response,
+    options: Optional[CoverLetterGenerationOptions] = None,
+    job_service: JobService = Depends(get_job_service),
+    user_payload: Dict = Depends(verify_token)
+):
+    """Queue cover letter generation and return immediately; poll the job for progress."""
+    try:
+        user_id = user_payload["sub"]
+        job_options = options.model_dump(exclude_unset=True) if options else {}
+        job_options['resume_id'] = request.resume_id
+        job = await job_service.submit_job(
+            user_id=user_id,
+            generation_type=GenerationType.COVER_LETTER,
+            job_description=request.job_description,
+            options=job_options
+        )
+        status_url = f"{settings.api_v1_prefix}/jobs/{job.id}"
+        response.headers["Location"] = status_url
+        return JobAccepted(job_id=job.id, status=job.status, status_url=status_url)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -0,0 +1,107 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import StreamingResponse
+from typing import Dict, List, Optional
+from ..schemas.job import BatchAccepted, BatchJobRequest, JobAccepted, JobStatusResponse
+from ..dependencies.services import get_job_service
+from ..services.job_service import JobService
+from ..middleware.auth import verify_token
+from src.generator.generator_manager import GenerationType
+from config.settings import settings
+
+router = APIRouter()
+
+@router.get("/", response_model=List[JobStatusResponse])
+async def list_jobs(
+    job_service: JobService = Depends(get_job_service),
+    user_payload: Dict = Depends(verify_token)
+):
+    try:
+        user_id = user_payload["sub"]
+        return await job_service.list_jobs(user_id)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+@router.post("/batch", response_model=BatchAccepted, status_code=status.HTTP_202_ACCEPTED)
+async def submit_batch(
+    request: BatchJobRequest,
+    job_service: JobService = Depends(get_job_service),
+    user_payload: Dict = Depends(verify_token)
+):
+    """Queue a job for every distinct job description; repeated postings are skipped."""
+    try:
+        user_id = user_payload["sub"]
+        jobs, duplicates = await job_service.submit_batch(
+            user_id=user_id,
+            generation_type=GenerationType(request.job_type),
+            job_descriptions=request.job_descriptions,
+            options=request.options.model_dump(exclude_unset=True) if request.options else None
+        )
+        return BatchAccepted(
+            jobs=[JobAccepted(job_id=job.id, status=job.status,
+                              status_url=f"{settings.api_v1_prefix}/jobs/{job.id}") for job in jobs],
+            duplicates=duplicates
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+@router.get("/{job_id}", response_model=JobStatusResponse)
+async def get_job(
+    job_id: str,
+    job_service: JobService = Depends(get_job_service),
+    user_payload: Dict = Depends(verify_token)
+):
+    try:
+        user_id = user_payload["sub"]
+        job = await job_service.get_job(user_id, job_id)
+        if not job:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Job not found"
+            )
+        return job
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+@router.get("/{job_id}/events")
+async def stream_job_events(
+    job_id: str,
+    last_event_id: Optional[str] = Header(None),
+    job_service: JobService = Depends(get_job_service),
+    user_payload: Dict = Depends(verify_token)
+):
+    """
+    Stream job progress as Server-Sent Events.
+
+    Emits ``progress`` events with the generator's (message, progress), a ``section``
+    event with the LaTeX of each finished resume section, and a final ``done`` (with
+    the resume id) or ``error`` event.
+    """
+    try:
+        user_id = user_payload["sub"]
+        job = await job_service.get_job(user_id, job_id)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    return StreamingResponse(
+        job_service.stream_events(job_id, last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -1,12 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from typing import Dict, Any, Optional, List
 from ..schemas.resume import (
     ResumeRequest,
     ResumeResponse,
     ResumeGenerationOptions
 )
-from ..dependencies.services import get_resume_service
+from ..schemas.job import JobAccepted
+from ..dependencies.services import get_resume_service, get_job_service
 from ..services.resume_service import ResumeService
+from ..services.job_service import JobService
+from ..services.execution import ServiceBusyError
+from src.generator.generator_manager import GenerationType
+from config.settings import settings
 from ..middleware.auth import verify_token
 
 router = APIRouter()
@@ -26,6 +31,52 @@ async def generate_resume(
             options=options.model_dump() if options else None
         )
         return resume
+    except ServiceBusyError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+@router.post("/jobs", response_model=JobAccepted, status_code=status.HTTP_202_ACCEPTED)
+async def submit_resume_job(
+    request: ResumeRequest,
+    response: Response,
+    options: Optional[ResumeGenerationOptions] = None,
+    job_service: JobService = Depends(get_job_service),
+    user_payload: Dict = Depends(verify_token)
+):
+    """Queue resume generation and return immediately; poll the job for progress."""
+    try:
+        user_id = user_payload["sub"]
+        job = await job_service.submit_job(
+            user_id=user_id,
+            generation_type=GenerationType.RESUME,
+            job_description=request.job_description,
+            options=options.model_dump(exclude_unset=True) if options else None
+        )
+        status_url = f"{settings.api_v1_prefix}/jobs/{job.id}"
+        response.headers["Location"] = status_url
+        return JobAccepted(job_id=job.id, status=job.status, status_url=status_url)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+@router.post("/runs/{run_id}/resume", response_model=ResumeResponse)
+async def resume_generation_run(
+    run_id: str,
+    resume_service: ResumeService = Depends(get_resume_service),
+    user_payload: Dict = Depends(verify_token)
+):
+    """Continue a failed generation run; sections, compile, save and cover letter already done are skipped."""
+    try:
+        user_id = user_payload["sub"]
+        return await resume_service.resume_run(user_id, run_id)
+    except ServiceBusyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
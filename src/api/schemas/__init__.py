@@ -3,6 +3,7 @@ from .cover_letter import *
 from .portfolio import *
 from .application import *
 from .user import *
+from .job import *
 
 __all__ = [
     # Resume schemas
@@ -36,5 +37,11 @@ __all__ = [
     'UserLogin',
     'UserResponse',
     'UserPreferencesUpdate',
-    'UserUpdate'
+    'UserUpdate',
+
+    # Job schemas
+    'JobAccepted',
+    'JobStatusResponse',
+    'BatchJobRequest',
+    'BatchAccepted'
 ] 
\ No newline at end of file
@@ -19,9 +19,9 @@ class CoverLetterGenerationOptions(BaseModel):
 class CoverLetterResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True, protected_namespaces=())
 
-    id: str
-    company_name: str
-    job_title: str
+    id: str  # Cover letters are stored on their resume, so this is the resume id
+    company_name: Optional[str] = None
+    job_title: Optional[str] = None
     content: str
     pdf_url: Optional[str]
     resume_id: Optional[str]
@@ -0,0 +1,34 @@
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Literal, Optional
+from datetime import datetime
+from .resume import ResumeGenerationOptions
+
+class JobAccepted(BaseModel):
+    job_id: str
+    status: str
+    status_url: str
+
+class JobStatusResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    job_type: str
+    status: str
+    progress: float
+    message: str
+    resume_id: Optional[str] = None
+    error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+class BatchJobRequest(BaseModel):
+    """Many job descriptions to generate for with the same options"""
+    job_descriptions: List[str] = Field(..., min_length=1, max_length=500)
+    job_type: Literal["resume", "cover_letter", "both"] = "resume"
+    options: Optional[ResumeGenerationOptions] = None
+
+class BatchAccepted(BaseModel):
+    jobs: List[JobAccepted]
+    duplicates: int
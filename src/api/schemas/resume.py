@@ -1,8 +1,8 @@
 """Resume schemas module."""
 
-from typing import Optional
+from typing import Dict, List, Optional
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 
 class ResumeBase(BaseModel):
     """Base resume schema."""
@@ -67,4 +67,35 @@ class Resume(ResumeBase):
         """Pydantic config."""
         from_attributes = True
         populate_by_name = True
-        arbitrary_types_allowed = True
\ No newline at end of file
+        arbitrary_types_allowed = True
+
+class ResumeRequest(BaseModel):
+    """Resume generation request schema."""
+    job_description: str
+
+class ResumeGenerationOptions(BaseModel):
+    """Resume generation options; unset fields fall back to the user's preferences."""
+    model_config = ConfigDict(protected_namespaces=())
+
+    model_type: Optional[str] = None
+    model_name: Optional[str] = None
+    temperature: Optional[float] = None
+    selected_sections: Optional[Dict[str, str]] = None
+    use_cache: Optional[bool] = None
+    base_resume_id: Optional[str] = None  # Only regenerate the sections that changed since this resume
+    latency_budget: Optional[float] = None  # Seconds; AI sections still running then are hardcoded
+
+class ResumeResponse(BaseModel):
+    """Resume response schema."""
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True, protected_namespaces=())
+
+    id: Optional[str] = Field(None, alias="_id")
+    user_id: str
+    title: str = "My Resume"
+    version: int = 1
+    model_type: Optional[str] = None
+    model_name: Optional[str] = None
+    temperature: Optional[float] = None
+    fallback_sections: List[str] = []
+    created_at: datetime
+    updated_at: datetime
@@ -7,9 +7,9 @@ from passlib.context import CryptContext
 import logging
 
 from ..schemas.user import UserCreate, UserLogin, UserResponse, UserUpdate
-from src.core.database.factory import get_unit_of_work
+from src.core.database.factory import create_async_unit_of_work
 from src.core.database.models.user import User, UserPreferences
-from src.core.database.unit_of_work.mongo_unit_of_work import MongoUnitOfWork
+from src.core.database.unit_of_work.mongo_unit_of_work import AsyncMongoUnitOfWork
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -18,9 +18,9 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 class AuthService:
     """Service for handling authentication related operations."""
     
-    def __init__(self):
+    def __init__(self, uow: Optional[AsyncMongoUnitOfWork] = None):
         """Initialize AuthService."""
-        self.uow = get_unit_of_work()
+        self.uow = uow or create_async_unit_of_work()
         self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
         self.secret_key = settings.jwt_secret_key
         self.algorithm = settings.jwt_algorithm
@@ -37,14 +37,14 @@ class AuthService:
     async def create_user(self, user_data: UserCreate) -> UserResponse:
         """Create new user."""
         try:
-            with self.uow:
+            async with self.uow:
                 # Check if user exists
-                existing_user = self.uow.users.get_by_email(user_data.email)
+                existing_user = await self.uow.users.get_by_email(user_data.email)
                 if existing_user:
                     raise ValueError("User with this email already exists")
 
                 # Check if user_id is taken
-                existing_user = self.uow.users.get_by_user_id(user_data.user_id)
+                existing_user = await self.uow.users.get_by_user_id(user_data.user_id)
                 if existing_user:
                     raise ValueError("This user ID is already taken")
 
@@ -73,8 +73,8 @@ class AuthService:
                     verification_token=None
                 )
                 
-                created_user = self.uow.users.add(user)
-                self.uow.commit()
+                created_user = await self.uow.users.add(user)
+                await self.uow.commit()
                 
                 return UserResponse.model_validate(created_user)
                 
@@ -85,8 +85,8 @@ class AuthService:
     async def login_user(self, credentials: UserLogin) -> str:
         """Login user and return JWT token."""
         try:
-            with self.uow:
-                user = self.uow.users.get_by_email(credentials.email)
+            async with self.uow:
+                user = await self.uow.users.get_by_email(credentials.email)
                 if not user:
                     logger.error(f"User not found with email: {credentials.email}")
                     raise ValueError("Invalid credentials")
@@ -97,8 +97,8 @@ class AuthService:
 
                 # Update last login
                 user.last_login = datetime.now(timezone.utc)
-                self.uow.users.update(user)
-                self.uow.commit()
+                await self.uow.users.update(user)
+                await self.uow.commit()
 
                 # Generate JWT token
                 token_data = {
@@ -119,8 +119,8 @@ class AuthService:
     async def update_user(self, user_id: str, user_data: UserUpdate) -> UserResponse:
         """Update user information."""
         try:
-            with self.uow:
-                user = self.uow.users.get_by_id(user_id)
+            async with self.uow:
+                user = await self.uow.users.get_by_id(user_id)
                 if not user:
                     raise ValueError("User not found")
                 
@@ -135,8 +135,8 @@ class AuthService:
                         user.preferences = user_data.preferences
                 
                 user.updated_at = datetime.now(timezone.utc)
-                self.uow.users.update(user)
-                self.uow.commit()
+                await self.uow.users.update(user)
+                await self.uow.commit()
                 
                 return UserResponse.model_validate(user)
                 
@@ -144,7 +144,7 @@ class AuthService:
             logger.error(f"Error updating user: {str(e)}")
             raise
 
-    async def authenticate_user(self, uow: MongoUnitOfWork, email: str, password: str) -> Optional[User]:
+    async def authenticate_user(self, uow: AsyncMongoUnitOfWork, email: str, password: str) -> Optional[User]:
         try:
             user = await uow.users.get_by_email(email)
             if not user:
@@ -166,7 +166,7 @@ class AuthService:
         encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
         return encoded_jwt
 
-    async def get_current_user(self, uow: MongoUnitOfWork, token: str) -> Optional[User]:
+    async def get_current_user(self, uow: AsyncMongoUnitOfWork, token: str) -> Optional[User]:
         try:
             payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
             user_id: str = payload.get("sub")
@@ -182,5 +182,5 @@ class AuthService:
             return None
 
     async def get_user_by_id(self, user_id: str):
-        with self.uow:
-            return self.uow.users.get_by_user_id(user_id)
\ No newline at end of file
+        async with self.uow:
+            return await self.uow.users.get_by_user_id(user_id)
\ No newline at end of file
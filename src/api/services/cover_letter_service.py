@@ -1,15 +1,16 @@
-from typing import Optional, List
-from datetime import datetime
-from src.core.database.factory import get_unit_of_work
-from src.generator.cover_letter_generator import CoverLetterGenerator
-from src.llms.runner import LLMRunner
-from src.loaders.prompt_loader import PromptLoader
+from typing import Any, Dict, Optional, List
+from src.core.database.factory import create_async_unit_of_work
+from src.core.database.models import Resume
+from src.core.database.unit_of_work import AsyncMongoUnitOfWork
+from src.generator.generator_manager import GenerationType, GeneratorManager
 from src.generator.utils.job_info import JobInfo
 from src.generator.utils.output_manager import OutputManager
+from ..schemas.cover_letter import CoverLetterResponse
+from .execution import ServiceBusyError, run_generation
 
 class CoverLetterService:
-    def __init__(self):
-        self.uow = get_unit_of_work()
+    def __init__(self, uow: Optional[AsyncMongoUnitOfWork] = None):
+        self.uow = uow or create_async_unit_of_work()
 
     async def generate_cover_letter(
         self,
@@ -17,51 +18,85 @@ class CoverLetterService:
         job_description: str,
         resume_id: Optional[str] = None,
         options: Optional[dict] = None
-    ):
+    ) -> CoverLetterResponse:
         try:
-            # Initialize LLM runner with user preferences
-            with self.uow:
-                user = self.uow.users.get_by_user_id(user_id)
-                llm_preferences = user.llm_preferences
+            # Load user preferences and the target resume without blocking the event loop
+            async with self.uow:
+                user = await self.uow.users.get_by_user_id(user_id)
+                if not resume_id:
+                    resume_id = await self.uow.get_last_resume_id(user_id)
+            if not resume_id:
+                raise ValueError("No resume found. Please generate a resume first or select an existing one.")
 
             # Update preferences with options if provided
-            if options:
-                llm_preferences.update(options)
+            llm_preferences = user.preferences.llm_preferences.model_dump() if user and user.preferences else {}
+            options = {k: v for k, v in (options or {}).items() if v is not None}
+            llm_preferences.update({k: options[k] for k in ('model_type', 'model_name', 'temperature') if k in options})
 
-            llm_runner = LLMRunner.from_preferences(llm_preferences)
-            
-            # Initialize cover letter generator
-            cover_letter_generator = CoverLetterGenerator(llm_runner, user_id)
-            
-            # Extract job info using LLM
-            prompt_loader = PromptLoader(user_id)
-            job_info = JobInfo.extract_from_description(
-                job_description=job_description,
-                llm_runner=llm_runner
-            )
-            
-            # Create output manager
-            output_manager = OutputManager(job_info)
+            # LLM calls and the PDF compile block, so they run on the bounded executors
+            job_info = await run_generation(self._generate_cover_letter, user_id, job_description, resume_id,
+                                            llm_preferences)
 
-            # Generate cover letter
-            cover_letter = await cover_letter_generator.generate_cover_letter(
-                job_description=job_description,
-                resume_id=resume_id,
-                output_manager=output_manager
-            )
-
-            return cover_letter
+            # The cover letter is stored on its resume
+            async with self.uow:
+                resume = await self.uow.resumes.get_by_id(resume_id)
+            if not resume or not resume.cover_letter_content:
+                raise ValueError(f"Cover letter was not saved on resume {resume_id}")
+            return self._to_response(resume, job_info)
 
+        except ServiceBusyError:
+            raise
         except Exception as e:
             raise Exception(f"Failed to generate cover letter: {str(e)}")
 
-    async def get_cover_letter(self, user_id: str, cover_letter_id: str):
-        with self.uow:
-            cover_letter = self.uow.cover_letters.get_by_id(cover_letter_id)
-            if cover_letter and cover_letter.user_id == user_id:
-                return cover_letter
-            return None
+    @staticmethod
+    def _generate_cover_letter(user_id: str, job_description: str, resume_id: str,
+                               llm_preferences: Dict[str, Any]) -> JobInfo:
+        manager = GeneratorManager(user_id)
+        manager.configure_llm(
+            model_type=llm_preferences.get('model_type'),
+            model_name=llm_preferences.get('model_name'),
+            temperature=llm_preferences.get('temperature')
+        )
+
+        # Extract job info using LLM
+        job_info = JobInfo.extract_from_description(job_description, manager.llm_runner)
+        output_manager = OutputManager(job_info)
+
+        for _ in manager.generate(
+            generation_type=GenerationType.COVER_LETTER,
+            job_description=job_description,
+            selected_sections={},
+            output_manager=output_manager,
+            resume_id=resume_id
+        ):
+            pass
+        return job_info
+
+    @staticmethod
+    def _to_response(resume: Resume, job_info: Optional[JobInfo] = None) -> CoverLetterResponse:
+        return CoverLetterResponse(
+            id=resume.id,
+            company_name=job_info.company_name if job_info else None,
+            job_title=job_info.job_title if job_info else None,
+            content=resume.cover_letter_content,
+            pdf_url=None,
+            resume_id=resume.id,
+            model_type=resume.model_type,
+            model_name=resume.model_name,
+            temperature=resume.temperature,
+            created_at=resume.created_at,
+            updated_at=resume.updated_at
+        )
+
+    async def get_cover_letter(self, user_id: str, cover_letter_id: str) -> Optional[CoverLetterResponse]:
+        async with self.uow:
+            resume = await self.uow.resumes.get_by_id(cover_letter_id)
+        if resume and resume.user_id == user_id and resume.cover_letter_content:
+            return self._to_response(resume)
+        return None
 
-    async def list_cover_letters(self, user_id: str) -> List:
-        with self.uow:
-            return self.uow.cover_letters.get_all_by_user(user_id) 
\ No newline at end of file
+    async def list_cover_letters(self, user_id: str) -> List[CoverLetterResponse]:
+        async with self.uow:
+            resumes = await self.uow.resumes.get_cover_letters(user_id)
+        return [self._to_response(resume) for resume in resumes]
@@ -0,0 +1,135 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+import logging
+
+from config.executor_config import ExecutorConfig
+from config.latex_config import LatexCompileConfig
+from src.latex.compile_service import get_compile_service
+from src.latex.utils.errors import CompileQueueFullError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class ServiceBusyError(Exception):
+    """Raised when an executor cannot accept more work; maps to HTTP 429."""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class BoundedExecutor:
+    """
+    Thread pool for blocking work started from async request handlers.
+
+    At most ``max_workers`` calls run at once and at most ``max_queue`` more wait for
+    a thread; beyond that ``run`` fails fast with ServiceBusyError instead of queueing
+    without limit, so the event loop and the process stay responsive under load.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int, retry_after: int):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.retry_after = retry_after
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"api-{name}")
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._pending = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run ``fn(*args, **kwargs)`` on the pool and await its result.
+
+        Raises:
+            ServiceBusyError: If all workers are busy and the queue is full
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            logger.warning(f"{self.name} executor is full ({self.max_workers + self.max_queue} jobs), rejecting")
+            raise ServiceBusyError(f"Too many {self.name} requests in progress, try again later",
+                                   self.retry_after)
+
+        with self._lock:
+            self._pending += 1
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except Exception:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        # A cancelled request stops waiting, but the thread still finishes the call
+        return await asyncio.wrap_future(future)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get worker, queue and rejection counts."""
+        return {
+            'max_workers': self.max_workers,
+            'max_queue': self.max_queue,
+            'pending': self._pending,
+            'rejected': self._rejected
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work and shut the pool down."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _release(self) -> None:
+        with self._lock:
+            self._pending -= 1
+        self._slots.release()
+
+
+_llm_executor: Optional[BoundedExecutor] = None
+_llm_executor_lock = threading.Lock()
+
+
+def get_llm_executor() -> BoundedExecutor:
+    """Get the process-wide executor for blocking LLM work."""
+    global _llm_executor
+    if _llm_executor is None:
+        with _llm_executor_lock:
+            if _llm_executor is None:
+                config = ExecutorConfig.get_llm_executor_config()
+                _llm_executor = BoundedExecutor("llm", config.max_workers, config.max_queue,
+                                                config.retry_after_seconds)
+    return _llm_executor
+
+
+async def run_generation(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking generation (LLM calls followed by a LaTeX compile) off the event loop.
+
+    The LLM part runs on the LLM executor; the compile goes to the bounded LaTeX compile
+    service. Requests are refused up front while the compile queue is full, so no LLM
+    tokens are spent on a document that could not be compiled.
+
+    Raises:
+        ServiceBusyError: If either the LLM executor or the LaTeX compile queue is full
+    """
+    latex_retry_after = LatexCompileConfig.get_worker_config().retry_after_seconds
+    if get_compile_service().is_full:
+        raise ServiceBusyError("Too many LaTeX compilations in progress, try again later", latex_retry_after)
+    try:
+        return await get_llm_executor().run(fn, *args, **kwargs)
+    except CompileQueueFullError as e:
+        raise ServiceBusyError(str(e), latex_retry_after) from e
+
+
+def get_executor_stats() -> Dict[str, Dict[str, int]]:
+    """Get load statistics for the LLM executor and the LaTeX compile service."""
+    compile_service = get_compile_service()
+    return {
+        'llm': get_llm_executor().get_stats(),
+        'latex': {
+            'max_workers': compile_service.max_workers,
+            'max_queue': compile_service.max_queue,
+            'pending': compile_service.pending
+        }
+    }
@@ -0,0 +1,125 @@
+import asyncio
+import json
+import time
+from typing import Optional, Dict, List, AsyncIterator, Tuple
+from config.job_config import JobConfig
+from src.core.database.factory import create_async_unit_of_work
+from src.core.database.unit_of_work import AsyncMongoUnitOfWork
+from src.core.database.models import GenerationJob, JobStatus
+from src.generator.batch import BatchItem, dedupe
+from src.generator.generator_manager import GenerationType
+from src.generator.job_runner import GenerationJobRunner, dispatch_job
+
+class JobService:
+    def __init__(self, uow: Optional[AsyncMongoUnitOfWork] = None):
+        self.uow = uow or create_async_unit_of_work()
+
+    async def submit_job(
+        self,
+        user_id: str,
+        generation_type: GenerationType,
+        job_description: str,
+        options: Optional[Dict] = None
+    ) -> GenerationJob:
+        """Persist a generation job and start it in the background, or leave it to the workers."""
+        job = GenerationJobRunner.build_job(user_id, generation_type, job_description, options)
+        async with self.uow:
+            job = await self.uow.jobs.add(job)
+        if JobConfig.get_generation_job_config().dispatch == "thread":
+            dispatch_job(job.id)
+        return job
+
+    async def submit_batch(
+        self,
+        user_id: str,
+        generation_type: GenerationType,
+        job_descriptions: List[str],
+        options: Optional[Dict] = None
+    ) -> Tuple[List[GenerationJob], int]:
+        """
+        Queue one job per distinct job description.
+
+        Returns:
+            Tuple[List[GenerationJob], int]: The queued jobs, in input order, and the
+            number of repeated postings that were skipped
+        """
+        unique, duplicates = dedupe([BatchItem(str(i), text) for i, text in enumerate(job_descriptions)])
+        jobs = [GenerationJobRunner.build_job(user_id, generation_type, item.job_description, options)
+                for item in unique]
+        async with self.uow:
+            jobs = [await self.uow.jobs.add(job) for job in jobs]
+        if JobConfig.get_generation_job_config().dispatch == "thread":
+            for job in jobs:
+                dispatch_job(job.id)
+        return jobs, len(duplicates)
+
+    async def get_job(self, user_id: str, job_id: str) -> Optional[GenerationJob]:
+        async with self.uow:
+            job = await self.uow.jobs.get_by_id(job_id)
+            if job and job.user_id == user_id:
+                return job
+            return None
+
+    async def list_jobs(self, user_id: str) -> List[GenerationJob]:
+        async with self.uow:
+            return await self.uow.jobs.get_all_by_user(user_id)
+
+    async def stream_events(self, job_id: str, last_event_id: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        Stream a job's events as Server-Sent Events until it finishes.
+
+        Events already delivered (up to ``last_event_id``, e.g. from the Last-Event-ID
+        header of a reconnecting client) are skipped. The job itself is checked every
+        few polls, so the stream also ends when the job finished without a final event
+        (e.g. the events expired) or no longer exists.
+        """
+        config = JobConfig.get_generation_job_config()
+        last_sent = time.monotonic()
+        polls = 0
+        while True:
+            check_job = polls % _JOB_CHECK_POLLS == _JOB_CHECK_POLLS - 1
+            polls += 1
+            if check_job:
+                # Read the job before its events, so no event written before it finished is missed
+                async with self.uow:
+                    job = await self.uow.jobs.get_by_id(job_id)
+
+            async with self.uow:
+                events = await self.uow.jobs.get_events(job_id, last_event_id)
+            for event in events:
+                last_event_id = event['id']
+                yield _format_event(event['type'], event['data'], event['id'])
+                if event['type'] in ('done', 'error'):
+                    return
+            final_event = _final_event(job) if check_job else None
+            if final_event:
+                yield final_event
+                return
+
+            if events:
+                last_sent = time.monotonic()
+            elif time.monotonic() - last_sent > 15:
+                # Comment line keeps proxies from closing an idle stream
+                yield ": keep-alive\n\n"
+                last_sent = time.monotonic()
+            await asyncio.sleep(config.event_poll_interval)
+
+
+# The event stream re-reads its job every this many polls
+_JOB_CHECK_POLLS = 8
+
+
+def _final_event(job: Optional[GenerationJob]) -> Optional[str]:
+    """Closing event for a job that is gone or finished, in place of its missing done / error event."""
+    if not job:
+        return _format_event('error', {'error': "Job not found"})
+    if job.status == JobStatus.SUCCEEDED:
+        return _format_event('done', {'resume_id': job.resume_id, 'message': job.message})
+    if job.status == JobStatus.FAILED:
+        return _format_event('error', {'error': job.error})
+    return None
+
+
+def _format_event(event_type: str, data: Dict, event_id: Optional[str] = None) -> str:
+    id_line = f"id: {event_id}\n" if event_id else ""
+    return f"{id_line}event: {event_type}\ndata: {json.dumps(data, default=str)}\n\n"
@@ -1,21 +1,22 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import datetime
-from src.core.database.factory import get_unit_of_work
+from src.core.database.factory import create_async_unit_of_work
+from src.core.database.unit_of_work import AsyncMongoUnitOfWork
 
 class PreferencesService:
-    def __init__(self):
-        self.uow = get_unit_of_work()
+    def __init__(self, uow: Optional[AsyncMongoUnitOfWork] = None):
+        self.uow = uow or create_async_unit_of_work()
 
     async def get_preferences(self, user_id: str) -> Dict[str, Any]:
-        with self.uow:
-            preferences = self.uow.users.get_preferences(user_id)
+        async with self.uow:
+            preferences = await self.uow.users.get_preferences(user_id)
             if not preferences:
                 return {}
             return preferences
 
     async def update_preferences(self, user_id: str, preferences_update: Dict[str, Any]) -> Dict[str, Any]:
-        with self.uow:
-            user = self.uow.users.get_by_user_id(user_id)
+        async with self.uow:
+            user = await self.uow.users.get_by_user_id(user_id)
             if not user:
                 raise ValueError("User not found")
 
@@ -28,7 +29,7 @@ class PreferencesService:
                     current_preferences[key] = value
 
             # Update user preferences
-            success = self.uow.users.update_preferences(user_id, current_preferences)
+            success = await self.uow.users.update_preferences(user_id, current_preferences)
             if not success:
                 raise ValueError("Failed to update preferences")
 
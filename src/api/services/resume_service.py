@@ -1,14 +1,15 @@
-from typing import Optional, Dict, List
-from src.core.database.factory import get_unit_of_work
-from src.generator.resume_generator import ResumeGenerator
+from typing import Any, Optional, Dict, List
+from src.core.database.factory import create_async_unit_of_work
+from src.core.database.models import Resume
+from src.core.database.unit_of_work import AsyncMongoUnitOfWork
+from src.generator.generator_manager import GenerationType, GeneratorManager
 from src.generator.utils.output_manager import OutputManager
 from src.generator.utils.job_info import JobInfo
-from src.llms.runner import LLMRunner
-from src.loaders.prompt_loader import PromptLoader
+from .execution import ServiceBusyError, run_generation
 
 class ResumeService:
-    def __init__(self):
-        self.uow = get_unit_of_work()
+    def __init__(self, uow: Optional[AsyncMongoUnitOfWork] = None):
+        self.uow = uow or create_async_unit_of_work()
         
     async def generate_resume(
         self,
@@ -17,49 +18,88 @@ class ResumeService:
         options: Optional[Dict] = None
     ):
         try:
-            # Initialize LLM runner with user preferences
-            with self.uow:
-                user = self.uow.users.get_by_user_id(user_id)
-                llm_preferences = user.llm_preferences
-                
+            # Load user preferences without blocking the event loop
+            async with self.uow:
+                user = await self.uow.users.get_by_user_id(user_id)
+            preferences = user.preferences if user else None
+
             # Update preferences with options if provided
-            if options:
-                llm_preferences.update(options)
-                
-            llm_runner = LLMRunner.from_preferences(llm_preferences)
-            
-            # Initialize resume generator
-            resume_generator = ResumeGenerator(llm_runner, user_id)
-            
-            # Extract job info using LLM
-            prompt_loader = PromptLoader(user_id)
-            job_info = JobInfo.extract_from_description(
-                job_description=job_description,
-                llm_runner=llm_runner
-            )
-            
-            # Create output manager
-            output_manager = OutputManager(job_info)
-            
-            # Generate resume
-            resume = await resume_generator.generate_resume(
-                job_description=job_description,
-                selected_sections=options.get('selected_sections', {}),
-                output_manager=output_manager
+            llm_preferences = preferences.llm_preferences.model_dump() if preferences else {}
+            selected_sections = preferences.section_preferences.model_dump() if preferences else {}
+            options = {k: v for k, v in (options or {}).items() if v is not None}
+            llm_preferences.update({k: options[k] for k in ('model_type', 'model_name', 'temperature') if k in options})
+
+            # LLM calls and the PDF compile block, so they run on the bounded executors
+            return await run_generation(
+                self._generate_resume,
+                user_id,
+                job_description,
+                llm_preferences,
+                options.get('selected_sections', selected_sections),
+                options.get('use_cache'),
+                options.get('base_resume_id'),
+                options.get('latency_budget')
             )
-            
-            return resume
-            
+
+        except ServiceBusyError:
+            raise
         except Exception as e:
             raise Exception(f"Failed to generate resume: {str(e)}")
+
+    @staticmethod
+    def _generate_resume(user_id: str, job_description: str, llm_preferences: Dict[str, Any],
+                         selected_sections: Dict[str, str], use_cache: Optional[bool],
+                         base_resume_id: Optional[str] = None,
+                         latency_budget: Optional[float] = None) -> Optional[Resume]:
+        manager = GeneratorManager(user_id)
+        manager.configure_llm(
+            model_type=llm_preferences.get('model_type'),
+            model_name=llm_preferences.get('model_name'),
+            temperature=llm_preferences.get('temperature')
+        )
+
+        # Extract job info using LLM
+        job_info = JobInfo.extract_from_description(job_description, manager.llm_runner)
+        output_manager = OutputManager(job_info)
+
+        resume = None
+        for result in manager.generate(
+            generation_type=GenerationType.RESUME,
+            job_description=job_description,
+            selected_sections=selected_sections,
+            output_manager=output_manager,
+            use_cache=use_cache,
+            base_resume_id=base_resume_id,
+            latency_budget=latency_budget
+        ):
+            if isinstance(result, Resume):
+                resume = result
+        return resume
     
+    async def resume_run(self, user_id: str, run_id: str) -> Optional[Resume]:
+        """Continue a failed generation run, redoing only its unfinished stages."""
+        try:
+            return await run_generation(self._resume_run, user_id, run_id)
+        except ServiceBusyError:
+            raise
+        except Exception as e:
+            raise Exception(f"Failed to resume generation run: {str(e)}")
+
+    @staticmethod
+    def _resume_run(user_id: str, run_id: str) -> Optional[Resume]:
+        resume = None
+        for result in GeneratorManager(user_id).resume_run(run_id):
+            if isinstance(result, Resume):
+                resume = result
+        return resume
+
     async def get_resume(self, user_id: str, resume_id: str):
-        with self.uow:
-            resume = self.uow.resumes.get_by_id(resume_id)
+        async with self.uow:
+            resume = await self.uow.resumes.get_by_id(resume_id)
             if resume and resume.user_id == user_id:
                 return resume
             return None
     
     async def list_resumes(self, user_id: str) -> List:
-        with self.uow:
-            return self.uow.resumes.get_all_by_user(user_id) 
\ No newline at end of file
+        async with self.uow:
+            return await self.uow.resumes.get_all_by_user(user_id) 
\ No newline at end of file
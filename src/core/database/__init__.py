@@ -1,16 +1,28 @@
 """Database module."""
 
-from .connections import MongoConnection, AsyncMongoConnection
+from .connections import MongoConnection, AsyncMongoConnection, MongoClientRegistry
 from .unit_of_work import MongoUnitOfWork, AsyncMongoUnitOfWork
-from .factory import get_database_connection, get_async_database_connection, get_unit_of_work, get_async_unit_of_work
+from .factory import (
+    get_database_connection,
+    get_async_database_connection,
+    get_unit_of_work,
+    get_async_unit_of_work,
+    create_async_unit_of_work,
+    get_connection_stats,
+    close_database_connections
+)
 
 __all__ = [
     'MongoConnection',
     'AsyncMongoConnection',
+    'MongoClientRegistry',
     'MongoUnitOfWork',
     'AsyncMongoUnitOfWork',
     'get_database_connection',
     'get_async_database_connection',
     'get_unit_of_work',
-    'get_async_unit_of_work'
+    'get_async_unit_of_work',
+    'create_async_unit_of_work',
+    'get_connection_stats',
+    'close_database_connections'
 ]
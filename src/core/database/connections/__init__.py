@@ -1,5 +1,6 @@
 """Database connections module."""
 
 from .mongo_connection import MongoConnection, AsyncMongoConnection
+from .client_registry import MongoClientRegistry
 
-__all__ = ['MongoConnection', 'AsyncMongoConnection'] 
\ No newline at end of file
+__all__ = ['MongoConnection', 'AsyncMongoConnection', 'MongoClientRegistry'] 
\ No newline at end of file
@@ -0,0 +1,226 @@
+"""Process-wide registry of pooled MongoDB clients."""
+
+import asyncio
+import atexit
+import os
+import threading
+from typing import Any, Dict, Tuple
+
+from pymongo import MongoClient
+from pymongo.monitoring import ConnectionPoolListener
+from motor.motor_asyncio import AsyncIOMotorClient
+import logging
+
+from config.database_config import DatabaseConfig
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionCountListener(ConnectionPoolListener):
+    """Pool listener that keeps track of open and checked out connections."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.created = 0
+        self.closed = 0
+        self.checked_out = 0
+
+    @property
+    def open(self) -> int:
+        return self.created - self.closed
+
+    def connection_created(self, event):
+        with self._lock:
+            self.created += 1
+
+    def connection_closed(self, event):
+        with self._lock:
+            self.closed += 1
+
+    def connection_checked_out(self, event):
+        with self._lock:
+            self.checked_out += 1
+
+    def connection_checked_in(self, event):
+        with self._lock:
+            self.checked_out -= 1
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        pass
+
+
+class MongoClientRegistry:
+    """
+    Lazily creates and shares one MongoClient per URI for the whole process.
+
+    Every MongoConnection borrows its client (and therefore its connection pool,
+    monitor threads and TLS sessions) from this registry instead of opening its own.
+    Async clients are additionally scoped to their event loop, because Motor binds a
+    client to the loop it first runs on; clients of closed loops are closed and dropped.
+    The registry is fork-safe: a child process never reuses the parent's clients.
+    """
+
+    _lock = threading.Lock()
+    _pid = os.getpid()
+    _clients: Dict[str, MongoClient] = {}
+    _async_clients: Dict[Tuple[asyncio.AbstractEventLoop, str], AsyncIOMotorClient] = {}
+    _listeners: Dict[Tuple[Any, ...], ConnectionCountListener] = {}
+    _clients_created = 0
+
+    @classmethod
+    def _client_options(cls) -> Dict[str, Any]:
+        """Build client keyword arguments from the database configuration."""
+        options = DatabaseConfig.get_mongodb_config().options
+        return {
+            'maxPoolSize': options['max_pool_size'],
+            'minPoolSize': options['min_pool_size'],
+            'maxIdleTimeMS': options['max_idle_time'],
+            'connectTimeoutMS': options['connect_timeout'],
+            'serverSelectionTimeoutMS': options['server_selection_timeout'],
+            'socketTimeoutMS': options['socket_timeout'],
+        }
+
+    @classmethod
+    def _check_pid(cls) -> None:
+        """Forget clients inherited from a parent process."""
+        if cls._pid != os.getpid():
+            cls._reset_after_fork()
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        # Clients must never be used across fork; drop them without closing
+        cls._lock = threading.Lock()
+        cls._pid = os.getpid()
+        cls._clients = {}
+        cls._async_clients = {}
+        cls._listeners = {}
+
+    @classmethod
+    def get_client(cls, uri: str) -> MongoClient:
+        """
+        Get the shared synchronous client for a URI, creating it on first use.
+
+        Args:
+            uri: MongoDB connection URI
+
+        Returns:
+            MongoClient: Shared MongoDB client
+        """
+        cls._check_pid()
+        client = cls._clients.get(uri)
+        if client is not None:
+            return client
+
+        with cls._lock:
+            client = cls._clients.get(uri)
+            if client is None:
+                listener = ConnectionCountListener()
+                client = MongoClient(uri, event_listeners=[listener], **cls._client_options())
+                cls._clients[uri] = client
+                cls._listeners[('sync', uri)] = listener
+                cls._clients_created += 1
+                logger.info("Created shared MongoDB client")
+            return client
+
+    @classmethod
+    def get_async_client(cls, uri: str) -> AsyncIOMotorClient:
+        """
+        Get the shared async client for a URI on the running event loop, creating it on first use.
+
+        Args:
+            uri: MongoDB connection URI
+
+        Returns:
+            AsyncIOMotorClient: Shared async MongoDB client
+
+        Raises:
+            RuntimeError: If called outside a running event loop
+        """
+        cls._check_pid()
+        loop = asyncio.get_running_loop()
+        client = cls._async_clients.get((loop, uri))
+        if client is not None:
+            return client
+
+        with cls._lock:
+            client = cls._async_clients.get((loop, uri))
+            if client is None:
+                cls._close_stale_async_clients()
+                listener = ConnectionCountListener()
+                client = AsyncIOMotorClient(uri, event_listeners=[listener], io_loop=loop,
+                                            **cls._client_options())
+                cls._async_clients[(loop, uri)] = client
+                cls._listeners[('async', loop, uri)] = listener
+                cls._clients_created += 1
+                logger.info("Created shared async MongoDB client")
+            return client
+
+    @classmethod
+    def _close_stale_async_clients(cls) -> None:
+        # Caller holds the lock. A client keeps its loop alive, so closed loops are swept here
+        for loop, uri in [key for key in cls._async_clients if key[0].is_closed()]:
+            cls._close(cls._async_clients.pop((loop, uri)))
+            cls._listeners.pop(('async', loop, uri), None)
+
+    @staticmethod
+    def _close(client: Any) -> None:
+        try:
+            client.close()
+        except Exception as e:
+            logger.warning(f"Error closing MongoDB client: {e}")
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close every registered client. Safe to call more than once."""
+        with cls._lock:
+            if cls._pid != os.getpid():
+                return
+            for client in list(cls._clients.values()) + list(cls._async_clients.values()):
+                cls._close(client)
+            cls._clients = {}
+            cls._async_clients = {}
+            cls._listeners = {}
+        logger.info("Closed shared MongoDB clients")
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        """
+        Get client and connection counts for this process.
+
+        Returns:
+            Dict[str, Any]: Number of live clients, clients created since start
+            and open / checked out connections across all pools
+        """
+        listeners = list(cls._listeners.values())
+        return {
+            'pid': os.getpid(),
+            'clients': len(cls._clients) + len(cls._async_clients),
+            'clients_created': cls._clients_created,
+            'open_connections': sum(listener.open for listener in listeners),
+            'checked_out_connections': sum(listener.checked_out for listener in listeners),
+            'connections_created': sum(listener.created for listener in listeners),
+        }
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=MongoClientRegistry._reset_after_fork)
+
+atexit.register(MongoClientRegistry.close_all)
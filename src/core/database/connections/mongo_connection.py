@@ -3,9 +3,11 @@
 from typing import Optional
 from pymongo import MongoClient
 from pymongo.client_session import ClientSession
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorClientSession
+from motor.motor_asyncio import AsyncIOMotorClientSession
 import logging
 
+from .client_registry import MongoClientRegistry
+
 logger = logging.getLogger(__name__)
 
 class MongoConnection:
@@ -19,10 +21,10 @@ class MongoConnection:
             uri: MongoDB connection URI
             database: Database name
         """
-        self.client = MongoClient(uri)
+        self.client: MongoClient = MongoClientRegistry.get_client(uri)
         self.db = self.client[database]
         self._session: Optional[ClientSession] = None
-        logger.info("Connected to MongoDB successfully")
+        logger.debug("Borrowed shared MongoDB client")
     
     def __enter__(self) -> 'MongoConnection':
         """Start a new session."""
@@ -45,10 +47,10 @@ class AsyncMongoConnection:
     
     def __init__(self, uri: str, database: str):
         """Initialize MongoDB connection."""
-        self.client = AsyncIOMotorClient(uri)
+        self.client = MongoClientRegistry.get_async_client(uri)
         self.db = self.client[database]
         self._session: Optional[AsyncIOMotorClientSession] = None
-        logger.info("Connected to MongoDB successfully")
+        logger.debug("Borrowed shared async MongoDB client")
     
     async def __aenter__(self) -> 'AsyncMongoConnection':
         """Start a new session."""
@@ -1,8 +1,8 @@
 """Database factory module for creating database connections and unit of work."""
 
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict
 from config.config import MONGODB_URI, MONGODB_DATABASE
-from .connections import MongoConnection, AsyncMongoConnection
+from .connections import MongoConnection, AsyncMongoConnection, MongoClientRegistry
 from .unit_of_work import MongoUnitOfWork, AsyncMongoUnitOfWork
 
 def get_database_connection() -> MongoConnection:
@@ -35,13 +35,35 @@ def get_unit_of_work() -> MongoUnitOfWork:
     connection = get_database_connection()
     return MongoUnitOfWork(connection)
 
+def create_async_unit_of_work() -> AsyncMongoUnitOfWork:
+    """
+    Create an async MongoDB unit of work backed by the native Motor repositories.
+    
+    Returns:
+        AsyncMongoUnitOfWork: Async MongoDB unit of work instance
+    """
+    connection = get_async_database_connection()
+    return AsyncMongoUnitOfWork(connection)
+
 async def get_async_unit_of_work() -> AsyncGenerator[AsyncMongoUnitOfWork, None]:
     """
-    Get an async MongoDB unit of work instance.
+    Get an async MongoDB unit of work instance (FastAPI dependency).
     
     Yields:
         AsyncMongoUnitOfWork: Async MongoDB unit of work instance
     """
-    connection = get_async_database_connection()
-    async with AsyncMongoUnitOfWork(connection) as uow:
-        yield uow 
\ No newline at end of file
+    async with create_async_unit_of_work() as uow:
+        yield uow
+
+def get_connection_stats() -> Dict[str, Any]:
+    """
+    Get MongoDB client and connection counts for the current process.
+    
+    Returns:
+        Dict[str, Any]: Connection statistics from the shared client registry
+    """
+    return MongoClientRegistry.get_stats()
+
+def close_database_connections() -> None:
+    """Close the shared MongoDB clients. Call on application shutdown."""
+    MongoClientRegistry.close_all()
@@ -3,9 +3,10 @@ Core interfaces for database operations.
 """
 
 from .database_interface import DatabaseInterface
-from .repository_interface import BaseRepository
+from .repository_interface import BaseRepository, AsyncBaseRepository
 
 __all__ = [
     'DatabaseInterface',
-    'BaseRepository'
+    'BaseRepository',
+    'AsyncBaseRepository'
 ]
@@ -32,4 +32,35 @@ class BaseRepository(ABC, Generic[T]):
     @abstractmethod
     def exists(self, id: Any) -> bool:
         """Check if an entity exists"""
-        pass 
\ No newline at end of file
+        pass 
+
+class AsyncBaseRepository(ABC, Generic[T]):
+    @abstractmethod
+    async def get_by_id(self, id: Any) -> Optional[T]:
+        """Retrieve an entity by its ID"""
+        pass
+
+    @abstractmethod
+    async def get_all(self) -> List[T]:
+        """Retrieve all entities"""
+        pass
+
+    @abstractmethod
+    async def add(self, entity: T) -> T:
+        """Add a new entity"""
+        pass
+
+    @abstractmethod
+    async def update(self, entity: T) -> bool:
+        """Update an existing entity"""
+        pass
+
+    @abstractmethod
+    async def delete(self, id: Any) -> bool:
+        """Delete an entity by its ID"""
+        pass
+
+    @abstractmethod
+    async def exists(self, id: Any) -> bool:
+        """Check if an entity exists"""
+        pass
@@ -4,10 +4,16 @@ from .user import User
 from .portfolio import Portfolio
 from .resume import Resume
 from .profile import Profile
+from .generation_job import GenerationJob, JobStatus
+from .generation_run import GenerationRun, RunStatus
 
 __all__ = [
     'User',
     'Portfolio',
     'Resume',
-    'Profile'
+    'Profile',
+    'GenerationJob',
+    'JobStatus',
+    'GenerationRun',
+    'RunStatus'
 ] 
\ No newline at end of file
@@ -0,0 +1,48 @@
+from datetime import datetime
+from enum import Enum
+from typing import Optional, Dict, Any
+from pydantic import BaseModel, Field, ConfigDict
+
+
+class JobStatus(str, Enum):
+    """Lifecycle of a generation job"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class GenerationJob(BaseModel):
+    """Background resume / cover letter generation job"""
+    id: Optional[str] = Field(None, alias="_id")
+    user_id: str
+    job_type: str  # GenerationType value: resume, cover_letter or both
+    status: JobStatus = JobStatus.QUEUED
+
+    # Everything a worker needs to run the job
+    params: Dict[str, Any] = Field(default_factory=dict)
+
+    progress: float = 0.0
+    message: str = ""
+    resume_id: Optional[str] = None
+    error: Optional[str] = None
+
+    # Queue bookkeeping: a running job is owned by worker_id until lease_expires_at
+    attempts: int = 0
+    worker_id: Optional[str] = None
+    lease_expires_at: Optional[datetime] = None
+    available_at: Optional[datetime] = None  # Retries wait until then
+
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        use_enum_values=True
+    )
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (JobStatus.SUCCEEDED, JobStatus.FAILED)
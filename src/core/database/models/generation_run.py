@@ -0,0 +1,42 @@
+from datetime import datetime
+from enum import Enum
+from typing import Optional, Dict, Any
+from pydantic import BaseModel, Field, ConfigDict
+
+
+class RunStatus(str, Enum):
+    """Lifecycle of a generation run"""
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class GenerationRun(BaseModel):
+    """Checkpoint of a resume / cover letter generation, so a failed run can continue where it stopped"""
+    id: Optional[str] = Field(None, alias="_id")
+    user_id: str
+    generation_type: str  # GenerationType value: resume, cover_letter or both
+    status: RunStatus = RunStatus.RUNNING
+
+    # Inputs needed to continue the run
+    job_description: str
+    selected_sections: Dict[str, str] = Field(default_factory=dict)
+    llm_settings: Dict[str, Any] = Field(default_factory=dict)  # model_type, model_name, temperature
+    company_name: Optional[str] = None
+    job_title: Optional[str] = None
+    output_dir: Optional[str] = None
+
+    # Completed stages
+    sections: Dict[str, str] = Field(default_factory=dict)  # Finished section -> content
+    section_fingerprints: Dict[str, str] = Field(default_factory=dict)
+    resume_id: Optional[str] = None  # Set once the resume is compiled and saved
+    cover_letter_done: bool = False
+
+    error: Optional[str] = None
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        use_enum_values=True
+    )
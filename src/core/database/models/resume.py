@@ -2,6 +2,12 @@ from datetime import datetime
 from typing import Optional, Dict, Any, List, Union
 from pydantic import BaseModel, Field, ConfigDict
 
+# Generated sections, in document order
+RESUME_SECTIONS = (
+    'personal_information', 'career_summary', 'skills', 'work_experience',
+    'education', 'projects', 'awards', 'publications'
+)
+
 class Resume(BaseModel):
     """Resume content model"""
     id: Optional[str] = Field(None, alias="_id")
@@ -34,6 +40,11 @@ class Resume(BaseModel):
     model_name: Optional[str] = None
     temperature: Optional[float] = None
 
+    # AI section -> fingerprint of the inputs it was generated from, for incremental regeneration
+    section_fingerprints: Dict[str, str] = Field(default_factory=dict)
+    # AI sections replaced with their hardcoded version because the latency budget ran out
+    fallback_sections: List[str] = Field(default_factory=list)
+
     model_config = ConfigDict(
         populate_by_name=True,
         arbitrary_types_allowed=True,
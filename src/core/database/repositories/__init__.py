@@ -6,6 +6,17 @@ from .resume_repository import MongoResumeRepository as ResumeRepository
 from .preamble_repository import MongoPreambleRepository as PreambleRepository
 from .tex_header_repository import MongoTexHeaderRepository as TexHeaderRepository
 from .user_repository import MongoUserRepository as UserRepository
+from .job_repository import MongoJobRepository as JobRepository
+from .run_repository import MongoRunRepository as RunRepository
+from .async_repositories import (
+    AsyncMongoPortfolioRepository as AsyncPortfolioRepository,
+    AsyncMongoProfileRepository as AsyncProfileRepository,
+    AsyncMongoResumeRepository as AsyncResumeRepository,
+    AsyncMongoPreambleRepository as AsyncPreambleRepository,
+    AsyncMongoTexHeaderRepository as AsyncTexHeaderRepository,
+    AsyncMongoUserRepository as AsyncUserRepository,
+    AsyncMongoJobRepository as AsyncJobRepository
+)
 
 __all__ = [
     'PortfolioRepository',
@@ -13,5 +24,14 @@ __all__ = [
     'ResumeRepository',
     'PreambleRepository',
     'TexHeaderRepository',
-    'UserRepository'
+    'UserRepository',
+    'JobRepository',
+    'RunRepository',
+    'AsyncPortfolioRepository',
+    'AsyncProfileRepository',
+    'AsyncResumeRepository',
+    'AsyncPreambleRepository',
+    'AsyncTexHeaderRepository',
+    'AsyncUserRepository',
+    'AsyncJobRepository'
 ] 
\ No newline at end of file
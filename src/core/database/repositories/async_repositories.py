@@ -0,0 +1,578 @@
+"""
+Native async (Motor) repositories.
+
+Each repository mirrors the query surface of its synchronous counterpart but awaits
+Motor instead of blocking on pymongo, so FastAPI handlers never stall the event loop
+on MongoDB I/O. Entity mapping is shared with the synchronous repositories so both
+return identical models.
+"""
+
+from typing import Optional, List, Dict, Any
+from bson import ObjectId
+from datetime import datetime, timezone
+from ...exceptions.database_exceptions import DatabaseError
+from ..interfaces.repository_interface import AsyncBaseRepository
+from ..models.user import User
+from ..models.portfolio import Portfolio, CareerSummary
+from ..models.profile import Profile
+from ..models.resume import Resume
+from ..models.preamble import Preamble
+from ..models.tex_header import TexHeader
+from ..models.generation_job import GenerationJob
+from .user_repository import MongoUserRepository
+from .portfolio_repository import MongoPortfolioRepository
+from .profile_repository import MongoProfileRepository
+from .resume_repository import MongoResumeRepository
+from .preamble_repository import MongoPreambleRepository
+from .tex_header_repository import MongoTexHeaderRepository
+from .job_repository import MongoJobRepository
+from config.job_config import JobConfig
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+async def _to_list(cursor) -> list:
+    return await cursor.to_list(length=None)
+
+
+class AsyncMongoUserRepository(AsyncBaseRepository[User]):
+    """Async repository for handling user-related database operations."""
+
+    _prepare_for_validation = MongoUserRepository._prepare_for_validation
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.collection = connection.db.users
+        self.model = User
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Get user by email."""
+        result = await self.collection.find_one({'email': email})
+        if result:
+            result = self._prepare_for_validation(result)
+        return self.model.model_validate(result) if result else None
+
+    async def get_by_user_id(self, user_id: str) -> Optional[User]:
+        """Get user by user_id."""
+        result = await self.collection.find_one({'user_id': user_id})
+        if result:
+            result = self._prepare_for_validation(result)
+        return self.model.model_validate(result) if result else None
+
+    async def update_preferences(self, user_id: str, preferences: Dict[str, Any]) -> bool:
+        """Update user preferences."""
+        try:
+            result = await self.collection.update_one(
+                {'user_id': user_id},
+                {
+                    '$set': {
+                        'preferences': preferences,
+                        'updated_at': datetime.now()
+                    }
+                }
+            )
+            return result.modified_count > 0
+        except Exception as e:
+            raise Exception(f"Error updating preferences: {str(e)}")
+
+    async def get_preferences(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Get user preferences."""
+        result = await self.collection.find_one(
+            {'user_id': user_id},
+            {'preferences': 1}
+        )
+        return result.get('preferences') if result else None
+
+    async def get_by_id(self, id: Any) -> Optional[User]:
+        """Get user by ID."""
+        if not ObjectId.is_valid(id):
+            return None
+        result = await self.collection.find_one({'_id': ObjectId(id)})
+        if result:
+            result = self._prepare_for_validation(result)
+        return self.model.model_validate(result) if result else None
+
+    async def get_all(self) -> List[User]:
+        """Get all users."""
+        results = await _to_list(self.collection.find())
+        return [self.model.model_validate(self._prepare_for_validation(doc)) for doc in results]
+
+    async def add(self, entity: User) -> User:
+        """Add a new user."""
+        result = await self.collection.insert_one(entity.model_dump(exclude={'id'}))
+        entity.id = str(result.inserted_id)
+        return entity
+
+    async def update(self, entity: User) -> bool:
+        """Update an existing user."""
+        result = await self.collection.update_one(
+            {'_id': ObjectId(entity.id)},
+            {'$set': entity.model_dump(exclude={'id'})}
+        )
+        return result.modified_count > 0
+
+    async def delete(self, id: Any) -> bool:
+        """Delete a user."""
+        result = await self.collection.delete_one({'_id': ObjectId(id)})
+        return result.deleted_count > 0
+
+    async def exists(self, id: Any) -> bool:
+        """Check if a user exists."""
+        return await self.collection.count_documents({'_id': ObjectId(id)}) > 0
+
+
+class AsyncMongoPortfolioRepository(AsyncBaseRepository[Portfolio]):
+    _map_to_entity = MongoPortfolioRepository._map_to_entity
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.collection = self.connection.db['portfolios']
+
+    async def get_by_id(self, id: str) -> Optional[Portfolio]:
+        try:
+            result = await self.collection.find_one({'_id': ObjectId(id)})
+            return self._map_to_entity(result) if result else None
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving portfolio: {str(e)}")
+
+    async def get_by_user_id(self, user_id: str) -> Optional[Portfolio]:
+        try:
+            result = await self.collection.find_one({'user_id': user_id})
+            return self._map_to_entity(result) if result else None
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving portfolio by user ID: {str(e)}")
+
+    async def get_all(self) -> List[Portfolio]:
+        try:
+            return [self._map_to_entity(doc) for doc in await _to_list(self.collection.find())]
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving all portfolios: {str(e)}")
+
+    async def add(self, portfolio: Portfolio) -> Portfolio:
+        try:
+            result = await self.collection.insert_one(portfolio.model_dump(exclude={'id'}))
+            portfolio.id = str(result.inserted_id)
+            return portfolio
+        except Exception as e:
+            raise DatabaseError(f"Error adding portfolio: {str(e)}")
+
+    async def update(self, portfolio: Portfolio) -> bool:
+        try:
+            result = await self.collection.update_one(
+                {'_id': ObjectId(portfolio.id)},
+                {'$set': portfolio.model_dump(exclude={'id'})}
+            )
+            return result.modified_count > 0
+        except Exception as e:
+            raise DatabaseError(f"Error updating portfolio: {str(e)}")
+
+    async def update_career_summary(self, portfolio_id: str, career_summary: CareerSummary) -> bool:
+        try:
+            result = await self.collection.update_one(
+                {'_id': ObjectId(portfolio_id)},
+                {'$set': {
+                    'career_summary': career_summary.model_dump(),
+                    'updated_at': datetime.now(timezone.utc)
+                }}
+            )
+            return result.modified_count > 0
+        except Exception as e:
+            raise DatabaseError(f"Error updating career summary: {str(e)}")
+
+    async def delete(self, id: str) -> bool:
+        try:
+            result = await self.collection.delete_one({'_id': ObjectId(id)})
+            return result.deleted_count > 0
+        except Exception as e:
+            raise DatabaseError(f"Error deleting portfolio: {str(e)}")
+
+    async def exists(self, id: str) -> bool:
+        try:
+            return await self.collection.count_documents({'_id': ObjectId(id)}) > 0
+        except Exception as e:
+            raise DatabaseError(f"Error checking portfolio existence: {str(e)}")
+
+
+class AsyncMongoProfileRepository(AsyncBaseRepository[Profile]):
+    _map_to_entity = MongoProfileRepository._map_to_entity
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.collection = self.connection.db['profiles']
+
+    async def get_by_id(self, id: str) -> Optional[Profile]:
+        try:
+            result = await self.collection.find_one({'_id': ObjectId(id)})
+            return self._map_to_entity(result) if result else None
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving profile: {str(e)}")
+
+    async def get_by_user_id(self, user_id: str) -> Optional[Profile]:
+        try:
+            result = await self.collection.find_one({'user_id': user_id})
+            return self._map_to_entity(result) if result else None
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving profile by user ID: {str(e)}")
+
+    async def get_all(self) -> List[Profile]:
+        try:
+            return [self._map_to_entity(doc) for doc in await _to_list(self.collection.find())]
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving all profiles: {str(e)}")
+
+    async def add(self, profile: Profile) -> Profile:
+        try:
+            doc = profile.dict(exclude={'id'})
+            doc['created_at'] = datetime.now(timezone.utc)
+            doc['updated_at'] = doc['created_at']
+            result = await self.collection.insert_one(doc)
+            return await self.get_by_id(str(result.inserted_id))
+        except Exception as e:
+            raise DatabaseError(f"Error adding profile: {str(e)}")
+
+    async def update(self, profile: Profile) -> Optional[Profile]:
+        try:
+            doc = profile.dict(exclude={'id'})
+            doc['updated_at'] = datetime.now(timezone.utc)
+            result = await self.collection.update_one(
+                {'_id': ObjectId(profile.id)},
+                {'$set': doc}
+            )
+            if result.modified_count == 0:
+                return None
+            return await self.get_by_id(profile.id)
+        except Exception as e:
+            raise DatabaseError(f"Error updating profile: {str(e)}")
+
+    async def delete(self, id: str) -> bool:
+        try:
+            result = await self.collection.delete_one({'_id': ObjectId(id)})
+            return result.deleted_count > 0
+        except Exception as e:
+            raise DatabaseError(f"Error deleting profile: {str(e)}")
+
+    async def exists(self, id: str) -> bool:
+        try:
+            return await self.collection.count_documents({'_id': ObjectId(id)}) > 0
+        except Exception as e:
+            raise DatabaseError(f"Error checking profile existence: {str(e)}")
+
+
+class AsyncMongoResumeRepository(AsyncBaseRepository[Resume]):
+    _map_to_entity = MongoResumeRepository._map_to_entity
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.collection = self.connection.db['resumes']
+
+    async def get_by_id(self, resume_id: str) -> Optional[Resume]:
+        try:
+            if not ObjectId.is_valid(resume_id):
+                return None
+            result = await self.collection.find_one({'_id': ObjectId(resume_id)})
+            return self._map_to_entity(result) if result else None
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving resume: {str(e)}")
+
+    async def get_all_by_user(self, user_id: str) -> List[Resume]:
+        """Get all resumes for a specific user"""
+        try:
+            results = await _to_list(self.collection.find({'user_id': user_id}))
+            return [self._map_to_entity(doc) for doc in results]
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving user resumes: {str(e)}")
+
+    async def get_cover_letters(self, user_id: str) -> List[Resume]:
+        """Get a user's resumes that have a cover letter, newest first, without loading the PDFs"""
+        try:
+            query = {'user_id': user_id, 'cover_letter_content': {'$nin': [None, '']}}
+            projection = {'resume_pdf': 0, 'cover_letter_pdf': 0}
+            results = await _to_list(self.collection.find(query, projection).sort([('created_at', -1), ('_id', -1)]))
+            return [self._map_to_entity(doc) for doc in results]
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving user cover letters: {str(e)}")
+
+    async def get_latest_resume(self, user_id: str) -> Optional[Resume]:
+        """Get the most recent resume for a user"""
+        try:
+            if not isinstance(user_id, str):
+                raise ValueError(f"user_id must be a string, got {type(user_id)}")
+            result = await self.collection.find_one({'user_id': user_id}, sort=[('created_at', -1), ('_id', -1)])
+            return self._map_to_entity(result) if result else None
+        except Exception as e:
+            logger.error(f"Error retrieving latest resume: {str(e)}")
+            raise DatabaseError(f"Error retrieving latest resume: {str(e)}")
+
+    async def get_all(self) -> List[Resume]:
+        """Get all resumes"""
+        try:
+            resumes = []
+            for doc in await _to_list(self.collection.find({'user_id': {'$exists': True}})):
+                try:
+                    resumes.append(self._map_to_entity(doc))
+                except DatabaseError as e:
+                    logger.error(f"Error mapping resume document: {str(e)}")
+            return resumes
+        except Exception as e:
+            logger.error(f"Error retrieving all resumes: {str(e)}")
+            raise DatabaseError(f"Error retrieving all resumes: {str(e)}")
+
+    async def add(self, resume: Resume) -> Resume:
+        try:
+            resume_dict = resume.model_dump(exclude={'id'})
+            resume_dict['created_at'] = datetime.now(timezone.utc)
+            resume_dict['updated_at'] = datetime.now(timezone.utc)
+            result = await self.collection.insert_one(resume_dict)
+            resume.id = str(result.inserted_id)
+            return resume
+        except Exception as e:
+            logger.error(f"Error adding resume: {str(e)}")
+            raise DatabaseError(f"Error adding resume: {str(e)}")
+
+    async def update(self, resume: Resume) -> bool:
+        try:
+            if not ObjectId.is_valid(resume.id):
+                return False
+            update_data = resume.model_dump(exclude={'id'})
+            update_data['updated_at'] = datetime.now(timezone.utc)
+            result = await self.collection.update_one(
+                {'_id': ObjectId(resume.id)},
+                {'$set': update_data}
+            )
+            return result.modified_count > 0
+        except Exception as e:
+            raise DatabaseError(f"Error updating resume: {str(e)}")
+
+    async def delete(self, id: str) -> bool:
+        try:
+            if not ObjectId.is_valid(id):
+                return False
+            result = await self.collection.delete_one({'_id': ObjectId(id)})
+            return result.deleted_count > 0
+        except Exception as e:
+            raise DatabaseError(f"Error deleting resume: {str(e)}")
+
+    async def exists(self, id: str) -> bool:
+        """Check if resume exists"""
+        try:
+            if not ObjectId.is_valid(id):
+                return False
+            return await self.collection.count_documents({'_id': ObjectId(id)}) > 0
+        except Exception as e:
+            raise DatabaseError(f"Error checking resume existence: {str(e)}")
+
+
+class AsyncMongoPreambleRepository(AsyncBaseRepository[Preamble]):
+    _map_to_entity = MongoPreambleRepository._map_to_entity
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.collection = self.connection.db['preambles']
+
+    async def get_by_id(self, id: str) -> Optional[Preamble]:
+        try:
+            result = await self.collection.find_one({'_id': ObjectId(id)})
+            return self._map_to_entity(result) if result else None
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving preamble: {str(e)}")
+
+    async def get_by_type(self, type: str) -> Optional[Preamble]:
+        """Get a preamble by its type"""
+        try:
+            result = await self.collection.find_one({'type': type})
+            return self._map_to_entity(result) if result else None
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving preamble by type: {str(e)}")
+
+    async def get_all(self) -> List[Preamble]:
+        try:
+            return [self._map_to_entity(doc) for doc in await _to_list(self.collection.find())]
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving all preambles: {str(e)}")
+
+    async def add(self, preamble: Preamble) -> Preamble:
+        try:
+            preamble_dict = preamble.dict(exclude={'id'})
+            preamble_dict['updated_at'] = datetime.now(timezone.utc)
+            result = await self.collection.insert_one(preamble_dict)
+            preamble.id = str(result.inserted_id)
+            return preamble
+        except Exception as e:
+            raise DatabaseError(f"Error adding preamble: {str(e)}")
+
+    async def update(self, preamble: Preamble) -> bool:
+        try:
+            preamble_dict = preamble.dict(exclude={'id'})
+            preamble_dict['updated_at'] = datetime.now(timezone.utc)
+            result = await self.collection.update_one(
+                {'_id': ObjectId(preamble.id)},
+                {'$set': preamble_dict}
+            )
+            return result.modified_count > 0
+        except Exception as e:
+            raise DatabaseError(f"Error updating preamble: {str(e)}")
+
+    async def delete(self, id: str) -> bool:
+        try:
+            result = await self.collection.delete_one({'_id': ObjectId(id)})
+            return result.deleted_count > 0
+        except Exception as e:
+            raise DatabaseError(f"Error deleting preamble: {str(e)}")
+
+    async def exists(self, id: str) -> bool:
+        try:
+            return await self.collection.count_documents({'_id': ObjectId(id)}) > 0
+        except Exception as e:
+            raise DatabaseError(f"Error checking preamble existence: {str(e)}")
+
+
+class AsyncMongoTexHeaderRepository(AsyncBaseRepository[TexHeader]):
+    _map_to_entity = MongoTexHeaderRepository._map_to_entity
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.collection = self.connection.db['tex_headers']
+
+    async def get_by_id(self, id: str) -> Optional[TexHeader]:
+        try:
+            result = await self.collection.find_one({'_id': ObjectId(id)})
+            return self._map_to_entity(result) if result else None
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving tex header: {str(e)}")
+
+    async def get_by_name(self, name: str) -> Optional[TexHeader]:
+        """Get a tex header by its name"""
+        try:
+            result = await self.collection.find_one({'name': name})
+            return self._map_to_entity(result) if result else None
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving tex header by name: {str(e)}")
+
+    async def get_latest(self) -> Optional[TexHeader]:
+        """Get the most recently updated tex header"""
+        try:
+            result = await self.collection.find_one({}, sort=[('updated_at', -1)])
+            return self._map_to_entity(result) if result else None
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving latest tex header: {str(e)}")
+
+    async def get_all(self) -> List[TexHeader]:
+        try:
+            return [self._map_to_entity(doc) for doc in await _to_list(self.collection.find())]
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving all tex headers: {str(e)}")
+
+    async def add(self, tex_header: TexHeader) -> TexHeader:
+        try:
+            header_dict = tex_header.model_dump(exclude={'id'})
+            header_dict['created_at'] = datetime.now(timezone.utc)
+            header_dict['updated_at'] = datetime.now(timezone.utc)
+            result = await self.collection.insert_one(header_dict)
+            tex_header.id = str(result.inserted_id)
+            return tex_header
+        except Exception as e:
+            raise DatabaseError(f"Error adding tex header: {str(e)}")
+
+    async def update(self, tex_header: TexHeader) -> bool:
+        try:
+            header_dict = tex_header.model_dump(exclude={'id'})
+            header_dict['updated_at'] = datetime.now(timezone.utc)
+            result = await self.collection.update_one(
+                {'_id': ObjectId(tex_header.id)},
+                {'$set': header_dict}
+            )
+            return result.modified_count > 0
+        except Exception as e:
+            raise DatabaseError(f"Error updating tex header: {str(e)}")
+
+    async def delete(self, id: str) -> bool:
+        try:
+            result = await self.collection.delete_one({'_id': ObjectId(id)})
+            return result.deleted_count > 0
+        except Exception as e:
+            raise DatabaseError(f"Error deleting tex header: {str(e)}")
+
+    async def exists(self, id: str) -> bool:
+        try:
+            return await self.collection.count_documents({'_id': ObjectId(id)}) > 0
+        except Exception as e:
+            raise DatabaseError(f"Error checking tex header existence: {str(e)}")
+
+
+class AsyncMongoJobRepository(AsyncBaseRepository[GenerationJob]):
+    _map_to_entity = MongoJobRepository._map_to_entity
+
+    def __init__(self, connection):
+        self.connection = connection
+        config = JobConfig.get_generation_job_config()
+        self.collection = self.connection.db[config.collection]
+        self.events = self.connection.db[config.events_collection]
+
+    async def get_by_id(self, job_id: str) -> Optional[GenerationJob]:
+        try:
+            if not ObjectId.is_valid(job_id):
+                return None
+            result = await self.collection.find_one({'_id': ObjectId(job_id)})
+            return self._map_to_entity(result) if result else None
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving generation job: {str(e)}")
+
+    async def get_all(self) -> List[GenerationJob]:
+        try:
+            return [self._map_to_entity(doc) for doc in await _to_list(self.collection.find())]
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving generation jobs: {str(e)}")
+
+    async def get_all_by_user(self, user_id: str, limit: int = 50) -> List[GenerationJob]:
+        """Get a user's most recent jobs"""
+        try:
+            cursor = self.collection.find({'user_id': user_id}).sort('created_at', -1).limit(limit)
+            return [self._map_to_entity(doc) for doc in await _to_list(cursor)]
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving user generation jobs: {str(e)}")
+
+    async def add(self, job: GenerationJob) -> GenerationJob:
+        try:
+            result = await self.collection.insert_one(job.model_dump(exclude={'id'}))
+            job.id = str(result.inserted_id)
+            return job
+        except Exception as e:
+            raise DatabaseError(f"Error adding generation job: {str(e)}")
+
+    async def update(self, job: GenerationJob) -> bool:
+        try:
+            job_dict = job.model_dump(exclude={'id'})
+            job_dict['updated_at'] = datetime.now(timezone.utc)
+            result = await self.collection.update_one({'_id': ObjectId(job.id)}, {'$set': job_dict})
+            return result.modified_count > 0
+        except Exception as e:
+            raise DatabaseError(f"Error updating generation job: {str(e)}")
+
+    async def delete(self, job_id: str) -> bool:
+        try:
+            result = await self.collection.delete_one({'_id': ObjectId(job_id)})
+            return result.deleted_count > 0
+        except Exception as e:
+            raise DatabaseError(f"Error deleting generation job: {str(e)}")
+
+    async def exists(self, job_id: str) -> bool:
+        try:
+            if not ObjectId.is_valid(job_id):
+                return False
+            return await self.collection.count_documents({'_id': ObjectId(job_id)}) > 0
+        except Exception as e:
+            raise DatabaseError(f"Error checking generation job existence: {str(e)}")
+
+    async def get_events(self, job_id: str, after: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get a job's events in order, optionally only those after a given event id"""
+        try:
+            query: Dict[str, Any] = {'job_id': job_id}
+            if after and ObjectId.is_valid(after):
+                query['_id'] = {'$gt': ObjectId(after)}
+            return [
+                {'id': str(doc['_id']), 'type': doc['type'], 'data': doc['data']}
+                for doc in await _to_list(self.events.find(query).sort('_id', 1))
+            ]
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving generation job events: {str(e)}")
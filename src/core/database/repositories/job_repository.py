@@ -0,0 +1,227 @@
+from typing import Optional, List, Dict, Any
+from bson import ObjectId
+from datetime import datetime, timedelta, timezone
+from pymongo import ReturnDocument
+from ...exceptions.database_exceptions import DatabaseError
+from ..interfaces.repository_interface import BaseRepository
+from ..models.generation_job import GenerationJob, JobStatus
+from config.job_config import JobConfig
+import logging
+
+logger = logging.getLogger(__name__)
+
+class MongoJobRepository(BaseRepository[GenerationJob]):
+    _event_indexes_created = False
+    _queue_indexes_created = False
+
+    def __init__(self, connection):
+        self.connection = connection
+        config = JobConfig.get_generation_job_config()
+        self.collection = self.connection.db[config.collection]
+        self.events = self.connection.db[config.events_collection]
+
+    def get_by_id(self, job_id: str) -> Optional[GenerationJob]:
+        try:
+            if not ObjectId.is_valid(job_id):
+                return None
+            result = self.collection.find_one({'_id': ObjectId(job_id)})
+            return self._map_to_entity(result) if result else None
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving generation job: {str(e)}")
+
+    def get_all(self) -> List[GenerationJob]:
+        try:
+            return [self._map_to_entity(doc) for doc in self.collection.find()]
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving generation jobs: {str(e)}")
+
+    def get_all_by_user(self, user_id: str, limit: int = 50) -> List[GenerationJob]:
+        """Get a user's most recent jobs"""
+        try:
+            results = self.collection.find({'user_id': user_id}).sort('created_at', -1).limit(limit)
+            return [self._map_to_entity(doc) for doc in results]
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving user generation jobs: {str(e)}")
+
+    def add(self, job: GenerationJob) -> GenerationJob:
+        try:
+            job_dict = job.model_dump(exclude={'id'})
+            result = self.collection.insert_one(job_dict)
+            job.id = str(result.inserted_id)
+            return job
+        except Exception as e:
+            raise DatabaseError(f"Error adding generation job: {str(e)}")
+
+    def update(self, job: GenerationJob) -> bool:
+        try:
+            job_dict = job.model_dump(exclude={'id'})
+            job_dict['updated_at'] = datetime.now(timezone.utc)
+            result = self.collection.update_one({'_id': ObjectId(job.id)}, {'$set': job_dict})
+            return result.modified_count > 0
+        except Exception as e:
+            raise DatabaseError(f"Error updating generation job: {str(e)}")
+
+    def delete(self, job_id: str) -> bool:
+        try:
+            result = self.collection.delete_one({'_id': ObjectId(job_id)})
+            return result.deleted_count > 0
+        except Exception as e:
+            raise DatabaseError(f"Error deleting generation job: {str(e)}")
+
+    def exists(self, job_id: str) -> bool:
+        try:
+            if not ObjectId.is_valid(job_id):
+                return False
+            return self.collection.count_documents({'_id': ObjectId(job_id)}) > 0
+        except Exception as e:
+            raise DatabaseError(f"Error checking generation job existence: {str(e)}")
+
+    def lease(self, worker_id: str, lease_seconds: float, job_id: Optional[str] = None) -> Optional[GenerationJob]:
+        """
+        Atomically claim the oldest runnable job, or a specific one.
+
+        Queued jobs past their retry delay and running jobs whose lease has expired (their
+        worker stopped heartbeating) are runnable. Claiming one marks it running, owned by
+        ``worker_id`` until the lease expires, and counts an attempt.
+
+        Args:
+            worker_id: Id of the claiming worker
+            lease_seconds: How long the claim lasts without a heartbeat
+            job_id: Claim only this job
+
+        Returns:
+            Optional[GenerationJob]: The leased job, or None if nothing was runnable
+        """
+        try:
+            self._ensure_queue_indexes()
+            now = datetime.now(timezone.utc)
+            query: Dict[str, Any] = {'$or': [
+                {'status': JobStatus.QUEUED.value,
+                 '$or': [{'available_at': None}, {'available_at': {'$lte': now}}]},
+                {'status': JobStatus.RUNNING.value, 'lease_expires_at': {'$lt': now}},
+            ]}
+            if job_id:
+                if not ObjectId.is_valid(job_id):
+                    return None
+                query['_id'] = ObjectId(job_id)
+            result = self.collection.find_one_and_update(
+                query,
+                {'$set': {
+                    'status': JobStatus.RUNNING.value,
+                    'worker_id': worker_id,
+                    'lease_expires_at': now + timedelta(seconds=lease_seconds),
+                    'started_at': now,
+                    'updated_at': now
+                }, '$inc': {'attempts': 1}},
+                sort=[('created_at', 1)],
+                return_document=ReturnDocument.AFTER
+            )
+            return self._map_to_entity(result) if result else None
+        except Exception as e:
+            raise DatabaseError(f"Error leasing generation job: {str(e)}")
+
+    def heartbeat(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        """Extend a running job's lease; False if the worker no longer owns it."""
+        lease_expires_at = datetime.now(timezone.utc) + timedelta(seconds=lease_seconds)
+        return self._set(job_id, {'lease_expires_at': lease_expires_at},
+                         expected_status=JobStatus.RUNNING.value, worker_id=worker_id)
+
+    def retry_later(self, job_id: str, worker_id: str, error: str, delay_seconds: float) -> bool:
+        """Put a failed attempt back in the queue, runnable again after ``delay_seconds``."""
+        available_at = datetime.now(timezone.utc) + timedelta(seconds=delay_seconds)
+        return self._set(job_id, {
+            'status': JobStatus.QUEUED.value,
+            'error': error,
+            'worker_id': None,
+            'lease_expires_at': None,
+            'available_at': available_at
+        }, expected_status=JobStatus.RUNNING.value, worker_id=worker_id)
+
+    def update_progress(self, job_id: str, message: str, progress: float, worker_id: Optional[str] = None) -> bool:
+        """Record the latest (message, progress) of a running job"""
+        return self._set(job_id, {'message': message, 'progress': progress},
+                         expected_status=JobStatus.RUNNING.value, worker_id=worker_id)
+
+    def mark_succeeded(self, job_id: str, resume_id: Optional[str], message: str = "",
+                       worker_id: Optional[str] = None) -> bool:
+        """Finish a job; with ``worker_id``, only if that worker still holds its lease."""
+        now = datetime.now(timezone.utc)
+        return self._set(job_id, {
+            'status': JobStatus.SUCCEEDED.value,
+            'progress': 1.0,
+            'message': message,
+            'resume_id': resume_id,
+            'error': None,
+            'lease_expires_at': None,
+            'finished_at': now
+        }, worker_id=worker_id)
+
+    def mark_failed(self, job_id: str, error: str, worker_id: Optional[str] = None) -> bool:
+        """Fail a job; with ``worker_id``, only if that worker still holds its lease."""
+        now = datetime.now(timezone.utc)
+        return self._set(job_id, {'status': JobStatus.FAILED.value, 'error': error,
+                                  'lease_expires_at': None, 'finished_at': now}, worker_id=worker_id)
+
+    def add_event(self, job_id: str, event_type: str, data: Dict[str, Any]) -> str:
+        """
+        Append a streamable event (progress, section, done, error) to a job.
+
+        Returns:
+            str: Event id; ids increase in the order events are written
+        """
+        try:
+            self._ensure_event_indexes()
+            result = self.events.insert_one({
+                'job_id': job_id,
+                'type': event_type,
+                'data': data,
+                'created_at': datetime.now(timezone.utc)
+            })
+            return str(result.inserted_id)
+        except Exception as e:
+            raise DatabaseError(f"Error adding generation job event: {str(e)}")
+
+    def get_events(self, job_id: str, after: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get a job's events in order, optionally only those after a given event id"""
+        try:
+            query: Dict[str, Any] = {'job_id': job_id}
+            if after and ObjectId.is_valid(after):
+                query['_id'] = {'$gt': ObjectId(after)}
+            return [
+                {'id': str(doc['_id']), 'type': doc['type'], 'data': doc['data']}
+                for doc in self.events.find(query).sort('_id', 1)
+            ]
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving generation job events: {str(e)}")
+
+    def _ensure_event_indexes(self) -> None:
+        if not MongoJobRepository._event_indexes_created:
+            self.events.create_index([('job_id', 1), ('_id', 1)])
+            self.events.create_index('created_at', expireAfterSeconds=JobConfig.get_generation_job_config().event_ttl_seconds)
+            MongoJobRepository._event_indexes_created = True
+
+    def _ensure_queue_indexes(self) -> None:
+        if not MongoJobRepository._queue_indexes_created:
+            self.collection.create_index([('status', 1), ('created_at', 1)])
+            self.collection.create_index([('status', 1), ('lease_expires_at', 1)])
+            MongoJobRepository._queue_indexes_created = True
+
+    def _set(self, job_id: str, fields: Dict[str, Any], expected_status: Optional[str] = None,
+             worker_id: Optional[str] = None) -> bool:
+        try:
+            query = {'_id': ObjectId(job_id)}
+            if expected_status:
+                query['status'] = expected_status
+            if worker_id:
+                query['worker_id'] = worker_id
+            fields['updated_at'] = datetime.now(timezone.utc)
+            result = self.collection.update_one(query, {'$set': fields})
+            return result.matched_count > 0
+        except Exception as e:
+            raise DatabaseError(f"Error updating generation job: {str(e)}")
+
+    def _map_to_entity(self, doc: dict) -> GenerationJob:
+        if doc:
+            doc['_id'] = str(doc['_id'])
+            return GenerationJob.model_validate(doc)
+        return None
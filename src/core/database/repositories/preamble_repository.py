@@ -3,7 +3,7 @@ from bson import ObjectId
 from ...exceptions.database_exceptions import DatabaseError
 from ..interfaces.repository_interface import BaseRepository
 from ..models.preamble import Preamble
-from datetime import datetime
+from datetime import datetime, timezone
 
 class MongoPreambleRepository(BaseRepository[Preamble]):
     def __init__(self, connection):
@@ -27,6 +27,7 @@ class MongoPreambleRepository(BaseRepository[Preamble]):
     def add(self, preamble: Preamble) -> Preamble:
         try:
             preamble_dict = preamble.dict(exclude={'id'})
+            preamble_dict['updated_at'] = datetime.now(timezone.utc)
             result = self.collection.insert_one(preamble_dict)
             preamble.id = str(result.inserted_id)
             return preamble
@@ -36,6 +37,7 @@ class MongoPreambleRepository(BaseRepository[Preamble]):
     def update(self, preamble: Preamble) -> bool:
         try:
             preamble_dict = preamble.dict(exclude={'id'})
+            preamble_dict['updated_at'] = datetime.now(timezone.utc)
             result = self.collection.update_one(
                 {'_id': ObjectId(preamble.id)},
                 {'$set': preamble_dict}
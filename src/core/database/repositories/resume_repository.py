@@ -1,9 +1,9 @@
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 from bson import ObjectId
 from datetime import datetime, timezone
 from ...exceptions.database_exceptions import DatabaseError
 from ..interfaces.repository_interface import BaseRepository
-from ..models.resume import Resume
+from ..models.resume import Resume, RESUME_SECTIONS
 import logging
 
 logger = logging.getLogger(__name__)
@@ -24,6 +24,16 @@ class MongoResumeRepository(BaseRepository[Resume]):
         except Exception as e:
             raise DatabaseError(f"Error retrieving resume: {str(e)}")
 
+    def get_sections(self, resume_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+        """Get a user's resume sections and their section_fingerprints, without loading the PDFs"""
+        try:
+            if not ObjectId.is_valid(resume_id):
+                return None
+            projection = {'_id': 0, 'section_fingerprints': 1, **{section: 1 for section in RESUME_SECTIONS}}
+            return self.collection.find_one({'_id': ObjectId(resume_id), 'user_id': user_id}, projection)
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving resume sections: {str(e)}")
+
     def get_all_by_user(self, user_id: str) -> List[Resume]:
         """Get all resumes for a specific user"""
         try:
@@ -0,0 +1,111 @@
+from typing import Optional, List, Dict, Any
+from bson import ObjectId
+from datetime import datetime, timezone
+from ...exceptions.database_exceptions import DatabaseError
+from ..interfaces.repository_interface import BaseRepository
+from ..models.generation_run import GenerationRun, RunStatus
+from config.job_config import JobConfig
+import logging
+
+logger = logging.getLogger(__name__)
+
+class MongoRunRepository(BaseRepository[GenerationRun]):
+    _indexes_created = False
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.collection = self.connection.db[JobConfig.get_generation_job_config().runs_collection]
+
+    def get_by_id(self, run_id: str) -> Optional[GenerationRun]:
+        try:
+            if not ObjectId.is_valid(run_id):
+                return None
+            result = self.collection.find_one({'_id': ObjectId(run_id)})
+            return self._map_to_entity(result) if result else None
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving generation run: {str(e)}")
+
+    def get_all(self) -> List[GenerationRun]:
+        try:
+            return [self._map_to_entity(doc) for doc in self.collection.find()]
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving generation runs: {str(e)}")
+
+    def add(self, run: GenerationRun) -> GenerationRun:
+        """Store a new run; a preset id (e.g. the id of the job running it) is kept."""
+        try:
+            self._ensure_indexes()
+            run_dict = run.model_dump(exclude={'id'})
+            if run.id:
+                run_dict['_id'] = ObjectId(run.id)
+            result = self.collection.insert_one(run_dict)
+            run.id = str(result.inserted_id)
+            return run
+        except Exception as e:
+            raise DatabaseError(f"Error adding generation run: {str(e)}")
+
+    def update(self, run: GenerationRun) -> bool:
+        try:
+            run_dict = run.model_dump(exclude={'id'})
+            run_dict['updated_at'] = datetime.now(timezone.utc)
+            result = self.collection.update_one({'_id': ObjectId(run.id)}, {'$set': run_dict})
+            return result.modified_count > 0
+        except Exception as e:
+            raise DatabaseError(f"Error updating generation run: {str(e)}")
+
+    def delete(self, run_id: str) -> bool:
+        try:
+            result = self.collection.delete_one({'_id': ObjectId(run_id)})
+            return result.deleted_count > 0
+        except Exception as e:
+            raise DatabaseError(f"Error deleting generation run: {str(e)}")
+
+    def exists(self, run_id: str) -> bool:
+        try:
+            if not ObjectId.is_valid(run_id):
+                return False
+            return self.collection.count_documents({'_id': ObjectId(run_id)}) > 0
+        except Exception as e:
+            raise DatabaseError(f"Error checking generation run existence: {str(e)}")
+
+    def save_section(self, run_id: str, section: str, content: str, fingerprint: Optional[str] = None) -> bool:
+        """Checkpoint one finished section; sections finishing concurrently never overwrite each other"""
+        fields = {f'sections.{section}': content}
+        if fingerprint:
+            fields[f'section_fingerprints.{section}'] = fingerprint
+        return self._set(run_id, fields)
+
+    def set_resume(self, run_id: str, resume_id: str) -> bool:
+        """Record the compiled and saved resume of a run"""
+        return self._set(run_id, {'resume_id': resume_id})
+
+    def mark_cover_letter_done(self, run_id: str) -> bool:
+        return self._set(run_id, {'cover_letter_done': True})
+
+    def mark_running(self, run_id: str) -> bool:
+        return self._set(run_id, {'status': RunStatus.RUNNING.value, 'error': None})
+
+    def mark_succeeded(self, run_id: str) -> bool:
+        return self._set(run_id, {'status': RunStatus.SUCCEEDED.value, 'error': None})
+
+    def mark_failed(self, run_id: str, error: str) -> bool:
+        return self._set(run_id, {'status': RunStatus.FAILED.value, 'error': error})
+
+    def _ensure_indexes(self) -> None:
+        if not MongoRunRepository._indexes_created:
+            self.collection.create_index('created_at', expireAfterSeconds=JobConfig.get_generation_job_config().run_ttl_seconds)
+            MongoRunRepository._indexes_created = True
+
+    def _set(self, run_id: str, fields: Dict[str, Any]) -> bool:
+        try:
+            fields['updated_at'] = datetime.now(timezone.utc)
+            result = self.collection.update_one({'_id': ObjectId(run_id)}, {'$set': fields})
+            return result.matched_count > 0
+        except Exception as e:
+            raise DatabaseError(f"Error updating generation run: {str(e)}")
+
+    def _map_to_entity(self, doc: dict) -> GenerationRun:
+        if doc:
+            doc['_id'] = str(doc['_id'])
+            return GenerationRun.model_validate(doc)
+        return None
@@ -24,6 +24,14 @@ class MongoTexHeaderRepository(BaseRepository[TexHeader]):
         except Exception as e:
             raise DatabaseError(f"Error retrieving all tex headers: {str(e)}")
 
+    def get_by_name(self, name: str) -> Optional[TexHeader]:
+        """Get a tex header by its name"""
+        try:
+            result = self.collection.find_one({'name': name})
+            return self._map_to_entity(result) if result else None
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving tex header by name: {str(e)}")
+
     def add(self, tex_header: TexHeader) -> TexHeader:
         try:
             header_dict = tex_header.model_dump(exclude={'id'})
@@ -61,6 +61,44 @@ class MongoUserRepository(BaseRepository[User]):
         )
         return result.get('preferences') if result else None
 
+    def get_with_documents(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a user together with its portfolio and profile documents in one round trip.
+
+        Args:
+            user_id: The user_id field or the _id of the user
+
+        Returns:
+            Optional[Dict[str, Any]]: Raw user document with ``portfolio`` and ``profile``
+            embedded (None when missing), or None if the user does not exist
+        """
+        match = {'user_id': user_id}
+        if ObjectId.is_valid(user_id):
+            match = {'$or': [match, {'_id': ObjectId(user_id)}]}
+
+        pipeline = [
+            {'$match': match},
+            {'$limit': 1},
+            {'$lookup': {
+                'from': 'portfolios',
+                'localField': 'user_id',
+                'foreignField': 'user_id',
+                'as': 'portfolio'
+            }},
+            {'$lookup': {
+                'from': 'profiles',
+                'localField': 'user_id',
+                'foreignField': 'user_id',
+                'as': 'profile'
+            }}
+        ]
+        result = next(iter(self.collection.aggregate(pipeline)), None)
+        if not result:
+            return None
+        result['portfolio'] = result['portfolio'][0] if result['portfolio'] else None
+        result['profile'] = result['profile'][0] if result['profile'] else None
+        return result
+
     def get_by_id(self, id: Any) -> Optional[User]:
         """Get user by ID."""
         result = self.collection.find_one({'_id': ObjectId(id)})
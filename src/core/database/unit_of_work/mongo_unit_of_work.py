@@ -1,14 +1,24 @@
 """MongoDB unit of work module."""
 
-from typing import Optional
+from typing import Optional, Tuple
 from ..connections.mongo_connection import MongoConnection, AsyncMongoConnection
+from ..models import User, Portfolio, Profile
 from ..repositories import (
     PortfolioRepository,
     ProfileRepository,
     ResumeRepository,
     PreambleRepository,
     TexHeaderRepository,
-    UserRepository
+    UserRepository,
+    JobRepository,
+    RunRepository,
+    AsyncPortfolioRepository,
+    AsyncProfileRepository,
+    AsyncResumeRepository,
+    AsyncPreambleRepository,
+    AsyncTexHeaderRepository,
+    AsyncUserRepository,
+    AsyncJobRepository
 )
 
 class MongoUnitOfWork:
@@ -23,6 +33,8 @@ class MongoUnitOfWork:
         self.resumes = ResumeRepository(connection)
         self.preambles = PreambleRepository(connection)
         self.tex_headers = TexHeaderRepository(connection)
+        self.jobs = JobRepository(connection)
+        self.runs = RunRepository(connection)
     
     def get_cover_letter_preamble(self) -> Optional[str]:
         """Get cover letter preamble."""
@@ -43,6 +55,29 @@ class MongoUnitOfWork:
         """Get TeX header."""
         header = self.tex_headers.get_latest()
         return header.content if header else None
+
+    def get_last_resume_id(self, user_id: str) -> Optional[str]:
+        """Get the id of the user's most recent resume."""
+        resume = self.resumes.get_latest_resume(user_id)
+        return resume.id if resume else None
+
+    def get_user_documents(self, user_id: str) -> Tuple[Optional[User], Optional[Portfolio], Optional[Profile]]:
+        """
+        Get a user's account, portfolio and profile, batched into a single query when possible.
+
+        Falls back to separate portfolio and profile lookups when there is no user document
+        (e.g. the Streamlit test user).
+        """
+        doc = self.users.get_with_documents(user_id)
+        if not doc:
+            return None, self.portfolios.get_by_user_id(user_id), self.profiles.get_by_user_id(user_id)
+
+        portfolio_doc = doc.pop('portfolio')
+        profile_doc = doc.pop('profile')
+        user = User.model_validate(self.users._prepare_for_validation(doc))
+        portfolio = self.portfolios._map_to_entity(portfolio_doc) if portfolio_doc else None
+        profile = self.profiles._map_to_entity(profile_doc) if profile_doc else None
+        return user, portfolio, profile
         
     def __enter__(self) -> 'MongoUnitOfWork':
         """Enter the unit of work context."""
@@ -69,12 +104,13 @@ class AsyncMongoUnitOfWork:
     def __init__(self, connection: AsyncMongoConnection):
         """Initialize AsyncMongoUnitOfWork with a database connection."""
         self.connection = connection
-        self.users = UserRepository(connection)
-        self.portfolios = PortfolioRepository(connection)
-        self.profiles = ProfileRepository(connection)
-        self.resumes = ResumeRepository(connection)
-        self.preambles = PreambleRepository(connection)
-        self.tex_headers = TexHeaderRepository(connection)
+        self.users = AsyncUserRepository(connection)
+        self.portfolios = AsyncPortfolioRepository(connection)
+        self.profiles = AsyncProfileRepository(connection)
+        self.resumes = AsyncResumeRepository(connection)
+        self.preambles = AsyncPreambleRepository(connection)
+        self.tex_headers = AsyncTexHeaderRepository(connection)
+        self.jobs = AsyncJobRepository(connection)
     
     async def get_cover_letter_preamble(self) -> Optional[str]:
         """Get cover letter preamble asynchronously."""
@@ -95,6 +131,11 @@ class AsyncMongoUnitOfWork:
         """Get TeX header asynchronously."""
         header = await self.tex_headers.get_latest()
         return header.content if header else None
+
+    async def get_last_resume_id(self, user_id: str) -> Optional[str]:
+        """Get the id of the user's most recent resume asynchronously."""
+        resume = await self.resumes.get_latest_resume(user_id)
+        return resume.id if resume else None
         
     async def __aenter__(self) -> 'AsyncMongoUnitOfWork':
         """Enter the async unit of work context."""
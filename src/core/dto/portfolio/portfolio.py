@@ -27,14 +27,18 @@ class PortfolioDTO:
     @classmethod
     def from_db_models(cls, portfolio: Portfolio, profile: Profile):
         """Create DTO from both Portfolio and Profile models"""
+        info = profile.personal_information
+        name, phone, email, linkedin, github, address, website = LatexEscaper.escape_many(
+            info.get(key, '') for key in ('full_name', 'phone', 'email', 'linkedin', 'github', 'address', 'website')
+        )
         return cls(
-            name=LatexEscaper.escape_text(profile.personal_information.get('full_name', '')),
-            phone=LatexEscaper.escape_text(profile.personal_information.get('phone', '')),
-            email=LatexEscaper.escape_text(profile.personal_information.get('email', '')),
-            linkedin=LatexEscaper.escape_text(profile.personal_information.get('linkedin', '')),
-            github=LatexEscaper.escape_text(profile.personal_information.get('github', '')),
-            address=LatexEscaper.escape_text(profile.personal_information.get('address', '')),
-            website=LatexEscaper.escape_text(profile.personal_information.get('website', '')),
+            name=name,
+            phone=phone,
+            email=email,
+            linkedin=linkedin,
+            github=github,
+            address=address,
+            website=website,
             career_summary=portfolio.career_summary,
             work_experience=portfolio.work_experience,
             skills=portfolio.skills,
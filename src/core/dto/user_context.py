@@ -0,0 +1,84 @@
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional
+import logging
+
+from src.core.database.factory import get_unit_of_work
+from src.core.database.models.user import User
+from src.core.database.models.portfolio import Portfolio
+from src.core.database.models.profile import Profile
+from src.core.dto.portfolio.portfolio import PortfolioDTO
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class UserContext:
+    """
+    Immutable per-request snapshot of everything generation needs to know about a user.
+
+    Loaded once per generation and shared by the generators, loaders and compilers so
+    none of them have to query MongoDB for user data on their own.
+    """
+    user_id: str
+    portfolio: Portfolio
+    profile: Profile
+    portfolio_dto: PortfolioDTO
+    user: Optional[User] = None
+    preferences: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, user_id: str) -> 'UserContext':
+        """
+        Load user, preferences, portfolio and profile for a user.
+
+        Args:
+            user_id: The user ID (either user_id or _id)
+
+        Returns:
+            UserContext: The loaded snapshot
+
+        Raises:
+            ValueError: If portfolio or profile is not found for the user
+        """
+        with get_unit_of_work() as uow:
+            user, portfolio, profile = uow.get_user_documents(user_id)
+
+        if not portfolio:
+            raise ValueError(f"Portfolio not found for user {user_id}")
+        if not profile:
+            raise ValueError(f"Profile not found for user {user_id}")
+
+        preferences = user.preferences.model_dump() if user and user.preferences else {}
+        logger.debug(f"Loaded user context for user {user_id}")
+        return cls(
+            user_id=user_id,
+            portfolio=portfolio,
+            profile=profile,
+            portfolio_dto=PortfolioDTO.from_db_models(portfolio, profile),
+            user=user,
+            preferences=preferences
+        )
+
+    @property
+    def feature_preferences(self) -> Dict[str, Any]:
+        """Get feature flags from the user's preferences."""
+        return self.preferences.get('feature_preferences', {})
+
+    @property
+    def life_story(self) -> Optional[str]:
+        """Get the user's life story, if any."""
+        return self.profile.life_story or getattr(self.user, 'life_story', None)
+
+    @property
+    def signature(self) -> Optional[bytes]:
+        """Get the raw signature image bytes, if the user has uploaded one."""
+        if self.profile.signature and self.profile.signature.image:
+            return bytes(self.profile.signature.image)
+        return None
+
+    @property
+    def personal_information(self) -> Dict[str, str]:
+        """Get the user's unescaped personal information."""
+        info = dict(self.profile.personal_information)
+        info.setdefault('name', info.get('full_name', ''))
+        return info
@@ -0,0 +1,246 @@
+"""
+Generate resumes / cover letters for many job descriptions in one run.
+
+    python -m src.generator.batch jobs.jsonl --user-id <id> [--type both] [--concurrency 4]
+
+The input is JSONL (one ``{"id": ..., "job_description": ...}`` object or JSON string
+per line) or CSV with a ``job_description`` column and an optional ``id`` column.
+Results stream to a JSONL manifest, one line per job as it finishes.
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from config.job_config import JobConfig
+from src.core.database.models import Resume
+from src.core.dto.user_context import UserContext
+from src.generator.generator_manager import GenerationType, GeneratorManager
+from src.generator.utils.job_info import JobInfo
+from src.generator.utils.output_manager import OutputManager
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def job_fingerprint(job_description: str) -> str:
+    """Hash of a posting ignoring case and whitespace, so reposted copies compare equal."""
+    normalized = _WHITESPACE.sub(' ', job_description).strip().casefold()
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+
+@dataclass
+class BatchItem:
+    """One job description of a batch."""
+    id: str
+    job_description: str
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one batch item, as written to the manifest."""
+    id: str
+    status: str  # succeeded, failed or duplicate
+    seconds: float = 0.0
+    company_name: Optional[str] = None
+    job_title: Optional[str] = None
+    resume_id: Optional[str] = None
+    output_dir: Optional[str] = None
+    duplicate_of: Optional[str] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class BatchSummary:
+    """Totals of a batch run."""
+    total: int
+    succeeded: int
+    failed: int
+    duplicates: int
+    seconds: float
+
+    @property
+    def jobs_per_minute(self) -> float:
+        return (self.succeeded + self.failed) * 60 / self.seconds if self.seconds else 0.0
+
+
+def load_batch(path: Path) -> List[BatchItem]:
+    """
+    Read job descriptions from a JSONL or CSV file.
+
+    Items without an id are numbered by their line / row; blank descriptions are skipped.
+
+    Raises:
+        ValueError: If a line is neither a JSON string nor an object with ``job_description``
+    """
+    items = []
+    if path.suffix.lower() == '.csv':
+        with path.open(newline='', encoding='utf-8') as f:
+            rows = [(row.get('id'), row.get('job_description')) for row in csv.DictReader(f)]
+    else:
+        rows = []
+        for line_number, line in enumerate(path.read_text(encoding='utf-8').splitlines(), start=1):
+            if not line.strip():
+                continue
+            value = json.loads(line)
+            if isinstance(value, str):
+                rows.append((None, value))
+            elif isinstance(value, dict) and 'job_description' in value:
+                rows.append((value.get('id'), value['job_description']))
+            else:
+                raise ValueError(f"Expected a job description on line {line_number} of {path}")
+
+    for number, (item_id, job_description) in enumerate(rows, start=1):
+        if job_description and job_description.strip():
+            items.append(BatchItem(id=str(item_id or number), job_description=job_description))
+    return items
+
+
+def dedupe(items: List[BatchItem]) -> Tuple[List[BatchItem], Dict[str, str]]:
+    """
+    Drop repeated postings.
+
+    Returns:
+        Tuple[List[BatchItem], Dict[str, str]]: The first occurrence of each posting, and
+        the id of every duplicate mapped to the id of the item it repeats
+    """
+    first_by_fingerprint: Dict[str, str] = {}
+    unique, duplicates = [], {}
+    for item in items:
+        fingerprint = job_fingerprint(item.job_description)
+        if fingerprint in first_by_fingerprint:
+            duplicates[item.id] = first_by_fingerprint[fingerprint]
+        else:
+            first_by_fingerprint[fingerprint] = item.id
+            unique.append(item)
+    return unique, duplicates
+
+
+class BatchGenerator:
+    """
+    Runs the generation pipeline for many job descriptions of one user.
+
+    The user context is loaded once and shared by every job. Up to ``concurrency`` jobs
+    run their LLM stage at once; their LaTeX compiles go through the shared, bounded
+    compile service. Every job's requests count against the provider's process-wide
+    rate limits and in-flight cap, so more jobs do not mean more requests in flight.
+    """
+
+    def __init__(self, user_id: str, generation_type: GenerationType = GenerationType.RESUME,
+                 concurrency: Optional[int] = None, options: Optional[Dict[str, Any]] = None):
+        self.user_id = user_id
+        self.generation_type = generation_type
+        self.concurrency = concurrency or JobConfig.get_generation_job_config().batch_concurrency
+        self.options = {k: v for k, v in (options or {}).items() if v is not None}
+
+    def run(self, items: List[BatchItem], manifest_path: Path) -> BatchSummary:
+        """
+        Generate every unique item, appending a manifest line as each one finishes.
+
+        Args:
+            items: Job descriptions to generate for
+            manifest_path: JSONL file the results are written to (overwritten)
+
+        Returns:
+            BatchSummary: Counts and the wall-clock time of the run
+        """
+        started = time.monotonic()
+        unique, duplicates = dedupe(items)
+        context = UserContext.load(self.user_id)
+        logger.info(f"Batch of {len(items)} jobs ({len(duplicates)} duplicates) "
+                    f"for user {self.user_id}, {self.concurrency} at a time")
+
+        counts = {'succeeded': 0, 'failed': 0, 'duplicate': 0}
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        with manifest_path.open('w', encoding='utf-8') as manifest:
+            def write(result: BatchResult) -> None:
+                counts[result.status] += 1
+                manifest.write(json.dumps(asdict(result), ensure_ascii=False) + '\n')
+                manifest.flush()
+
+            for item_id, original_id in duplicates.items():
+                write(BatchResult(id=item_id, status='duplicate', duplicate_of=original_id))
+
+            with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="batch-job") as executor:
+                futures = [executor.submit(self._run_one, item, context) for item in unique]
+                for done, future in enumerate(as_completed(futures), start=1):
+                    result = future.result()
+                    write(result)
+                    logger.info(f"[{done}/{len(unique)}] {result.id} {result.status} in {result.seconds:.1f}s")
+
+        return BatchSummary(total=len(items), succeeded=counts['succeeded'], failed=counts['failed'],
+                            duplicates=counts['duplicate'], seconds=time.monotonic() - started)
+
+    def _run_one(self, item: BatchItem, context: UserContext) -> BatchResult:
+        started = time.monotonic()
+        result = BatchResult(id=item.id, status='succeeded')
+        try:
+            llm_preferences = context.preferences.get('llm_preferences', {})
+            manager = GeneratorManager(self.user_id)
+            manager.configure_llm(
+                model_type=self.options.get('model_type', llm_preferences.get('model_type')),
+                model_name=self.options.get('model_name', llm_preferences.get('model_name')),
+                temperature=self.options.get('temperature', llm_preferences.get('temperature'))
+            )
+            job_info = JobInfo.extract_from_description(item.job_description, manager.llm_runner)
+            output_manager = OutputManager(job_info)
+            result.company_name, result.job_title = job_info.company_name, job_info.job_title
+            result.output_dir = str(output_manager.output_dir)
+
+            for output in manager.generate(
+                generation_type=self.generation_type,
+                job_description=item.job_description,
+                selected_sections=self.options.get('selected_sections',
+                                                   context.preferences.get('section_preferences', {})),
+                output_manager=output_manager,
+                use_cache=self.options.get('use_cache'),
+                resume_id=self.options.get('resume_id'),
+                user_context=context
+            ):
+                if isinstance(output, Resume):
+                    result.resume_id = output.id
+        except Exception as e:
+            logger.error(f"Batch job {item.id} failed: {e}", exc_info=True)
+            result.status, result.error = 'failed', str(e)
+        result.seconds = round(time.monotonic() - started, 3)
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('input', type=Path, help="JSONL or CSV file of job descriptions")
+    parser.add_argument('--user-id', required=True, help="user whose portfolio and preferences are used")
+    parser.add_argument('--type', choices=[t.value for t in GenerationType], default=GenerationType.RESUME.value)
+    parser.add_argument('--concurrency', type=int, help="jobs generated in parallel")
+    parser.add_argument('--manifest', type=Path, help="results file (default: <input>.results.jsonl)")
+    parser.add_argument('--model-type', help="LLM provider, overrides the user's preference")
+    parser.add_argument('--model-name', help="LLM model, overrides the user's preference")
+    parser.add_argument('--temperature', type=float, help="overrides the user's preference")
+    parser.add_argument('--no-cache', action='store_true', help="ignore cached section output")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    generator = BatchGenerator(args.user_id, GenerationType(args.type), args.concurrency, {
+        'model_type': args.model_type,
+        'model_name': args.model_name,
+        'temperature': args.temperature,
+        'use_cache': False if args.no_cache else None
+    })
+    manifest = args.manifest or args.input.with_suffix('.results.jsonl')
+    summary = generator.run(load_batch(args.input), manifest)
+    print(f"{summary.succeeded} succeeded, {summary.failed} failed, {summary.duplicates} duplicates "
+          f"of {summary.total} in {summary.seconds:.1f}s ({summary.jobs_per_minute:.1f} jobs/min); "
+          f"results in {manifest}")
+
+
+if __name__ == '__main__':
+    main()
@@ -5,9 +5,12 @@ from datetime import datetime, timezone
 from src.llms.runner import LLMRunner
 from src.latex.cover_letter.cover_letter_compiler import CoverLetterLatexCompiler
 from src.loaders.prompt_loader import PromptLoader
-from .utils.string_utils import ensure_string
+from .utils.prompt_serializer import serialize_cover_letter_context
 from src.core.database.factory import get_unit_of_work
+from src.core.dto.user_context import UserContext
 from src.generator.utils.output_manager import OutputManager
+from src.generator.utils.section_cache import SectionCache, get_section_cache
+from config.cache_config import CacheConfig
 from src.core.database.models import Resume
 
 logger = logging.getLogger(__name__)
@@ -15,13 +18,17 @@ logger = logging.getLogger(__name__)
 class CoverLetterGenerator:
     """A class for generating cover letters based on job descriptions and resume data."""
 
-    def __init__(self, llm_runner: LLMRunner, user_id: str):
+    def __init__(self, llm_runner: LLMRunner, user_id: str, user_context: Optional[UserContext] = None,
+                 use_cache: Optional[bool] = None):
         """Initialize the CoverLetterGenerator with necessary parts."""
         self.llm_runner = llm_runner
         self.user_id = user_id
-        self.prompt_loader = PromptLoader(user_id=user_id)
+        self.user_context = user_context or UserContext.load(user_id)
+        self.prompt_loader = PromptLoader(user_id=user_id, user_context=self.user_context)
         self.uow = get_unit_of_work()
         self.latex_compiler = CoverLetterLatexCompiler()
+        self.section_cache = get_section_cache()
+        self.use_cache = CacheConfig.get_section_cache_config().enabled if use_cache is None else use_cache
 
     def generate_cover_letter(self, job_description: str, resume_id: str, output_manager: OutputManager) -> str:
         """Generate a cover letter based on the given job description and resume data."""
@@ -48,7 +55,8 @@ class CoverLetterGenerator:
                 content=cover_letter_content,
                 output_manager=output_manager,
                 user_id=self.user_id,
-                resume_id=resume_id
+                resume_id=resume_id,
+                user_context=self.user_context
             )
             logger.debug("PDF generation complete")
             
@@ -84,22 +92,17 @@ class CoverLetterGenerator:
 
         # If no resume_id, create minimal resume data
         if not resume_id:
-            with self.uow:
-                portfolio = self.uow.portfolios.get_by_user_id(self.user_id)
-                if not portfolio:
-                    return "No portfolio found for user"
-                
-                minimal_resume = {
-                    'personal_information': portfolio.personal_information,
-                    'career_summary': "",
-                    'skills': "",
-                    'work_experience': "",
-                    'education': "",
-                    'projects': "",
-                    'awards': "",
-                    'publications': ""
-                }
-                return minimal_resume, None
+            minimal_resume = {
+                'personal_information': self.user_context.personal_information,
+                'career_summary': "",
+                'skills': "",
+                'work_experience': "",
+                'education': "",
+                'projects': "",
+                'awards': "",
+                'publications': ""
+            }
+            return minimal_resume, None
 
         # If resume_id exists, get resume data
         with self.uow:
@@ -115,11 +118,26 @@ class CoverLetterGenerator:
 
     def _generate_content(self, resume_data: dict, job_description: str) -> str:
         """Generate cover letter content using AI."""
-        resume_data = ensure_string(resume_data)
+        resume_data = serialize_cover_letter_context(resume_data)
         cover_letter_prompt = self.prompt_loader.get_cover_letter_prompt()
-        return self.llm_runner.generate_content(
+
+        config = self.llm_runner.get_config()
+        cache_key = SectionCache.make_key(
+            cover_letter_prompt, resume_data, job_description,
+            config['type'], config['model'], config['temperature']
+        )
+        if self.use_cache:
+            cached = self.section_cache.get(cache_key)
+            if cached:
+                logger.info(f"Section cache hit for cover letter ({self.section_cache.get_stats()})")
+                return cached
+
+        content = self.llm_runner.generate_content(
             cover_letter_prompt, resume_data, job_description
         )
+        if content:
+            self.section_cache.set(cache_key, content, self.user_id, 'cover_letter')
+        return content
 
     def _get_resume_for_cover_letter(self, resume_id: Optional[str] = None) -> Tuple[Dict[str, Any], Optional[Resume]]:
         """Get the most appropriate resume for cover letter generation."""
@@ -139,12 +157,8 @@ class CoverLetterGenerator:
                 return resume_data, latest_resume
 
             # No resume available, use portfolio data
-            portfolio = self.uow.portfolios.get_by_user_id(self.user_id)
-            if not portfolio:
-                raise ValueError("No portfolio found for user")
-            
             minimal_resume = {
-                'personal_information': portfolio.personal_information,
+                'personal_information': self.user_context.personal_information,
                 'career_summary': "",
                 'skills': "",
                 'work_experience': "",
@@ -1,13 +1,16 @@
 from enum import Enum
-from typing import Dict, Generator, Tuple, Optional
+from typing import Any, Callable, Dict, Generator, Tuple, Optional
 import logging
 
 from src.generator.resume_generator import ResumeGenerator
 from src.generator.cover_letter_generator import CoverLetterGenerator
+from src.generator.utils.job_info import JobInfo
 from src.generator.utils.output_manager import OutputManager
 from src.llms.runner import LLMRunner
 from src.loaders.prompt_loader import PromptLoader
 from src.core.database.factory import get_unit_of_work
+from src.core.database.models import GenerationRun
+from src.core.dto.user_context import UserContext
 from config.settings import FEATURE_FLAGS, APP_CONSTANTS
 from src.generator.utils.job_analysis import check_clearance_requirement
 
@@ -26,6 +29,11 @@ class GeneratorManager:
         self._llm_runner = None
         self._resume_generator = None
         self._cover_letter_generator = None
+        self._user_context: Optional[UserContext] = None
+        self._use_cache: Optional[bool] = None
+        self._llm_settings: Dict[str, Any] = {}
+        self._run: Optional[GenerationRun] = None
+        self.run_id: Optional[str] = None
         logger.debug(f"Initializing GeneratorManager with user_id: {user_id}")
         self._prompt_loader = PromptLoader(user_id=user_id)
 
@@ -37,6 +45,7 @@ class GeneratorManager:
 
     def configure_llm(self, model_type: str, model_name: str, temperature: float):
         """Configure LLM settings based on user input."""
+        self._llm_settings = {'model_type': model_type, 'model_name': model_name, 'temperature': temperature}
         if not self._llm_runner:
             self._llm_runner = LLMRunner.create_with_config(
                 model_type=model_type,
@@ -55,43 +64,79 @@ class GeneratorManager:
     @property
     def resume_generator(self) -> ResumeGenerator:
         if not self._resume_generator:
-            self._resume_generator = ResumeGenerator(self.llm_runner, self.user_id)
+            self._resume_generator = ResumeGenerator(
+                self.llm_runner, self.user_id, self._user_context, use_cache=self._use_cache
+            )
         return self._resume_generator
 
     @property
     def cover_letter_generator(self) -> CoverLetterGenerator:
         if not self._cover_letter_generator:
-            self._cover_letter_generator = CoverLetterGenerator(self.llm_runner, self.user_id)
+            self._cover_letter_generator = CoverLetterGenerator(
+                self.llm_runner, self.user_id, self._user_context, use_cache=self._use_cache
+            )
         return self._cover_letter_generator
 
     def generate(self, 
                 generation_type: GenerationType,
                 job_description: str,
                 selected_sections: Dict[str, str],
-                output_manager: OutputManager) -> Generator[Tuple[str, float], None, None]:
-        """Generate content based on the specified type."""
+                output_manager: OutputManager,
+                use_cache: Optional[bool] = None,
+                resume_id: Optional[str] = None,
+                on_section: Optional[Callable[[str, str], None]] = None,
+                user_context: Optional[UserContext] = None,
+                base_resume_id: Optional[str] = None,
+                run_id: Optional[str] = None,
+                latency_budget: Optional[float] = None) -> Generator[Tuple[str, float], None, None]:
+        """
+        Generate content based on the specified type.
+
+        Yields ``(message, progress)`` tuples, plus the saved Resume once a resume is generated.
+        Set ``use_cache=False`` to force fresh LLM output for this request. ``resume_id`` picks
+        the resume a cover letter is written for; it defaults to the user's latest resume.
+        ``on_section(section, content)`` is called as each resume section is generated.
+        Pass ``user_context`` to reuse a snapshot loaded once for many generations.
+        ``base_resume_id`` regenerates a resume incrementally, copying the sections whose
+        inputs did not change from that resume. ``latency_budget`` caps the resume's section
+        stage in seconds, hardcoding the AI sections that miss it (see ResumeGenerator).
+
+        Every generation checkpoints its finished stages to a run, whose id is set on
+        ``self.run_id``; see ``resume_run``. Passing the ``run_id`` of an earlier attempt
+        continues that run, and a new ``run_id`` starts a run with that id.
+        """
+        self._run, self.run_id = None, None
         try:
-            # Get user preferences for features
-            with get_unit_of_work() as uow:
-                preferences = uow.users.get_preferences(self.user_id)
-                feature_flags = preferences.get('feature_preferences', {}) if preferences else {}
+            # Take a fresh snapshot of the user's data for this run and share it with the generators
+            self._user_context = user_context or UserContext.load(self.user_id)
+            self._use_cache = use_cache
+            self._resume_generator = None
+            self._cover_letter_generator = None
+            feature_flags = self._user_context.feature_preferences
 
             # Check clearance if the feature is enabled
             if feature_flags.get('check_clearance', FEATURE_FLAGS['check_clearance']):
                 if check_clearance_requirement(job_description, APP_CONSTANTS['clearance_keywords']):
                     raise ValueError("Cannot generate content for positions requiring security clearance")
 
+            self._run = self._start_run(run_id, generation_type, job_description, selected_sections,
+                                        output_manager, resume_id)
+            self.run_id = self._run.id
+
             # Generate based on type
             if generation_type == GenerationType.RESUME:
-                yield from self._generate_resume(job_description, selected_sections, output_manager)
+                yield from self._generate_resume(job_description, selected_sections, output_manager, on_section,
+                                                 base_resume_id, latency_budget)
             
             elif generation_type == GenerationType.COVER_LETTER:
-                yield from self._generate_cover_letter(job_description, output_manager)
+                yield from self._generate_cover_letter_once(job_description, output_manager,
+                                                            resume_id=self._run.resume_id or resume_id)
             
             elif generation_type == GenerationType.BOTH:
                 resume = None
                 # Generate resume first
-                for result in self._generate_resume(job_description, selected_sections, output_manager):
+                for result in self._generate_resume(job_description, selected_sections, output_manager, on_section,
+                                                    base_resume_id, latency_budget):
                     if isinstance(result, tuple):
                         yield result
                     else:
@@ -99,9 +144,10 @@ class GeneratorManager:
 
                 if not resume:
                     raise ValueError("Resume generation failed")
+                yield resume
 
                 # Then generate cover letter
-                yield from self._generate_cover_letter(
+                yield from self._generate_cover_letter_once(
                     job_description, 
                     output_manager,
                     resume_id=resume.id
@@ -110,19 +156,95 @@ class GeneratorManager:
             # Auto-save if enabled
             if feature_flags.get('auto_save', True):
                 output_manager.save_job_description(job_description)
+            self._update_run(lambda runs: runs.mark_succeeded(self.run_id))
 
         except Exception as e:
             logger.error(f"Generation failed: {str(e)}", exc_info=True)
+            self._update_run(lambda runs: runs.mark_failed(self.run_id, str(e)))
             raise
 
+    def resume_run(self, run_id: str,
+                   on_section: Optional[Callable[[str, str], None]] = None) -> Generator[Tuple[str, float], None, None]:
+        """
+        Continue a failed or interrupted run, redoing only its unfinished stages.
+
+        Sections already checkpointed, the compiled and saved resume and the cover
+        letter are each skipped when an earlier attempt finished them. The run's own LLM
+        settings, job details and output folder are reused. Yields like ``generate``.
+
+        Raises:
+            ValueError: If the run does not exist or belongs to another user
+        """
+        with get_unit_of_work() as uow:
+            run = uow.runs.get_by_id(run_id)
+        if not run or run.user_id != self.user_id:
+            raise ValueError(f"Generation run {run_id} not found")
+
+        logger.info(f"Resuming generation run {run_id} ({run.status}, {len(run.sections)} sections done)")
+        self.configure_llm(**run.llm_settings)
+        job_info = JobInfo(company_name=run.company_name, job_title=run.job_title,
+                           job_description=run.job_description)
+        yield from self.generate(
+            generation_type=GenerationType(run.generation_type),
+            job_description=run.job_description,
+            selected_sections=run.selected_sections,
+            output_manager=OutputManager(job_info, output_dir=run.output_dir),
+            resume_id=run.resume_id,
+            on_section=on_section,
+            run_id=run.id
+        )
+
+    def _start_run(self, run_id: Optional[str], generation_type: GenerationType, job_description: str,
+                   selected_sections: Dict[str, str], output_manager: OutputManager,
+                   resume_id: Optional[str]) -> GenerationRun:
+        """Load the run to continue, or store a new one."""
+        with get_unit_of_work() as uow:
+            run = uow.runs.get_by_id(run_id) if run_id else None
+            if run:
+                if run.user_id != self.user_id:
+                    raise ValueError(f"Generation run {run_id} not found")
+                uow.runs.mark_running(run.id)
+                return run
+
+            job_info = output_manager.get_job_info()
+            return uow.runs.add(GenerationRun(
+                id=run_id,
+                user_id=self.user_id,
+                generation_type=generation_type.value,
+                job_description=job_description,
+                selected_sections=selected_sections,
+                llm_settings=self._llm_settings,
+                company_name=job_info.company_name,
+                job_title=job_info.job_title,
+                output_dir=str(output_manager.output_dir),
+                # A cover letter-only run writes for an existing resume
+                resume_id=resume_id if generation_type == GenerationType.COVER_LETTER else None
+            ))
+
+    def _update_run(self, update: Callable) -> None:
+        if not self.run_id:
+            return
+        try:
+            with get_unit_of_work() as uow:
+                update(uow.runs)
+        except Exception as e:
+            logger.warning(f"Could not update generation run {self.run_id}: {e}")
+
     def _generate_resume(self, job_description: str, selected_sections: Dict[str, str], 
-                        output_manager: OutputManager):
+                        output_manager: OutputManager,
+                        on_section: Optional[Callable[[str, str], None]] = None,
+                        base_resume_id: Optional[str] = None,
+                        latency_budget: Optional[float] = None):
         """Handle resume generation."""
         logger.info("Starting resume generation")
         for result in self.resume_generator.generate_resume(
             job_description=job_description,
             selected_sections=selected_sections,
-            output_manager=output_manager
+            output_manager=output_manager,
+            on_section=on_section,
+            base_resume_id=base_resume_id,
+            run=self._run,
+            latency_budget=latency_budget
         ):
             if isinstance(result, tuple):
                 yield result
@@ -130,6 +252,16 @@ class GeneratorManager:
                 logger.info(f"Resume generated with ID: {result.id}")
                 yield result
 
+    def _generate_cover_letter_once(self, job_description: str, output_manager: OutputManager,
+                                    resume_id: Optional[str] = None):
+        """Generate the run's cover letter unless an earlier attempt of the run already did."""
+        if self._run and self._run.cover_letter_done:
+            logger.info(f"Run {self.run_id} already generated its cover letter")
+            yield "Cover letter generation: already generated", 1.0
+            return
+        yield from self._generate_cover_letter(job_description, output_manager, resume_id=resume_id)
+        self._update_run(lambda runs: runs.mark_cover_letter_done(self.run_id))
+
     def _generate_cover_letter(self, job_description: str, output_manager: OutputManager, 
                              resume_id: Optional[str] = None):
         """Handle cover letter generation."""
@@ -1,8 +1,7 @@
 from typing import Optional, Dict, Any
 from src.latex.utils import LatexEscaper
 from src.loaders.tex_loader import TexLoader
-from src.core.database.factory import get_unit_of_work
-from src.core.dto.portfolio.portfolio import PortfolioDTO
+from src.core.dto.user_context import UserContext
 from src.core.exceptions.database_exceptions import DatabaseError
 import logging
 
@@ -11,27 +10,19 @@ logger = logging.getLogger(__name__)
 class HardcodeSections:
     """Class to handle hardcoded sections from portfolio"""
     
-    def __init__(self, user_id: str):
-        """Initialize with user_id and load portfolio data"""
+    def __init__(self, user_id: str, user_context: Optional[UserContext] = None):
+        """Initialize with user_id and the user's portfolio data"""
         self.user_id = user_id
-        self.portfolio = None
         self.tex_loader = TexLoader()
-        
-        # Load portfolio data
-        with get_unit_of_work() as uow:
-            raw_portfolio = uow.portfolios.get_by_user_id(user_id)
-            raw_profile = uow.profiles.get_by_user_id(user_id)
-            
-            if not raw_portfolio:
-                logger.error(f"Portfolio not found for user {user_id}")
-                raise DatabaseError(f"Portfolio not found for user {user_id}")
-                
-            if not raw_profile:
-                logger.error(f"Profile not found for user {user_id}")
-                raise DatabaseError(f"Profile not found for user {user_id}")
-            
-            self.portfolio = PortfolioDTO.from_db_models(raw_portfolio, raw_profile)
-            logger.debug(f"Loaded portfolio data for user {user_id}")
+
+        try:
+            user_context = user_context or UserContext.load(user_id)
+        except ValueError as e:
+            logger.error(str(e))
+            raise DatabaseError(str(e))
+
+        self.portfolio = user_context.portfolio_dto
+        logger.debug(f"Loaded portfolio data for user {user_id}")
 
     def hardcode_section(self, section: str) -> str:
         """Get hardcoded LaTeX content for a specific section"""
@@ -112,7 +103,7 @@ class HardcodeSections:
             for skill_category in self.portfolio.skills:
                 for category, skill_list in skill_category.items():
                     escaped_category = LatexEscaper.escape_text(category)
-                    escaped_skills = ', '.join(map(LatexEscaper.escape_text, skill_list))
+                    escaped_skills = ', '.join(LatexEscaper.escape_many(skill_list))
                     skills_content += f"    \\resumeSkillHeading{{{escaped_category}}}{{{escaped_skills}}}\n"
                     logger.debug(f"Added skill category: {category} with {len(skill_list)} skills")
             
@@ -128,8 +119,8 @@ class HardcodeSections:
         for exp in self.portfolio.work_experience:
             responsibilities = exp.get('responsibilities', [])
             responsibilities_content = "\n".join([
-                f"        \\resumeItem{{{LatexEscaper.escape_text(r)}}}"
-                for r in responsibilities
+                f"        \\resumeItem{{{r}}}"
+                for r in LatexEscaper.escape_many(responsibilities)
             ])
             exp_data = {
                 'job_title': LatexEscaper.escape_text(exp.get('job_title', '')),
@@ -160,8 +151,8 @@ class HardcodeSections:
         projects_content = "\\resumeSubHeadingListStart\n"
         for project in self.portfolio.projects:
             bullet_points_content = "\n".join([
-                f"    \\resumeItem{{{LatexEscaper.escape_text(point)}}}"
-                for point in project.get('bullet_points', [])
+                f"    \\resumeItem{{{point}}}"
+                for point in LatexEscaper.escape_many(project.get('bullet_points', []))
             ])
             
             name_and_tech = LatexEscaper.escape_text(project.get('name', ''))
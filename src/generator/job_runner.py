@@ -0,0 +1,250 @@
+import os
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Optional
+import logging
+
+from bson import ObjectId
+
+from config.job_config import JobConfig
+from src.core.database.factory import get_unit_of_work
+from src.core.database.models import GenerationJob, Resume
+from src.core.exceptions.database_exceptions import DatabaseError
+from src.generator.generator_manager import GenerationType, GeneratorManager
+from src.generator.utils.job_info import JobInfo
+from src.generator.utils.output_manager import OutputManager
+
+logger = logging.getLogger(__name__)
+
+
+class GenerationJobRunner:
+    """
+    Creates and runs persisted resume / cover letter generation jobs.
+
+    A job document holds everything needed to run it, so any process with database
+    access can execute it. Progress from GeneratorManager.generate is written back to
+    the job (throttled to one write per ``progress_interval``) for status polling, and
+    every progress tuple and finished section is appended as an event for streaming.
+
+    Running a job leases it to this runner's ``worker_id``; a heartbeat thread renews the
+    lease while the pipeline runs, and results are only written while the lease is held,
+    so a job re-leased after its worker stalled is never finished twice.
+    """
+
+    def __init__(self, uow=None, progress_interval: Optional[float] = None, worker_id: Optional[str] = None):
+        self.uow = uow or get_unit_of_work()
+        self.config = JobConfig.get_generation_job_config()
+        self.progress_interval = self.config.progress_interval if progress_interval is None else progress_interval
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+    @staticmethod
+    def build_job(user_id: str, generation_type: GenerationType, job_description: str,
+                  options: Optional[Dict[str, Any]] = None) -> GenerationJob:
+        """
+        Build an unsaved queued job.
+
+        Args:
+            user_id: Owner of the job
+            generation_type: What to generate
+            job_description: Job posting text
+            options: model_type, model_name, temperature, selected_sections, use_cache,
+                base_resume_id (incremental regeneration), latency_budget and, for cover letters,
+                resume_id; missing LLM / section settings fall
+                back to the user's saved preferences when the job runs
+
+        Returns:
+            GenerationJob: The job, without an id until it is stored
+        """
+        params = {k: v for k, v in (options or {}).items() if v is not None}
+        params['job_description'] = job_description
+        return GenerationJob(user_id=user_id, job_type=generation_type.value, params=params)
+
+    def create_job(self, user_id: str, generation_type: GenerationType, job_description: str,
+                   options: Optional[Dict[str, Any]] = None) -> GenerationJob:
+        """
+        Persist a queued job; see ``build_job`` for the arguments.
+
+        Returns:
+            GenerationJob: The stored job with its id
+        """
+        job = self.build_job(user_id, generation_type, job_description, options)
+        with self.uow:
+            return self.uow.jobs.add(job)
+
+    def run(self, job_id: str) -> Optional[GenerationJob]:
+        """
+        Lease and execute a queued job in the current thread.
+
+        Returns:
+            Optional[GenerationJob]: The job after the attempt, or None if it was not
+            runnable (missing, finished, or leased by another worker)
+        """
+        with self.uow:
+            job = self.uow.jobs.lease(self.worker_id, self.config.lease_seconds, job_id=job_id)
+        if not job:
+            logger.warning(f"Generation job {job_id} is not queued, skipping")
+            return None
+        return self._process(job)
+
+    def run_next(self) -> Optional[GenerationJob]:
+        """
+        Lease and execute the oldest runnable job.
+
+        Returns:
+            Optional[GenerationJob]: The job after the attempt, or None if the queue is empty
+        """
+        with self.uow:
+            job = self.uow.jobs.lease(self.worker_id, self.config.lease_seconds)
+        return self._process(job) if job else None
+
+    def _process(self, job: GenerationJob) -> Optional[GenerationJob]:
+        if job.attempts > self.config.max_attempts:
+            # Every earlier attempt died without reporting back, e.g. the worker crashed
+            self._fail(job, f"Gave up after {job.attempts - 1} attempts")
+            return self._get(job.id)
+
+        logger.info(f"Running generation job {job.id} ({job.job_type}) for user {job.user_id}, "
+                    f"attempt {job.attempts} on {self.worker_id}")
+        stop_heartbeat = threading.Event()
+        threading.Thread(target=self._heartbeat, args=(job.id, stop_heartbeat),
+                         name=f"job-heartbeat-{job.id}", daemon=True).start()
+        try:
+            resume_id, message = self._execute(job)
+            with self.uow:
+                finished = self.uow.jobs.mark_succeeded(job.id, resume_id, message, worker_id=self.worker_id)
+            if finished:
+                self._emit(job.id, 'done', {'resume_id': resume_id, 'message': message})
+            else:
+                logger.warning(f"Lost the lease on generation job {job.id}; discarding its result")
+        except Exception as e:
+            logger.error(f"Generation job {job.id} failed: {e}", exc_info=True)
+            if job.attempts < self.config.max_attempts and self._is_retryable(e):
+                with self.uow:
+                    self.uow.jobs.retry_later(job.id, self.worker_id, str(e), self.config.retry_delay_seconds)
+                self._emit(job.id, 'retry', {'error': str(e), 'attempt': job.attempts})
+            else:
+                self._fail(job, str(e))
+        finally:
+            stop_heartbeat.set()
+        return self._get(job.id)
+
+    def _fail(self, job: GenerationJob, error: str) -> None:
+        with self.uow:
+            failed = self.uow.jobs.mark_failed(job.id, error, worker_id=self.worker_id)
+        if failed:
+            self._emit(job.id, 'error', {'error': error})
+
+    def _get(self, job_id: str) -> Optional[GenerationJob]:
+        with self.uow:
+            return self.uow.jobs.get_by_id(job_id)
+
+    def _heartbeat(self, job_id: str, stop: threading.Event) -> None:
+        while not stop.wait(self.config.heartbeat_interval):
+            try:
+                with self.uow:
+                    if not self.uow.jobs.heartbeat(job_id, self.worker_id, self.config.lease_seconds):
+                        logger.warning(f"Generation job {job_id} was leased by another worker")
+                        return
+            except Exception as e:
+                logger.warning(f"Could not renew the lease on generation job {job_id}: {e}")
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """Infrastructure and transient provider failures are retried; bad input is not."""
+        return (isinstance(error, (DatabaseError, ConnectionError, TimeoutError))
+                or getattr(error, 'retryable', False))
+
+    def _execute(self, job: GenerationJob):
+        params = dict(job.params)
+        generation_type = GenerationType(job.job_type)
+        job_description = params['job_description']
+
+        llm_preferences, section_preferences = self._load_preferences(job.user_id)
+        manager = GeneratorManager(job.user_id)
+        manager.configure_llm(
+            model_type=params.get('model_type', llm_preferences.get('model_type')),
+            model_name=params.get('model_name', llm_preferences.get('model_name')),
+            temperature=params.get('temperature', llm_preferences.get('temperature'))
+        )
+
+        resume_id = params.get('resume_id')
+        if generation_type == GenerationType.COVER_LETTER and not resume_id:
+            with self.uow:
+                resume_id = self.uow.get_last_resume_id(job.user_id)
+
+        self._report(job.id, "Extracting job information...", 0.0)
+        job_info = JobInfo.extract_from_description(job_description, manager.llm_runner)
+        output_manager = OutputManager(job_info)
+
+        message = ""
+        last_write = 0.0
+        for result in manager.generate(
+            generation_type=generation_type,
+            job_description=job_description,
+            selected_sections=params.get('selected_sections', section_preferences),
+            output_manager=output_manager,
+            use_cache=params.get('use_cache'),
+            resume_id=resume_id,
+            base_resume_id=params.get('base_resume_id'),
+            latency_budget=params.get('latency_budget'),
+            # The job id doubles as the run id, so a retried job continues from its checkpoints
+            run_id=job.id,
+            on_section=lambda section, content: self._emit(job.id, 'section', {'section': section, 'content': content})
+        ):
+            if isinstance(result, tuple):
+                message, progress = result
+                self._emit(job.id, 'progress', {'message': message, 'progress': progress})
+                now = time.monotonic()
+                if now - last_write >= self.progress_interval or progress >= 1.0:
+                    self._report(job.id, message, progress, emit=False)
+                    last_write = now
+            elif isinstance(result, Resume):
+                resume_id = result.id
+        return resume_id, message
+
+    def _report(self, job_id: str, message: str, progress: float, emit: bool = True) -> None:
+        try:
+            with self.uow:
+                self.uow.jobs.update_progress(job_id, message, progress, worker_id=self.worker_id)
+        except Exception as e:
+            # Progress is informational; never fail the job over it
+            logger.warning(f"Could not record progress for job {job_id}: {e}")
+        if emit:
+            self._emit(job_id, 'progress', {'message': message, 'progress': progress})
+
+    def _emit(self, job_id: str, event_type: str, data: Dict[str, Any]) -> None:
+        try:
+            with self.uow:
+                self.uow.jobs.add_event(job_id, event_type, data)
+        except Exception as e:
+            logger.warning(f"Could not record {event_type} event for job {job_id}: {e}")
+
+    def _load_preferences(self, user_id: str):
+        with self.uow:
+            user = self.uow.users.get_by_user_id(user_id)
+            if not user and ObjectId.is_valid(user_id):
+                user = self.uow.users.get_by_id(user_id)
+        if not user or not user.preferences:
+            return {}, {}
+        return (user.preferences.llm_preferences.model_dump(),
+                user.preferences.section_preferences.model_dump())
+
+
+_job_executor: Optional[ThreadPoolExecutor] = None
+_job_executor_lock = threading.Lock()
+
+
+def dispatch_job(job_id: str) -> Future:
+    """Run a queued job on the process-wide background pool."""
+    global _job_executor
+    if _job_executor is None:
+        with _job_executor_lock:
+            if _job_executor is None:
+                _job_executor = ThreadPoolExecutor(
+                    max_workers=JobConfig.get_generation_job_config().max_workers,
+                    thread_name_prefix="generation-job"
+                )
+    return _job_executor.submit(GenerationJobRunner().run, job_id)
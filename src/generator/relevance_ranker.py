@@ -0,0 +1,160 @@
+"""Rank portfolio items against a job description so only the best matches reach the LLM."""
+
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence
+import logging
+
+import numpy as np
+
+from config.ranking_config import RankingConfig, SectionRankingConfig
+from src.core.database.models.user import UserPreferences
+
+logger = logging.getLogger(__name__)
+
+# section -> (preferences key, item cap, bullet field, bullet cap)
+SECTION_LIMITS = {
+    'work_experience': ('work_experience_details', 'max_jobs', 'responsibilities', 'bullet_points_per_job'),
+    'projects': ('project_details', 'max_projects', 'bullet_points', 'bullet_points_per_project'),
+    'education': ('education_details', 'max_entries', 'transcript', 'max_courses'),
+    'awards': ('awards_details', 'max_awards', None, None),
+    'publications': ('publications_details', 'max_publications', None, None),
+}
+
+DEFAULT_PREFERENCES = UserPreferences().model_dump()
+
+# Keeps technology names such as c++, c#, node.js and .net together
+_TOKEN = re.compile(r"[a-z0-9+#]+(?:\.[a-z0-9+#]+)*")
+
+STOP_WORDS = frozenset("""
+a an and are as at be by for from has have in is it its of on or our that the their this to
+was were will with we you your us who what which while within all any can into not no
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stop words."""
+    return [token for token in _TOKEN.findall(text.lower()) if token not in STOP_WORDS]
+
+
+def flatten_text(value: Any) -> str:
+    """Join every string in a nested item into one document."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        return " ".join(flatten_text(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return " ".join(flatten_text(v) for v in value)
+    return ""
+
+
+class BM25Scorer:
+    """
+    Okapi BM25 over a small in-memory corpus.
+
+    Only the query's terms are counted, so the term-frequency matrix is
+    documents x query terms and scoring is a handful of NumPy array operations.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+
+    def score(self, documents: Sequence[str], query: str) -> np.ndarray:
+        """
+        Score each document against the query.
+
+        Args:
+            documents: Texts to rank
+            query: The job description
+
+        Returns:
+            np.ndarray: One relevance score per document
+        """
+        query_counts = Counter(tokenize(query))
+        if not documents or not query_counts:
+            return np.zeros(len(documents))
+
+        columns = {term: i for i, term in enumerate(query_counts)}
+        tf = np.zeros((len(documents), len(columns)))
+        lengths = np.empty(len(documents))
+        for row, document in enumerate(documents):
+            tokens = tokenize(document)
+            lengths[row] = len(tokens)
+            for token, count in Counter(tokens).items():
+                column = columns.get(token)
+                if column is not None:
+                    tf[row, column] = count
+
+        document_frequency = np.count_nonzero(tf, axis=0)
+        idf = np.log1p((len(documents) - document_frequency + 0.5) / (document_frequency + 0.5))
+        # Terms the posting repeats matter more, with diminishing returns
+        query_weights = np.log1p(np.fromiter(query_counts.values(), dtype=float, count=len(query_counts)))
+        norm = self.k1 * (1 - self.b + self.b * lengths / (lengths.mean() or 1.0))
+        saturated = tf * (self.k1 + 1) / (tf + norm[:, None])
+        return saturated @ (idf * query_weights)
+
+
+def top_k(scores: np.ndarray, k: int) -> List[int]:
+    """Indices of the k best scores, in their original order; ties keep the earlier item."""
+    if k >= len(scores):
+        return list(range(len(scores)))
+    return sorted(np.argsort(-scores, kind='stable')[:k].tolist())
+
+
+class RelevanceRanker:
+    """
+    Trims long portfolio sections to the items and bullets most relevant to a job.
+
+    A section is only trimmed when it holds more than ``item_multiplier`` times the
+    user's preference cap (e.g. ``max_jobs``); the LLM still picks the final entries
+    from the shortlist, it just no longer has to read the whole history.
+    """
+
+    def __init__(self, config: Optional[SectionRankingConfig] = None):
+        self.config = config or RankingConfig.get_section_ranking_config()
+        self.scorer = BM25Scorer(self.config.k1, self.config.b)
+
+    def select(self, section: str, data: Any, job_description: str,
+               preferences: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Keep the most relevant items (and bullets) of a section.
+
+        Args:
+            section: Section name, e.g. "projects"
+            data: The section's portfolio data
+            job_description: Job description to rank against
+            preferences: User preferences, as stored on UserContext
+
+        Returns:
+            The trimmed data; the input is never modified, and sections without
+            limits or with few enough items are returned as they are
+        """
+        limits = SECTION_LIMITS.get(section)
+        if not self.config.enabled or not limits or not isinstance(data, list) or not job_description:
+            return data
+
+        preferences_key, item_cap, bullet_field, bullet_cap = limits
+        caps = {**DEFAULT_PREFERENCES.get(preferences_key, {}), **(preferences or {}).get(preferences_key, {})}
+        max_items = math.ceil(caps[item_cap] * self.config.item_multiplier)
+
+        items = data
+        if len(items) > max_items:
+            keep = top_k(self.scorer.score([flatten_text(item) for item in items], job_description), max_items)
+            items = [items[i] for i in keep]
+            logger.info(f"Ranked {section}: kept {len(items)} of {len(data)} items")
+
+        if bullet_field:
+            max_bullets = math.ceil(caps[bullet_cap] * self.config.bullet_multiplier)
+            items = [self._select_bullets(item, bullet_field, max_bullets, job_description) for item in items]
+        return items
+
+    def _select_bullets(self, item: Any, field: str, max_bullets: int, job_description: str) -> Any:
+        if not isinstance(item, dict):
+            return item
+        bullets = item.get(field)
+        if not isinstance(bullets, list) or len(bullets) <= max_bullets:
+            return item
+        keep = top_k(self.scorer.score([flatten_text(b) for b in bullets], job_description), max_bullets)
+        return {**item, field: [bullets[i] for i in keep]}
@@ -1,15 +1,25 @@
 import logging
-from typing import Dict
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import chain
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
-from src.core.database.models.resume import Resume
+from src.core.database.models.generation_run import GenerationRun
+from src.core.database.models.resume import Resume, RESUME_SECTIONS
 from src.llms.runner import LLMRunner
 from src.latex.resume.resume_compiler import ResumeLatexCompiler
 from src.loaders.prompt_loader import PromptLoader
 from src.loaders.tex_loader import TexLoader
 from src.generator.hardcode_sections import HardcodeSections
+from src.generator.relevance_ranker import RelevanceRanker
 from src.loaders.portfolio_loader import PortfolioLoader
 from src.core.database.factory import get_unit_of_work
+from src.core.dto.user_context import UserContext
 from src.generator.utils.output_manager import OutputManager
+from src.generator.utils.section_cache import SectionCache, get_section_cache
+from src.generator.utils.prompt_serializer import serialize_section
+from config.cache_config import CacheConfig
+from config.llm_config import LLMConfig
 
 logger = logging.getLogger(__name__)
 
@@ -21,22 +31,71 @@ class ResumeGenerator:
     content creation, PDF generation, and database storage.
     """
 
-    def __init__(self, llm_runner: LLMRunner, user_id: str):
-        """Initialize the ResumeGenerator with necessary parts."""
+    def __init__(self, llm_runner: LLMRunner, user_id: str, user_context: Optional[UserContext] = None,
+                 use_cache: Optional[bool] = None):
+        """
+        Initialize the ResumeGenerator with necessary parts.
+
+        Args:
+            llm_runner: Runner used for AI-processed sections
+            user_id: The user to generate for
+            user_context: Preloaded user snapshot; loaded when not provided
+            use_cache: Whether to serve AI sections from the section cache. When False
+                the cache is bypassed for lookups but still refreshed with new results.
+                Defaults to the SECTION_CACHE_ENABLED setting.
+        """
         self.llm_runner = llm_runner
         self.uow = get_unit_of_work()
         self.user_id = user_id
-        self.prompt_loader = PromptLoader(user_id=user_id)
+        self.user_context = user_context or UserContext.load(user_id)
+        self.prompt_loader = PromptLoader(user_id=user_id, user_context=self.user_context)
         self.tex_loader = TexLoader()
-        self.portfolio_loader = PortfolioLoader(self.user_id)
-        self.hardcoder = HardcodeSections(self.user_id)
+        self.portfolio_loader = PortfolioLoader(self.user_id, self.user_context)
+        self.hardcoder = HardcodeSections(self.user_id, self.user_context)
         self.latex_compiler = ResumeLatexCompiler()
+        self.section_cache = get_section_cache()
+        self.use_cache = CacheConfig.get_section_cache_config().enabled if use_cache is None else use_cache
+        self.relevance_ranker = RelevanceRanker()
+        # section -> (fingerprint, content) of the base resume, and the fingerprints of this run
+        self.base_sections: Dict[str, Tuple[str, str]] = {}
+        self.section_fingerprints: Dict[str, str] = {}
+        # AI sections of this run that missed the latency budget and were hardcoded instead
+        self.fallback_sections: List[str] = []
+        self.run_id: Optional[str] = None
 
     def generate_resume(self,
                         job_description: str,
                         selected_sections: Dict[str, str],
-                        output_manager: OutputManager):
-        """Generate a résumé based on the provided job description and settings."""
+                        output_manager: OutputManager,
+                        concurrent: bool = True,
+                        on_section: Optional[Callable[[str, str], None]] = None,
+                        base_resume_id: Optional[str] = None,
+                        run: Optional[GenerationRun] = None,
+                        latency_budget: Optional[float] = None):
+        """
+        Generate a résumé based on the provided job description and settings.
+
+        When ``concurrent`` is set, all sections are dispatched at once to a worker
+        pool bounded by the provider's max in-flight limit, and progress is yielded
+        as each section finishes. The final content is always assembled in the
+        fixed section order, regardless of completion order.
+
+        ``on_section(section, content)`` is called as each section's content is ready.
+
+        With ``base_resume_id``, AI sections whose fingerprint (prompt, section data, job
+        description and model settings) matches the one stored on that resume are copied
+        from it instead of being generated again.
+
+        With a ``run``, every finished section is checkpointed to it as soon as it is
+        ready, and sections, compile and save already completed by an earlier attempt of
+        the run are not repeated.
+
+        ``latency_budget`` (seconds, defaulting to RESUME_LATENCY_BUDGET_SECONDS; 0 turns
+        it off) bounds the section stage: AI sections still waiting on the LLM when it
+        runs out are replaced with their hardcoded version and listed in the resume's
+        ``fallback_sections``. The budget always uses the worker pool, even when
+        ``concurrent`` is off, so a slow call can be abandoned.
+        """
         logger.info("Starting resume generation process")
         
         try:
@@ -45,39 +104,55 @@ class ResumeGenerator:
             logger.debug("Saved job description")
             
             # Initialize all sections with empty strings
-            all_sections = {
-                'personal_information': '',
-                'career_summary': '',
-                'skills': '',
-                'work_experience': '',
-                'education': '',
-                'projects': '',
-                'awards': '',
-                'publications': ''
-            }
-            
+            all_sections = {section: '' for section in RESUME_SECTIONS}
+            # Section threads get this call's run id and fingerprints: threads abandoned by an
+            # earlier call may still finish after the attributes are reset for a new one
+            run_id = self.run_id = run.id if run else None
+            fingerprints = self.section_fingerprints = dict(run.section_fingerprints) if run else {}
+            self.base_sections = self._load_base_sections(base_resume_id) if base_resume_id else {}
+            self.fallback_sections = []
+            if latency_budget is None:
+                latency_budget = LLMConfig.get_resilience_config().latency_budget_seconds
+            deadline = time.monotonic() + latency_budget if latency_budget else None
+
+            if run and run.resume_id:
+                resume = self._get_saved_resume(run.resume_id)
+                if resume:
+                    logger.info(f"Run {run.id} already saved resume {resume.id}")
+                    yield "Resume generated successfully!", 1.0
+                    yield resume
+                    return
+
+            # Sections finished by an earlier attempt of this run are not generated again
+            checkpointed = {s: run.sections[s] for s in selected_sections if run and s in run.sections}
+            pending = {s: t for s, t in selected_sections.items() if s not in checkpointed}
+            if checkpointed:
+                logger.info(f"Resuming run {run.id}: {len(checkpointed)} of {len(selected_sections)} "
+                            f"sections already done")
+
             # Process each section
             total_sections = len(selected_sections)
             logger.debug(f"Processing {total_sections} sections")
-            
-            for i, (section, process_type) in enumerate(selected_sections.items(), 1):
+
+            if (concurrent and self.llm_runner.max_concurrency > 1) or deadline:
+                section_results = self._process_sections_concurrently(pending, job_description, run_id,
+                                                                      fingerprints, deadline)
+            else:
+                section_results = self._process_sections_sequentially(pending, job_description, run_id,
+                                                                      fingerprints)
+            section_results = chain(checkpointed.items(), section_results)
+
+            for i, (section, content) in enumerate(section_results, 1):
                 progress = i / (total_sections + 1)  # +1 for PDF generation
-                logger.debug(f"Processing section {section} with type {process_type}")
                 yield f"Processing {section}...", progress
-                
-                if process_type != 'skip':
-                    try:
-                        content = self.process_section(section, process_type, job_description)
-                        if content and content.strip():  # Check for non-empty content
-                            all_sections[section] = content
-                            logger.debug(f"Successfully processed section {section}")
-                        else:
-                            logger.warning(f"No content generated for section {section}")
-                    except Exception as e:
-                        logger.error(f"Error processing section {section}: {str(e)}", exc_info=True)
-                        raise
-                else:
-                    logger.debug(f"Skipping section {section}")
+
+                if content and content.strip():  # Check for non-empty content
+                    all_sections[section] = content
+                    logger.debug(f"Successfully processed section {section}")
+                    if on_section:
+                        on_section(section, content)
+                elif selected_sections[section] != 'skip':
+                    logger.warning(f"No content generated for section {section}")
 
             # Check if we have at least one non-empty required section
             required_sections = ['personal_information', 'career_summary', 'skills']
@@ -100,6 +175,7 @@ class ResumeGenerator:
             if not resume:
                 logger.error("Resume generation returned None")
                 raise ValueError("Resume generation failed")
+            self._checkpoint(run_id, lambda runs: runs.set_resume(run_id, resume.id))
             
             logger.info(f"Resume generated successfully with ID: {resume.id}")
             yield "Resume generated successfully!", 1.0
@@ -109,6 +185,76 @@ class ResumeGenerator:
             logger.error(f"Failed to generate resume: {str(e)}", exc_info=True)
             raise
 
+    def _process_sections_sequentially(self, selected_sections: Dict[str, str], job_description: str,
+                                       run_id: Optional[str],
+                                       fingerprints: Dict[str, str]) -> Iterator[Tuple[str, str]]:
+        """Process sections one after another, yielding (section, content) pairs."""
+        for section, process_type in selected_sections.items():
+            logger.debug(f"Processing section {section} with type {process_type}")
+            try:
+                yield section, self._process_and_checkpoint(section, process_type, job_description,
+                                                            run_id, fingerprints)
+            except Exception as e:
+                logger.error(f"Error processing section {section}: {str(e)}", exc_info=True)
+                raise
+
+    def _process_sections_concurrently(self, selected_sections: Dict[str, str], job_description: str,
+                                       run_id: Optional[str], fingerprints: Dict[str, str],
+                                       deadline: Optional[float] = None) -> Iterator[Tuple[str, str]]:
+        """
+        Process all sections in a bounded worker pool, yielding (section, content) pairs as they finish.
+
+        Sections not finished by ``deadline`` (a ``time.monotonic()`` value) are yielded
+        with their fallback content instead.
+        """
+        # This pool only fans the sections out; in-flight requests are capped per provider
+        # across the process by the runner's concurrency limiter
+        max_workers = min(self.llm_runner.max_concurrency, max(len(selected_sections), 1))
+        logger.debug(f"Dispatching {len(selected_sections)} sections to {max_workers} workers "
+                     f"for provider {self.llm_runner.provider}")
+
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="resume-section")
+        try:
+            futures = {
+                executor.submit(self._process_and_checkpoint, section, process_type, job_description,
+                                run_id, fingerprints): section
+                for section, process_type in selected_sections.items()
+            }
+            pending = set(futures)
+            while pending:
+                timeout = max(deadline - time.monotonic(), 0) if deadline else None
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    break
+                for future in done:
+                    section = futures[future]
+                    try:
+                        yield section, future.result()
+                    except Exception as e:
+                        logger.error(f"Error processing section {section}: {str(e)}", exc_info=True)
+                        raise
+            # Late sections are abandoned, not interrupted: their results still reach the cache
+            for future in pending:
+                future.cancel()
+                section = futures[future]
+                yield section, self._fallback(section, selected_sections[section])
+        finally:
+            # Drop queued sections if we bailed out early; running calls finish in the background
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fallback(self, section: str, process_type: str) -> str:
+        """Content for a section that missed the latency budget."""
+        if process_type.lower() != "process":
+            # Skip and hardcode sections never wait on the LLM; only a stalled pool delays them
+            return self.process_section(section, process_type, "")
+        logger.warning(f"Section {section} missed the latency budget, using the hardcoded version")
+        self.fallback_sections.append(section)
+        try:
+            return self.hardcoder.hardcode_section(section)
+        except Exception as e:
+            logger.error(f"No hardcoded fallback for section {section}: {str(e)}")
+            return ""
+
     def _generate_and_save_resume(self, content_dict: Dict[str, str], output_manager: OutputManager) -> Resume:
         try:
             logger.debug(f"Creating resume with user_id: {self.user_id}")
@@ -143,7 +289,11 @@ class ResumeGenerator:
                 resume_pdf=generated_pdf,
                 model_type=self.llm_runner.get_config().get('type'),
                 model_name=self.llm_runner.strategy.__class__.__name__,
-                temperature=self.llm_runner.get_config().get('temperature')
+                temperature=self.llm_runner.get_config().get('temperature'),
+                # A late LLM call may still record the fingerprint of a section that fell back
+                section_fingerprints={s: f for s, f in self.section_fingerprints.items()
+                                      if s not in self.fallback_sections},
+                fallback_sections=list(self.fallback_sections)
             )
             logger.debug(f"Created resume object with user_id: {resume.user_id}")
 
@@ -159,8 +309,50 @@ class ResumeGenerator:
             logger.error(f"Failed to generate and save resume: {str(e)}", exc_info=True)
             raise
 
-    def process_section(self, section: str, process_type: str, job_description: str) -> str:
-        """Process a single section based on the process type."""
+    def _process_and_checkpoint(self, section: str, process_type: str, job_description: str,
+                                run_id: Optional[str], fingerprints: Dict[str, str]) -> str:
+        """Process a section and checkpoint it to the run, even if the resume is later abandoned."""
+        content = self.process_section(section, process_type, job_description, fingerprints=fingerprints)
+        self._checkpoint(run_id, lambda runs: runs.save_section(run_id, section, content,
+                                                                fingerprints.get(section)))
+        return content
+
+    def _checkpoint(self, run_id: Optional[str], update: Callable) -> None:
+        if not run_id:
+            return
+        try:
+            with self.uow:
+                update(self.uow.runs)
+        except Exception as e:
+            # Checkpoints only save work for a retry; never fail the generation over one
+            logger.warning(f"Could not checkpoint run {run_id}: {e}")
+
+    def _get_saved_resume(self, resume_id: str) -> Optional[Resume]:
+        with self.uow:
+            return self.uow.resumes.get_by_id(resume_id)
+
+    def _load_base_sections(self, resume_id: str) -> Dict[str, Tuple[str, str]]:
+        """Get (fingerprint, content) of every fingerprinted section of a previous resume."""
+        with self.uow:
+            doc = self.uow.resumes.get_sections(resume_id, self.user_id)
+        if not doc:
+            raise ValueError(f"Base resume {resume_id} not found")
+        base_sections = {
+            section: (fingerprint, doc[section])
+            for section, fingerprint in (doc.get('section_fingerprints') or {}).items()
+            if isinstance(doc.get(section), str) and doc[section].strip()
+        }
+        logger.info(f"Regenerating from resume {resume_id} with {len(base_sections)} reusable sections")
+        return base_sections
+
+    def process_section(self, section: str, process_type: str, job_description: str,
+                        fingerprints: Optional[Dict[str, str]] = None) -> str:
+        """
+        Process a single section based on the process type.
+
+        The fingerprint of an AI section is recorded in ``fingerprints``, which defaults
+        to ``self.section_fingerprints``.
+        """
         logger.debug(f"Processing section {section} with type {process_type}")
         
         if process_type.lower() == "skip":
@@ -189,7 +381,12 @@ class ResumeGenerator:
                 logger.debug(f"Got prompt for section {section}")
                 
                 # Get the section data using portfolio_loader
-                section_data = str(self.portfolio_loader.get_section_data(section))
+                # Long sections are cut to the items most relevant to this job before serializing
+                section_data = self.relevance_ranker.select(
+                    section, self.portfolio_loader.get_section_data(section),
+                    job_description, self.user_context.preferences
+                )
+                section_data = serialize_section(section, section_data)
                 logger.debug(f"Raw data for section {section}: {section_data}")
                 
                 if not section_data:
@@ -197,12 +394,31 @@ class ResumeGenerator:
                     return ""
 
                 logger.debug(f"Formatted data for section {section}: {section_data}")
+
+                config = self.llm_runner.get_config()
+                # The cache key covers every input of the generation, so it doubles as the fingerprint
+                cache_key = SectionCache.make_key(
+                    prompt, section_data, job_description,
+                    config['type'], config['model'], config['temperature']
+                )
+                (self.section_fingerprints if fingerprints is None else fingerprints)[section] = cache_key
+                base_fingerprint, base_content = self.base_sections.get(section, (None, None))
+                if base_fingerprint == cache_key:
+                    logger.info(f"Section {section} is unchanged, reusing it from the base resume")
+                    return base_content
+
+                if self.use_cache:
+                    cached = self.section_cache.get(cache_key)
+                    if cached:
+                        logger.info(f"Section cache hit for {section} ({self.section_cache.get_stats()})")
+                        return cached
                 
                 # Generate content using the prompt and portfolio data
                 content = self.llm_runner.generate_content(prompt, section_data, job_description)
                 
                 if content:
                     logger.debug(f"Successfully generated AI content for section {section}, length: {len(content)}")
+                    self.section_cache.set(cache_key, content, self.user_id, section)
                     return content
                 else:
                     logger.warning(f"AI returned empty content for section {section}")
@@ -1,13 +1,15 @@
 from pathlib import Path
+from typing import Optional
 import shutil
 from config.settings import OUTPUT_DIR
 from .job_info import JobInfo
 from .string_utils import sanitize_filename
 
 class OutputManager:
-    def __init__(self, job_info: JobInfo):
+    def __init__(self, job_info: JobInfo, output_dir: Optional[str] = None):
+        """Use ``output_dir`` when it still exists (e.g. a resumed run); otherwise create a new folder."""
         self.job_info = job_info
-        self.output_dir = self._create_output_directory()
+        self.output_dir = Path(output_dir) if output_dir and Path(output_dir).is_dir() else self._create_output_directory()
 
     def _create_output_directory(self) -> Path:
         """Create and return the output directory path."""
@@ -15,14 +17,17 @@ class OutputManager:
         safe_job = sanitize_filename(self.job_info.job_title)
         folder_name = f"{safe_company}_{safe_job}"
         
+        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
         output_dir = OUTPUT_DIR / folder_name
         counter = 1
-        while output_dir.exists():
-            output_dir = OUTPUT_DIR / f"{folder_name}_{counter}"
-            counter += 1
-            
-        output_dir.mkdir(parents=True, exist_ok=True)
-        return output_dir
+        # mkdir doubles as the existence check, so parallel jobs never share a folder
+        while True:
+            try:
+                output_dir.mkdir()
+                return output_dir
+            except FileExistsError:
+                output_dir = OUTPUT_DIR / f"{folder_name}_{counter}"
+                counter += 1
 
     def get_job_info(self) -> JobInfo:
         return self.job_info
@@ -0,0 +1,184 @@
+import json
+import re
+import threading
+from dataclasses import fields
+from typing import Any, Dict, Optional
+import logging
+
+from src.core.dto.portfolio.sections import (
+    AwardDTO, CareerSummaryDTO, EducationItemDTO, PersonalInformationDTO,
+    ProjectDTO, PublicationDTO, WorkExperienceDTO
+)
+from src.latex.utils.latex_escaper import LatexEscaper
+from src.llms.rate_limiter import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+_SECTION_DTOS = {
+    'personal_information': PersonalInformationDTO,
+    'career_summary': CareerSummaryDTO,
+    'work_experience': WorkExperienceDTO,
+    'education': EducationItemDTO,
+    'projects': ProjectDTO,
+    'awards': AwardDTO,
+    'publications': PublicationDTO,
+}
+
+# Fields the model needs for each section; anything else in the stored documents is dropped
+SECTION_FIELDS = {section: frozenset(f.name for f in fields(dto)) for section, dto in _SECTION_DTOS.items()}
+
+# Storage metadata that never helps the model
+IGNORED_FIELDS = frozenset({'_id', 'id', 'user_id', 'created_at', 'updated_at'})
+
+_LATEX_COMMENT = re.compile(r'(?<!\\)%.*')
+_LATEX_ENVIRONMENT = re.compile(r'\\(?:begin|end)\{[^}]*\}(?:\[[^\]]*\]|\{[^}]*\})*')
+_LATEX_HREF = re.compile(r'\\href\{([^}]*)\}\{([^}]*)\}')
+_LATEX_ITEM = re.compile(r'\\item\b\s*')
+_LATEX_LINE_BREAK = re.compile(r'\\\\(?:\[[^\]]*\])?')
+_LATEX_SPACING = re.compile(r'\\(?:vspace|hspace)\*?\{[^}]*\}')
+_LATEX_COMMAND = re.compile(r'\\[a-zA-Z]+\*?(?:\[[^\]]*\])?')
+_BLANK_RUNS = re.compile(r'[ \t]+')
+_BLANK_LINES = re.compile(r'\s*\n\s*')
+
+
+class _SerializationStats:
+    """Running totals of estimated prompt tokens before and after serialization."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.tokens_before = 0
+        self.tokens_after = 0
+
+    def record(self, label: str, before: str, after: str) -> None:
+        tokens_before, tokens_after = estimate_tokens(before), estimate_tokens(after)
+        with self._lock:
+            self.calls += 1
+            self.tokens_before += tokens_before
+            self.tokens_after += tokens_after
+        saved = 1 - tokens_after / tokens_before if tokens_before else 0.0
+        logger.info(f"Serialized {label}: ~{tokens_before} -> ~{tokens_after} tokens ({saved:.0%} saved)")
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            saved = self.tokens_before - self.tokens_after
+            return {
+                'calls': self.calls,
+                'tokens_before': self.tokens_before,
+                'tokens_after': self.tokens_after,
+                'tokens_saved': saved,
+                'saved_ratio': round(saved / self.tokens_before, 3) if self.tokens_before else 0.0
+            }
+
+
+_stats = _SerializationStats()
+
+
+def get_serialization_stats() -> Dict[str, Any]:
+    """Get the estimated token savings of compact serialization in this process."""
+    return _stats.get_stats()
+
+
+def strip_latex(text: str) -> str:
+    """
+    Reduce LaTeX markup to its readable text.
+
+    Comments, environments, spacing and formatting commands are removed, ``\\item``
+    becomes a dash and ``\\href{url}{text}`` becomes ``text (url)``; escaped special
+    characters are restored.
+
+    Args:
+        text: A LaTeX fragment such as a generated resume section
+
+    Returns:
+        str: Plain text with one entry per line
+    """
+    if '\\' not in text:
+        return text.strip()
+    text = _LATEX_COMMENT.sub('', text)
+    text = _LATEX_ENVIRONMENT.sub('\n', text)
+    text = _LATEX_SPACING.sub('', text)
+    text = _LATEX_HREF.sub(lambda m: f"{m.group(2)} ({m.group(1)})" if m.group(1) != m.group(2) else m.group(1), text)
+    text = _LATEX_ITEM.sub('\n- ', text)
+    text = _LATEX_LINE_BREAK.sub('\n', text)
+    text = LatexEscaper.unescape_text(text)
+    text = _LATEX_COMMAND.sub('', text)
+    text = text.replace('{', '').replace('}', '')
+    text = _BLANK_RUNS.sub(' ', text)
+    return _BLANK_LINES.sub('\n', text).strip()
+
+
+def prune(value: Any, keep: Optional[frozenset] = None, clean=LatexEscaper.unescape_text) -> Any:
+    """
+    Drop empty values and irrelevant fields, cleaning every string on the way.
+
+    Args:
+        value: Section data (dicts, lists and scalars)
+        keep: Field names to keep in dicts; dicts sharing none of them are kept whole
+        clean: Applied to every string value
+
+    Returns:
+        The pruned copy, or None if nothing is left
+    """
+    if isinstance(value, str):
+        value = clean(value).strip()
+        return value or None
+    if isinstance(value, dict):
+        keys = value.keys() - IGNORED_FIELDS
+        if keep and keys & keep:
+            keys &= keep
+        pruned = {str(k): prune(value[k], keep, clean) for k in keys}
+        return {k: v for k, v in pruned.items() if v is not None} or None
+    if isinstance(value, (list, tuple)):
+        pruned = [prune(v, keep, clean) for v in value]
+        return [v for v in pruned if v is not None] or None
+    if isinstance(value, bytes):
+        return None
+    return value
+
+
+def to_compact_json(value: Any) -> str:
+    """Canonical minified JSON: sorted keys, no whitespace, UTF-8 kept as is."""
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+
+
+def serialize_section(section: str, data: Any) -> str:
+    """
+    Serialize portfolio data for one resume section prompt.
+
+    Empty values, storage metadata and fields the section does not use are dropped,
+    LaTeX escaping added for rendering is undone, and the rest is emitted as compact
+    canonical JSON, so equal data always produces the same prompt.
+
+    Args:
+        section: Section name, e.g. "work_experience"
+        data: The section's portfolio data
+
+    Returns:
+        str: Compact JSON, or an empty string when there is no data
+    """
+    pruned = prune(data, SECTION_FIELDS.get(section))
+    if pruned is None:
+        return ""
+    serialized = to_compact_json(pruned)
+    _stats.record(section, str(data), serialized)
+    return serialized
+
+
+def serialize_cover_letter_context(resume_data: Dict[str, Any]) -> str:
+    """
+    Serialize a generated resume as cover letter context.
+
+    Resume sections are stored as LaTeX; the markup is stripped so only the text the
+    model needs is sent.
+
+    Args:
+        resume_data: Resume sections keyed by section name
+
+    Returns:
+        str: Compact JSON of the non-empty sections
+    """
+    pruned = prune(resume_data, clean=strip_latex)
+    serialized = to_compact_json(pruned or {})
+    _stats.record('cover_letter context', str(resume_data), serialized)
+    return serialized
@@ -0,0 +1,171 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+import logging
+
+from config.cache_config import CacheConfig
+from src.core.database.factory import get_database_connection
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_job_description(job_description: str) -> str:
+    """Collapse whitespace so trivially reformatted postings share cache entries."""
+    return " ".join((job_description or "").split())
+
+
+class SectionCache:
+    """
+    Two-level cache for LLM-generated section content.
+
+    An in-process LRU sits in front of a MongoDB collection with a TTL index, so
+    repeat generations for the same prompt, data, job description and model skip
+    the LLM call entirely. Cache failures are logged and never break generation.
+    """
+
+    def __init__(self, collection=None, max_memory_entries: Optional[int] = None,
+                 ttl_seconds: Optional[int] = None):
+        config = CacheConfig.get_section_cache_config()
+        self._collection = collection
+        self.max_memory_entries = max_memory_entries or config.max_memory_entries
+        self.ttl_seconds = ttl_seconds or config.ttl_seconds
+        self._memory: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._indexes_created = False
+        self.hits = 0
+        self.memory_hits = 0
+        self.misses = 0
+
+    @property
+    def collection(self):
+        if self._collection is None:
+            self._collection = get_database_connection().db[CacheConfig.get_section_cache_config().collection]
+        if not self._indexes_created:
+            self._collection.create_index('created_at', expireAfterSeconds=self.ttl_seconds)
+            self._collection.create_index('user_id')
+            self._indexes_created = True
+        return self._collection
+
+    @staticmethod
+    def make_key(prompt: str, data: Any, job_description: str,
+                 model_type: str, model_name: str, temperature: float) -> str:
+        """
+        Build the cache key for a generation request.
+
+        Args:
+            prompt: Fully rendered section prompt
+            data: Section data sent to the model
+            job_description: Raw job description; whitespace is normalized
+            model_type: Provider / strategy type
+            model_name: Model name
+            temperature: Sampling temperature
+
+        Returns:
+            str: Hex SHA-256 digest identifying the request
+        """
+        payload = json.dumps(
+            [prompt, data, normalize_job_description(job_description), model_type, model_name, temperature],
+            sort_keys=True,
+            default=str,
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up cached content, checking memory first and then MongoDB."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                self.memory_hits += 1
+                return entry[1]
+
+        try:
+            doc = self.collection.find_one({'_id': key})
+        except Exception as e:
+            logger.warning(f"Section cache lookup failed: {e}")
+            doc = None
+
+        with self._lock:
+            if doc is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, doc.get('user_id', ''), doc['content'])
+        return doc['content']
+
+    def set(self, key: str, content: str, user_id: str, section: str) -> None:
+        """Store generated content for a key."""
+        with self._lock:
+            self._remember(key, user_id, content)
+        try:
+            self.collection.replace_one(
+                {'_id': key},
+                {
+                    '_id': key,
+                    'user_id': user_id,
+                    'section': section,
+                    'content': content,
+                    'created_at': datetime.now(timezone.utc)
+                },
+                upsert=True
+            )
+        except Exception as e:
+            logger.warning(f"Section cache write failed: {e}")
+
+    def invalidate_user(self, user_id: str) -> int:
+        """
+        Drop every cached entry belonging to a user, e.g. after a portfolio change.
+
+        Returns:
+            int: Number of MongoDB entries removed
+        """
+        with self._lock:
+            for key in [k for k, (owner, _) in self._memory.items() if owner == user_id]:
+                del self._memory[key]
+        try:
+            return self.collection.delete_many({'user_id': user_id}).deleted_count
+        except Exception as e:
+            logger.warning(f"Section cache invalidation failed for user {user_id}: {e}")
+            return 0
+
+    def clear_memory(self) -> None:
+        """Empty the in-process LRU."""
+        with self._lock:
+            self._memory.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit / miss counters."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'memory_hits': self.memory_hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / lookups if lookups else 0.0,
+            'memory_entries': len(self._memory)
+        }
+
+    def _remember(self, key: str, user_id: str, content: str) -> None:
+        # Caller holds the lock
+        self._memory[key] = (user_id, content)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+
+_section_cache: Optional[SectionCache] = None
+_section_cache_lock = threading.Lock()
+
+
+def get_section_cache() -> SectionCache:
+    """Get the process-wide section cache."""
+    global _section_cache
+    if _section_cache is None:
+        with _section_cache_lock:
+            if _section_cache is None:
+                _section_cache = SectionCache()
+    return _section_cache
@@ -0,0 +1,183 @@
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from config.latex_config import LatexCompileConfig
+from config.logger_config import setup_logger
+from src.latex.utils.errors import CompileQueueFullError, CompileTimeoutError
+from src.latex.utils.format_cache import LatexFormatCache
+
+logger = setup_logger(__name__)
+
+
+class LatexCompileService:
+    """
+    Bounded pool for pdflatex jobs.
+
+    At most ``max_workers`` pdflatex processes run at once and at most ``max_queue``
+    further jobs wait for a slot; beyond that, ``submit`` raises CompileQueueFullError.
+    Every job builds in its own temporary directory (under ``build_root``, which can
+    be a tmpfs) with wall-clock and memory limits, and only the PDF bytes leave it.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_queue: Optional[int] = None,
+                 queue_timeout: Optional[float] = None, build_root: Optional[Path] = None,
+                 timeout_seconds: Optional[int] = None, memory_limit_mb: Optional[int] = None,
+                 compiler: str = 'pdflatex'):
+        config = LatexCompileConfig.get_worker_config()
+        self.max_workers = max_workers or config.max_workers
+        self.max_queue = config.max_queue if max_queue is None else max_queue
+        self.queue_timeout = config.queue_timeout if queue_timeout is None else queue_timeout
+        self.build_root = build_root or config.build_root
+        self.timeout_seconds = timeout_seconds or config.timeout_seconds
+        self.memory_limit_mb = config.memory_limit_mb if memory_limit_mb is None else memory_limit_mb
+        self.compiler = compiler
+
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="latex-compile")
+        self._slots = threading.BoundedSemaphore(self.max_workers + self.max_queue)
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Number of running plus queued jobs."""
+        return self._pending
+
+    @property
+    def is_full(self) -> bool:
+        """Whether a new job would currently be rejected (ignoring ``queue_timeout``)."""
+        return self._pending >= self.max_workers + self.max_queue
+
+    def submit(self, tex_content: str, jobname: str = 'document',
+               assets: Optional[Dict[str, bytes]] = None,
+               format_cache: Optional[LatexFormatCache] = None) -> 'Future[Optional[bytes]]':
+        """
+        Queue a compile job.
+
+        Args:
+            tex_content: Full LaTeX document
+            jobname: Base name for the build files
+            assets: Extra files (name -> bytes) to place next to the document, e.g. images
+            format_cache: Precompiled format cache to try before a cold compile
+
+        Returns:
+            Future[Optional[bytes]]: Resolves to the PDF bytes, or None if compilation failed
+
+        Raises:
+            CompileQueueFullError: If the queue stays full for longer than ``queue_timeout``
+        """
+        if self.queue_timeout:
+            acquired = self._slots.acquire(timeout=self.queue_timeout)
+        else:
+            acquired = self._slots.acquire(blocking=False)
+        if not acquired:
+            raise CompileQueueFullError(f"LaTeX compile queue is full ({self.max_workers + self.max_queue} jobs)")
+
+        with self._pending_lock:
+            self._pending += 1
+        try:
+            future = self._executor.submit(self._run_job, tex_content, jobname, assets or {}, format_cache)
+        except Exception:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        return future
+
+    def compile(self, tex_content: str, jobname: str = 'document',
+                assets: Optional[Dict[str, bytes]] = None,
+                format_cache: Optional[LatexFormatCache] = None) -> Optional[bytes]:
+        """Compile a document and wait for the result. See ``submit``."""
+        return self.submit(tex_content, jobname, assets, format_cache).result()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting jobs and shut the pool down."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _release(self) -> None:
+        with self._pending_lock:
+            self._pending -= 1
+        self._slots.release()
+
+    def _run_job(self, tex_content: str, jobname: str, assets: Dict[str, bytes],
+                 format_cache: Optional[LatexFormatCache]) -> Optional[bytes]:
+        if self.build_root:
+            Path(self.build_root).mkdir(parents=True, exist_ok=True)
+        build_dir = Path(tempfile.mkdtemp(prefix='latex-', dir=self.build_root))
+        try:
+            for name, content in assets.items():
+                (build_dir / Path(name).name).write_bytes(content)
+
+            if format_cache:
+                prepared = format_cache.prepare(tex_content)
+                if prepared:
+                    fmt_name, fmt_content = prepared
+                    fmt_source = build_dir / f"{jobname}_fmt.tex"
+                    fmt_source.write_text(fmt_content)
+                    try:
+                        pdf_content = self._run_pdflatex(
+                            build_dir, fmt_source.name, jobname,
+                            extra_args=[f'-fmt={fmt_name}'],
+                            env=format_cache.get_env()
+                        )
+                    except CompileTimeoutError:
+                        # A broken format can hang pdflatex just as well as fail it
+                        pdf_content = None
+                    if pdf_content:
+                        return pdf_content
+                    logger.warning(f"Compile with format {fmt_name} failed, retrying without it")
+                    format_cache.mark_failed(fmt_name)
+
+            source = build_dir / f"{jobname}.tex"
+            source.write_text(tex_content)
+            return self._run_pdflatex(build_dir, source.name, jobname)
+        finally:
+            shutil.rmtree(build_dir, ignore_errors=True)
+
+    def _run_pdflatex(self, build_dir: Path, source_name: str, jobname: str,
+                      extra_args: Optional[List[str]] = None, env: Optional[dict] = None) -> Optional[bytes]:
+        args = [self.compiler, '-interaction=nonstopmode',
+                f'-jobname={jobname}', *(extra_args or []), source_name]
+        if os.name == 'posix' and self.memory_limit_mb:
+            # The shell sets the limit and execs pdflatex; preexec_fn is not safe in a threaded process
+            args = ['sh', '-c', f'ulimit -v {self.memory_limit_mb * 1024} && exec "$@"', 'sh', *args]
+        try:
+            result = subprocess.run(
+                args,
+                cwd=build_dir,
+                capture_output=True,
+                text=True,
+                env=env,
+                timeout=self.timeout_seconds
+            )
+        except subprocess.TimeoutExpired:
+            raise CompileTimeoutError(f"pdflatex exceeded {self.timeout_seconds}s")
+
+        if result.returncode != 0:
+            logger.error(f"LaTeX Error Output:\n{result.stderr}")
+            logger.error(f"LaTeX Standard Output:\n{result.stdout}")
+            return None
+
+        pdf_path = build_dir / f"{jobname}.pdf"
+        if pdf_path.exists():
+            return pdf_path.read_bytes()
+        logger.error("PDF file not found after compilation")
+        return None
+
+
+_compile_service: Optional[LatexCompileService] = None
+_compile_service_lock = threading.Lock()
+
+
+def get_compile_service() -> LatexCompileService:
+    """Get the process-wide LaTeX compile service."""
+    global _compile_service
+    if _compile_service is None:
+        with _compile_service_lock:
+            if _compile_service is None:
+                _compile_service = LatexCompileService()
+    return _compile_service
@@ -1,66 +1,75 @@
-import subprocess
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
+from config.cache_config import CacheConfig
 from config.logger_config import setup_logger
 from config.settings import OUTPUT_DIR
 from src.core.database.factory import get_unit_of_work
 from src.generator.utils.output_manager import OutputManager
+from src.latex.compile_service import LatexCompileService, get_compile_service
+from src.latex.utils.errors import CompileQueueFullError
+from src.latex.utils.format_cache import LatexFormatCache, get_format_cache
+from src.latex.utils.pdf_cache import PdfCache, get_compiler_version, get_pdf_cache
 
 logger = setup_logger(__name__)
 
 class LatexCompiler(ABC):
     """Abstract base class for LaTeX compilation."""
     
-    def __init__(self):
+    def __init__(self, use_format_cache: Optional[bool] = None,
+                 compile_service: Optional[LatexCompileService] = None,
+                 use_pdf_cache: Optional[bool] = None):
         self.uow = get_unit_of_work()
+        if use_format_cache is None:
+            use_format_cache = CacheConfig.get_latex_format_cache_config().enabled
+        if use_pdf_cache is None:
+            use_pdf_cache = CacheConfig.get_pdf_cache_config().enabled
+        self.format_cache: Optional[LatexFormatCache] = get_format_cache() if use_format_cache else None
+        self.pdf_cache: Optional[PdfCache] = get_pdf_cache() if use_pdf_cache else None
+        self.compile_service = compile_service or get_compile_service()
 
     @abstractmethod
     def _generate_tex_content(self, *args, **kwargs) -> str:
         """Generate LaTeX content. Must be implemented by subclasses."""
         pass
 
-    def compile_pdf(self, tex_path: Path, tex_content: str, output_manager: OutputManager) -> Optional[bytes]:
-        """Compile LaTeX content to PDF."""
+    def compile_pdf(self, tex_path: Path, tex_content: str, output_manager: OutputManager,
+                    assets: Optional[Dict[str, bytes]] = None) -> Optional[bytes]:
+        """
+        Compile LaTeX content to PDF.
+
+        Identical sources (same tex, compiler version and assets) are served from the
+        PDF cache. Otherwise the build runs in an isolated sandbox on the shared compile
+        pool; only the resulting .tex and .pdf are written next to tex_path.
+
+        Raises:
+            CompileQueueFullError: If the compile pool is saturated
+        """
         try:
-            # Write content to file
-            tex_path.write_text(tex_content)
-            
-            # Run pdflatex in the output directory
-            result = subprocess.run(
-                ['pdflatex', '-interaction=nonstopmode', tex_path.name],
-                cwd=output_manager.output_dir,
-                capture_output=True,
-                text=True
-            )
-            
-            if result.returncode != 0:
-                logger.error(f"LaTeX Error Output:\n{result.stderr}")
-                logger.error(f"LaTeX Standard Output:\n{result.stdout}")
-                return None
-            
-            pdf_path = tex_path.with_suffix('.pdf')
-            if pdf_path.exists():
-                return pdf_path.read_bytes()
-            else:
-                logger.error("PDF file not found after compilation")
-                return None
-            
+            cache_key = None
+            pdf_content = None
+            if self.pdf_cache:
+                cache_key = PdfCache.make_key(tex_content, get_compiler_version(self.compile_service.compiler), assets)
+                pdf_content = self.pdf_cache.get(cache_key)
+
+            if pdf_content is None:
+                pdf_content = self.compile_service.compile(
+                    tex_content,
+                    jobname=tex_path.stem,
+                    assets=assets,
+                    format_cache=self.format_cache
+                )
+                if pdf_content and cache_key:
+                    self.pdf_cache.set(cache_key, pdf_content)
+
+            if pdf_content:
+                tex_path.write_text(tex_content)
+                tex_path.with_suffix('.pdf').write_bytes(pdf_content)
+            return pdf_content
+
+        except CompileQueueFullError:
+            raise
         except Exception as e:
             logger.error(f"Error during PDF compilation: {str(e)}")
             return None
-        finally:
-            self._cleanup_temp_files(tex_path)
-
-    def _cleanup_temp_files(self, tex_path: Path) -> None:
-        """Clean up temporary LaTeX files."""
-        output_dir = tex_path.parent
-        extensions = ['.aux', '.log', '.out']
-        for ext in extensions:
-            temp_file = output_dir / f"{tex_path.stem}{ext}"
-            if temp_file.exists():
-                try:
-                    temp_file.unlink()
-                except Exception as e:
-                    logger.warning(f"Failed to cleanup {temp_file}: {e}")
\ No newline at end of file
@@ -1,9 +1,11 @@
 from typing import Dict, Optional
 from ..latex_compiler import LatexCompiler
 from ..utils import LatexEscaper, LatexPlaceholder
+from ..utils.errors import CompileQueueFullError
 import logging
 from src.core.database.factory import get_unit_of_work
 from src.latex.latex_compiler import OutputManager
+from src.loaders.template_registry import get_template_registry
 
 logger = logging.getLogger(__name__)
 
@@ -19,15 +21,16 @@ class ResumeLatexCompiler(LatexCompiler):
         try:
             tex_path = output_manager.get_resume_path()
             
-            with self.uow:
-                preamble = self.uow.get_resume_preamble()
-                if not preamble:
-                    logger.error("Preamble not found in database")
-                    return None
+            preamble = get_template_registry().get_preamble("resume_preamble")
+            if not preamble:
+                logger.error("Preamble not found in database")
+                return None
 
-                tex_content = self._generate_tex_content(preamble, content_dict)
-                return self.compile_pdf(tex_path, tex_content, output_manager)
+            tex_content = self._generate_tex_content(preamble, content_dict)
+            return self.compile_pdf(tex_path, tex_content, output_manager)
                 
+        except CompileQueueFullError:
+            raise
         except Exception as e:
             logger.error(f"Failed to generate PDF: {e}")
             return None
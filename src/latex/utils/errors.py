@@ -0,0 +1,11 @@
+class LatexError(Exception):
+    """Base exception class for LaTeX compilation errors."""
+    pass
+
+class CompileQueueFullError(LatexError):
+    """Raised when the compile queue is full and cannot accept more jobs."""
+    pass
+
+class CompileTimeoutError(LatexError):
+    """Raised when a compile exceeds its wall-clock limit."""
+    pass
@@ -0,0 +1,160 @@
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from config.cache_config import CacheConfig
+from config.logger_config import setup_logger
+
+logger = setup_logger(__name__)
+
+# Lines that load code worth dumping into a format
+_LOAD_LINE = re.compile(r'^\s*\\(documentclass|usepackage|RequirePackage)\b')
+_BEGIN_DOCUMENT = '\\begin{document}'
+_END_OF_DUMP = '\\endofdump'
+
+
+def split_preamble(tex_content: str) -> Optional[Tuple[str, str]]:
+    """
+    Split a document into the static, package-loading head of its preamble and the rest.
+
+    The head runs up to and including the last \\documentclass / \\usepackage line, so
+    per-document settings that follow (placeholders, \\graphicspath, ...) stay out of
+    the format and do not force a rebuild.
+
+    Returns:
+        Optional[Tuple[str, str]]: (head, rest) or None if the document has no preamble
+    """
+    begin = tex_content.find(_BEGIN_DOCUMENT)
+    if begin == -1:
+        return None
+
+    lines = tex_content[:begin].splitlines(keepends=True)
+    last_load = max((i for i, line in enumerate(lines) if _LOAD_LINE.match(line)), default=-1)
+    if last_load == -1:
+        return None
+
+    head = ''.join(lines[:last_load + 1])
+    return head, tex_content[len(head):]
+
+
+class LatexFormatCache:
+    """
+    Builds and caches pdflatex format files (.fmt) for document preambles.
+
+    Formats are created with mylatexformat and named after a hash of the preamble head,
+    so a changed preamble document automatically gets a fresh format on its next compile.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, compiler: str = 'pdflatex'):
+        self.cache_dir = Path(cache_dir or CacheConfig.get_latex_format_cache_config().directory)
+        self.compiler = compiler
+        self._lock = threading.Lock()
+        self._failed: Dict[str, bool] = {}
+
+    @staticmethod
+    def format_name(preamble_head: str) -> str:
+        """Get the format name for a preamble head."""
+        return f"preamble_{hashlib.sha256(preamble_head.encode('utf-8')).hexdigest()[:16]}"
+
+    def prepare(self, tex_content: str) -> Optional[Tuple[str, str]]:
+        """
+        Get a format for a document, building it if needed.
+
+        Args:
+            tex_content: Full LaTeX document
+
+        Returns:
+            Optional[Tuple[str, str]]: (format name, document rewritten to use the format),
+            or None when the document cannot use a precompiled format
+        """
+        parts = split_preamble(tex_content)
+        if not parts:
+            return None
+        head, rest = parts
+
+        name = self.format_name(head)
+        if not self._ensure_format(name, head):
+            return None
+        return name, f"{head}{_END_OF_DUMP}\n{rest}"
+
+    def get_env(self) -> Dict[str, str]:
+        """Environment that lets pdflatex find the cached formats."""
+        env = os.environ.copy()
+        # Trailing separator keeps the default kpathsea search path
+        env['TEXFORMATS'] = f"{self.cache_dir}{os.pathsep}{env.get('TEXFORMATS', '')}"
+        return env
+
+    def mark_failed(self, name: str) -> None:
+        """Stop using a format that produced a failed compile."""
+        with self._lock:
+            self._failed[name] = True
+
+    def clear(self) -> None:
+        """Remove every cached format."""
+        with self._lock:
+            self._failed.clear()
+            if self.cache_dir.exists():
+                shutil.rmtree(self.cache_dir)
+
+    def _ensure_format(self, name: str, head: str) -> bool:
+        fmt_path = self.cache_dir / f"{name}.fmt"
+        if fmt_path.exists():
+            return not self._failed.get(name, False)
+
+        with self._lock:
+            if fmt_path.exists():
+                return not self._failed.get(name, False)
+            if self._failed.get(name):
+                return False
+            built = self._build_format(name, head, fmt_path)
+            if not built:
+                self._failed[name] = True
+            return built
+
+    def _build_format(self, name: str, head: str, fmt_path: Path) -> bool:
+        logger.info(f"Building LaTeX format {name}")
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=self.cache_dir) as build_dir:
+            source = Path(build_dir) / f"{name}.tex"
+            source.write_text(f"{head}{_END_OF_DUMP}\n{_BEGIN_DOCUMENT}\n\\end{{document}}\n")
+            try:
+                result = subprocess.run(
+                    [self.compiler, '-ini', '-interaction=nonstopmode', f'-jobname={name}',
+                     f'&{self.compiler}', 'mylatexformat.ltx', source.name],
+                    cwd=build_dir,
+                    capture_output=True,
+                    text=True,
+                    timeout=120
+                )
+            except (OSError, subprocess.TimeoutExpired) as e:
+                logger.warning(f"Could not build LaTeX format {name}: {e}")
+                return False
+
+            built = Path(build_dir) / f"{name}.fmt"
+            if result.returncode != 0 or not built.exists():
+                logger.warning(f"Building LaTeX format {name} failed, falling back to cold compiles:\n{result.stdout[-2000:]}")
+                return False
+
+            # Atomic publish so concurrent compiles never see a partial file
+            os.replace(built, fmt_path)
+        return True
+
+
+_format_cache: Optional[LatexFormatCache] = None
+_format_cache_lock = threading.Lock()
+
+
+def get_format_cache() -> LatexFormatCache:
+    """Get the process-wide LaTeX format cache."""
+    global _format_cache
+    if _format_cache is None:
+        with _format_cache_lock:
+            if _format_cache is None:
+                _format_cache = LatexFormatCache()
+    return _format_cache
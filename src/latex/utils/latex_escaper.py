@@ -1,60 +1,125 @@
+from typing import Any, Iterable, List
+
+# Special characters to escape
+_SPECIAL_CHARS = {
+    '&': '\\&',
+    '%': '\\%',
+    '$': '\\$',
+    '#': '\\#',
+    '_': '\\_',
+    '{': '\\{',
+    '}': '\\}',
+    '~': '\\textasciitilde{}',
+    '^': '\\textasciicircum{}',
+    # '\\': '\\textbackslash{}',
+    '<': '\\textless{}',
+    '>': '\\textgreater{}'
+}
+
+# Braces come before the replacements that introduce them, so nothing is escaped twice
+_REPLACEMENTS = tuple(_SPECIAL_CHARS.items())
+
+
 class LatexEscaper:
     """Handles escaping of special characters for LaTeX."""
-    
+
     @staticmethod
     def escape_text(text: str) -> str:
         """
         Escape special characters for LaTeX, preserving existing LaTeX commands.
-        
+
         Args:
             text: Text to escape
-            
+
         Returns:
             Escaped text safe for LaTeX
         """
         if not isinstance(text, str):
             text = str(text)
-            
+
         # Don't escape existing LaTeX commands
         if text.startswith('\\'):
             return text
-            
-        # Special characters to escape
-        special_chars = {
-            '&': '\\&',
-            '%': '\\%',
-            '$': '\\$',
-            '#': '\\#',
-            '_': '\\_',
-            '{': '\\{',
-            '}': '\\}',
-            '~': '\\textasciitilde{}',
-            '^': '\\textasciicircum{}',
-            # '\\': '\\textbackslash{}',
-            '<': '\\textless{}',
-            '>': '\\textgreater{}'
-        }
-        
-        # Replace special characters
-        for char, replacement in special_chars.items():
-            # Skip if it looks like a LaTeX command
-            if not text.startswith('\\'):
+
+        # The membership test is a C-level scan, so characters that do not occur
+        # cost almost nothing and plain text comes back untouched
+        for char, replacement in _REPLACEMENTS:
+            if char in text:
                 text = text.replace(char, replacement)
-                
+
+        return text
+
+    @staticmethod
+    def unescape_text(text: str) -> str:
+        """
+        Undo escape_text, e.g. to send escaped values to an LLM as plain text.
+
+        Args:
+            text: Text escaped with escape_text
+
+        Returns:
+            The original text
+        """
+        if '\\' not in text:
+            return text
+        # Reverse order, so braces introduced by e.g. \textless{} are restored last
+        for char, replacement in reversed(_REPLACEMENTS):
+            if replacement in text:
+                text = text.replace(replacement, char)
         return text
-    
+
+    @classmethod
+    def escape_many(cls, texts: Iterable[Any]) -> List[str]:
+        """
+        Escape a sequence of values.
+
+        Args:
+            texts: Values to escape; non-strings are converted with str()
+
+        Returns:
+            List of escaped strings in the same order
+        """
+        escape = cls.escape_text
+        return [escape(text) for text in texts]
+
+    @classmethod
+    def escape_tree(cls, data: Any) -> Any:
+        """
+        Escape every string in a nested structure of dicts, lists and tuples.
+
+        Keys and non-string leaves are left untouched.
+
+        Args:
+            data: Nested structure, e.g. a portfolio section
+
+        Returns:
+            A copy of the structure with escaped string values
+        """
+        escape = cls.escape_text
+
+        def walk(value: Any) -> Any:
+            if isinstance(value, str):
+                return escape(value)
+            if isinstance(value, dict):
+                return {k: walk(v) for k, v in value.items()}
+            if isinstance(value, (list, tuple)):
+                return type(value)(walk(v) for v in value)
+            return value
+
+        return walk(data)
+
     @classmethod
     def escape_dict(cls, data: dict) -> dict:
         """
         Escape all string values in a dictionary.
-        
+
         Args:
             data: Dictionary with string values
-            
+
         Returns:
             Dictionary with escaped string values
         """
         return {
-            k: cls.escape_text(v) if isinstance(v, str) else v 
+            k: cls.escape_text(v) if isinstance(v, str) else v
             for k, v in data.items()
-        } 
\ No newline at end of file
+        }
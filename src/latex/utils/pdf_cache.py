@@ -0,0 +1,206 @@
+import hashlib
+import os
+import subprocess
+import tempfile
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from config.cache_config import CacheConfig
+from config.logger_config import setup_logger
+from src.core.database.factory import get_database_connection
+
+logger = setup_logger(__name__)
+
+# Log the hit ratio every this many lookups
+_STATS_LOG_INTERVAL = 50
+
+
+@lru_cache(maxsize=None)
+def get_compiler_version(compiler: str = 'pdflatex') -> str:
+    """First line of ``<compiler> --version``, or 'unknown' if it cannot be run."""
+    try:
+        result = subprocess.run([compiler, '--version'], capture_output=True, text=True, timeout=10)
+        return result.stdout.splitlines()[0].strip() if result.stdout else 'unknown'
+    except (OSError, subprocess.TimeoutExpired):
+        return 'unknown'
+
+
+class PdfCache:
+    """
+    Content-addressed store of compiled PDFs.
+
+    Entries live on local disk with size-bounded LRU eviction and, optionally, in a
+    MongoDB collection shared between nodes whose entries expire through a TTL index.
+    Identical tex sources compiled with the same compiler and assets return the stored
+    PDF without running pdflatex.
+    """
+
+    def __init__(self, directory: Optional[Path] = None, max_bytes: Optional[int] = None,
+                 collection=None, use_mongo: Optional[bool] = None, ttl_seconds: Optional[int] = None):
+        config = CacheConfig.get_pdf_cache_config()
+        self.directory = Path(directory or config.directory)
+        self.max_bytes = max_bytes or config.max_bytes
+        self.use_mongo = config.use_mongo if use_mongo is None else use_mongo
+        self.ttl_seconds = ttl_seconds or config.ttl_seconds
+        self._collection = collection
+        self._indexes_created = False
+        self._lock = threading.Lock()
+        self._entries: Optional["OrderedDict[str, int]"] = None
+        self._size = 0
+        self.hits = 0
+        self.mongo_hits = 0
+        self.misses = 0
+
+    @property
+    def collection(self):
+        if self._collection is None:
+            self._collection = get_database_connection().db[CacheConfig.get_pdf_cache_config().collection]
+        if not self._indexes_created:
+            self._collection.create_index('created_at', expireAfterSeconds=self.ttl_seconds)
+            self._indexes_created = True
+        return self._collection
+
+    @staticmethod
+    def make_key(tex_content: str, compiler_version: str,
+                 assets: Optional[Dict[str, bytes]] = None) -> str:
+        """
+        Build the cache key for a compile.
+
+        Args:
+            tex_content: Final LaTeX source
+            compiler_version: Compiler version string
+            assets: Files placed next to the source, e.g. the signature image
+
+        Returns:
+            str: Hex SHA-256 digest identifying the compile
+        """
+        digest = hashlib.sha256()
+        for part in (compiler_version, tex_content):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        for name, content in sorted((assets or {}).items()):
+            digest.update(name.encode('utf-8'))
+            digest.update(b'\0')
+            digest.update(hashlib.sha256(content).digest())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Look up a compiled PDF, checking local disk first and then MongoDB."""
+        path = self._path(key)
+        pdf_content = None
+        try:
+            pdf_content = path.read_bytes()
+            os.utime(path)
+            with self._lock:
+                self._load_index()
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"PDF cache read failed: {e}")
+
+        from_mongo = False
+        if pdf_content is None and self.use_mongo:
+            try:
+                doc = self.collection.find_one({'_id': key})
+            except Exception as e:
+                logger.warning(f"PDF cache lookup failed: {e}")
+                doc = None
+            if doc is not None:
+                pdf_content = bytes(doc['pdf'])
+                from_mongo = True
+                self._write_local(key, pdf_content)
+
+        with self._lock:
+            if pdf_content is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.mongo_hits += from_mongo
+            lookups = self.hits + self.misses
+        if lookups % _STATS_LOG_INTERVAL == 0:
+            logger.info(f"PDF cache hit ratio {self.hits / lookups:.1%} over {lookups} lookups")
+        return pdf_content
+
+    def set(self, key: str, pdf_content: bytes) -> None:
+        """Store a compiled PDF."""
+        self._write_local(key, pdf_content)
+        if self.use_mongo:
+            try:
+                self.collection.replace_one(
+                    {'_id': key},
+                    {'_id': key, 'pdf': pdf_content, 'created_at': datetime.now(timezone.utc)},
+                    upsert=True
+                )
+            except Exception as e:
+                logger.warning(f"PDF cache write failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit / miss counters and disk usage."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'mongo_hits': self.mongo_hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / lookups if lookups else 0.0,
+            'entries': len(self._entries or ()),
+            'size_bytes': self._size
+        }
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.pdf"
+
+    def _load_index(self) -> None:
+        # Caller holds the lock; picks up entries left by earlier processes, oldest first
+        if self._entries is not None:
+            return
+        files = []
+        if self.directory.exists():
+            for path in self.directory.glob('*/*.pdf'):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, path.stem, stat.st_size))
+        self._entries = OrderedDict((key, size) for _, key, size in sorted(files))
+        self._size = sum(self._entries.values())
+
+    def _write_local(self, key: str, pdf_content: bytes) -> None:
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(pdf_content)
+            os.replace(tmp_name, path)
+        except OSError as e:
+            logger.warning(f"PDF cache write failed: {e}")
+            return
+
+        with self._lock:
+            self._load_index()
+            self._size += len(pdf_content) - self._entries.pop(key, 0)
+            self._entries[key] = len(pdf_content)
+            while self._size > self.max_bytes and len(self._entries) > 1:
+                old_key, old_size = self._entries.popitem(last=False)
+                self._size -= old_size
+                self._path(old_key).unlink(missing_ok=True)
+
+
+_pdf_cache: Optional[PdfCache] = None
+_pdf_cache_lock = threading.Lock()
+
+
+def get_pdf_cache() -> PdfCache:
+    """Get the process-wide PDF cache."""
+    global _pdf_cache
+    if _pdf_cache is None:
+        with _pdf_cache_lock:
+            if _pdf_cache is None:
+                _pdf_cache = PdfCache()
+    return _pdf_cache
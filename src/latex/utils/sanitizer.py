@@ -1,13 +1,27 @@
 import unicodedata
 from typing import Union
 
+
+class _ControlCharFilter(dict):
+    """str.translate table that drops control/format characters, filled in lazily per code point."""
+
+    def __missing__(self, code: int):
+        value = None if unicodedata.category(chr(code))[0] == 'C' else code
+        self[code] = value
+        return value
+
+
+# ASCII control characters are known up front; anything else is classified on first sight
+_CONTROL_CHARS = _ControlCharFilter({code: None for code in (*range(32), 127)})
+
+
 def sanitize_text(text: Union[str, bytes]) -> str:
     """
     Sanitize text by removing problematic characters and handling different input types.
-    
+
     Args:
         text: Input text as string or bytes
-        
+
     Returns:
         Sanitized string
     """
@@ -15,8 +29,8 @@ def sanitize_text(text: Union[str, bytes]) -> str:
         text = text.decode('utf-8')
     elif not isinstance(text, str):
         text = str(text)
-        
-    return ''.join(
-        char for char in unicodedata.normalize('NFKD', text)
-        if unicodedata.category(char)[0] != 'C'
-    ) 
\ No newline at end of file
+
+    # NFKD leaves ASCII unchanged
+    if not text.isascii():
+        text = unicodedata.normalize('NFKD', text)
+    return text.translate(_CONTROL_CHARS)
@@ -0,0 +1,190 @@
+"""Process-wide registry of pooled LLM provider clients."""
+
+import asyncio
+import importlib.util
+import os
+import threading
+import weakref
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+import anthropic
+import httpx
+import openai
+import requests
+from requests.adapters import HTTPAdapter
+import logging
+
+from config.llm_config import LLMConfig
+
+logger = logging.getLogger(__name__)
+
+
+class ProviderClientRegistry:
+    """
+    Lazily creates and shares one pooled client per provider and API key (or URI).
+
+    Strategies borrow their SDK clients from this registry, so HTTP connection pools,
+    keep-alive connections and TLS sessions are set up once per process instead of
+    once per strategy. Async clients are additionally scoped to their event loop,
+    because pooled connections cannot move between loops. Like the MongoDB client
+    registry, it is fork-safe: a child process never reuses the parent's clients.
+    """
+
+    _lock = threading.Lock()
+    _pid = os.getpid()
+    _clients: Dict[Tuple[str, Hashable], Any] = {}
+    _async_clients: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, Hashable], Any]]' = \
+        weakref.WeakKeyDictionary()
+    _clients_created = 0
+    _configured_gemini_key = None
+
+    @classmethod
+    def _check_pid(cls) -> None:
+        if cls._pid != os.getpid():
+            cls._reset_after_fork()
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        # Sockets must never be shared across fork; drop the clients without closing
+        cls._lock = threading.Lock()
+        cls._pid = os.getpid()
+        cls._clients = {}
+        cls._async_clients = weakref.WeakKeyDictionary()
+        cls._configured_gemini_key = None
+
+    @staticmethod
+    def _httpx_options() -> Dict[str, Any]:
+        config = LLMConfig.get_http_pool_config()
+        http2 = config.http2 and importlib.util.find_spec("h2") is not None
+        return {
+            'http2': http2,
+            'limits': httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry
+            )
+        }
+
+    @classmethod
+    def _get(cls, kind: str, key: Hashable, factory: Callable[[], Any]) -> Any:
+        cls._check_pid()
+        client = cls._clients.get((kind, key))
+        if client is not None:
+            return client
+
+        with cls._lock:
+            client = cls._clients.get((kind, key))
+            if client is None:
+                client = factory()
+                cls._clients[(kind, key)] = client
+                cls._clients_created += 1
+                logger.info(f"Created shared {kind} client")
+            return client
+
+    @classmethod
+    def _get_async(cls, kind: str, key: Hashable, factory: Callable[[], Any]) -> Any:
+        cls._check_pid()
+        loop = asyncio.get_running_loop()
+        with cls._lock:
+            clients = cls._async_clients.setdefault(loop, {})
+            client = clients.get((kind, key))
+            if client is None:
+                client = factory()
+                clients[(kind, key)] = client
+                cls._clients_created += 1
+                logger.info(f"Created shared async {kind} client")
+            return client
+
+    @classmethod
+    def get_openai_client(cls, api_key: str) -> openai.OpenAI:
+        """Get the shared OpenAI client for an API key."""
+        return cls._get('openai', api_key, lambda: openai.OpenAI(
+            api_key=api_key, http_client=openai.DefaultHttpxClient(**cls._httpx_options())
+        ))
+
+    @classmethod
+    def get_async_openai_client(cls, api_key: str) -> openai.AsyncOpenAI:
+        """Get the shared AsyncOpenAI client for an API key on the running event loop."""
+        return cls._get_async('openai', api_key, lambda: openai.AsyncOpenAI(
+            api_key=api_key, http_client=openai.DefaultAsyncHttpxClient(**cls._httpx_options())
+        ))
+
+    @classmethod
+    def get_anthropic_client(cls, api_key: str) -> anthropic.Anthropic:
+        """Get the shared Anthropic client for an API key."""
+        return cls._get('anthropic', api_key, lambda: anthropic.Anthropic(
+            api_key=api_key, http_client=anthropic.DefaultHttpxClient(**cls._httpx_options())
+        ))
+
+    @classmethod
+    def get_async_anthropic_client(cls, api_key: str) -> anthropic.AsyncAnthropic:
+        """Get the shared AsyncAnthropic client for an API key on the running event loop."""
+        return cls._get_async('anthropic', api_key, lambda: anthropic.AsyncAnthropic(
+            api_key=api_key, http_client=anthropic.DefaultAsyncHttpxClient(**cls._httpx_options())
+        ))
+
+    @classmethod
+    def get_ollama_session(cls, base_url: str) -> requests.Session:
+        """Get the shared keep-alive session for an Ollama server."""
+        def create() -> requests.Session:
+            config = LLMConfig.get_http_pool_config()
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=config.max_connections)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            return session
+        return cls._get('ollama', base_url, create)
+
+    @classmethod
+    def get_async_ollama_client(cls, base_url: str) -> httpx.AsyncClient:
+        """Get the shared httpx client for an Ollama server on the running event loop."""
+        # Local generations can take minutes, so there is no read timeout
+        return cls._get_async('ollama', base_url, lambda: httpx.AsyncClient(
+            base_url=base_url, timeout=httpx.Timeout(None, connect=10.0), **cls._httpx_options()
+        ))
+
+    @classmethod
+    def get_gemini_model(cls, api_key: str, model_name: str, generation_config: Dict[str, Any]):
+        """Get a shared GenerativeModel for an API key, model and generation config."""
+        import google.generativeai as genai
+
+        def create():
+            # genai keeps its transport in module state; configure it once per key
+            if cls._configured_gemini_key != api_key:
+                genai.configure(api_key=api_key)
+                cls._configured_gemini_key = api_key
+            return genai.GenerativeModel(model_name=model_name, generation_config=generation_config)
+
+        key = (api_key, model_name, tuple(sorted(generation_config.items())))
+        return cls._get('gemini', key, create)
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close every synchronous client. Async clients are released with their event loop."""
+        with cls._lock:
+            if cls._pid != os.getpid():
+                return
+            for client in cls._clients.values():
+                close = getattr(client, 'close', None)
+                if close:
+                    try:
+                        close()
+                    except Exception as e:
+                        logger.warning(f"Error closing provider client: {e}")
+            cls._clients = {}
+        logger.info("Closed shared provider clients")
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        """
+        Get client counts for this process.
+
+        Returns:
+            Dict[str, Any]: Live sync / async clients and clients created since start
+        """
+        return {
+            'pid': os.getpid(),
+            'clients': len(cls._clients),
+            'async_clients': sum(len(clients) for clients in list(cls._async_clients.values())),
+            'clients_created': cls._clients_created,
+        }
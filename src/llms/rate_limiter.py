@@ -0,0 +1,302 @@
+"""Client-side token-bucket rate limiting and in-flight request caps for LLM providers."""
+
+import asyncio
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional, Tuple
+import logging
+
+from config.llm_config import LLMConfig, RateLimitConfig
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Rough English average; good enough to keep budgets honest without a tokenizer
+CHARS_PER_TOKEN = 4
+
+# Optimistic-concurrency attempts against MongoDB before falling back to the local bucket
+MAX_CAS_ATTEMPTS = 10
+
+# How often a coroutine waiting for a request slot checks again
+SLOT_POLL_SECONDS = 0.05
+
+
+def estimate_tokens(text: str, max_tokens: Optional[int] = None) -> int:
+    """
+    Estimate the tokens a request will consume.
+
+    Args:
+        text: Everything sent to the model (system prompt and formatted prompt)
+        max_tokens: Completion budget requested from the provider
+
+    Returns:
+        int: Estimated prompt tokens plus the completion budget
+    """
+    return max(1, len(text) // CHARS_PER_TOKEN) + (max_tokens or 0)
+
+
+def take(tokens: float, updated_at: float, amount: float, capacity: float,
+         rate: float, now: float) -> Tuple[float, float]:
+    """
+    Refill a bucket up to ``now`` and take ``amount`` from it.
+
+    The bucket may go negative: the caller reserves its share now and waits until the
+    debt is paid off, so callers are spaced out evenly instead of retrying in bursts.
+
+    Returns:
+        Tuple[float, float]: The new token count and the seconds to wait
+    """
+    tokens = min(capacity, tokens + max(0.0, now - updated_at) * rate) - amount
+    return tokens, max(0.0, -tokens / rate)
+
+
+class BucketStore(ABC):
+    """Storage for token buckets; shared stores make the limit global."""
+
+    blocking = False
+
+    @abstractmethod
+    def reserve(self, key: str, amount: float, capacity: float, rate: float, now: float) -> float:
+        """Take ``amount`` from bucket ``key`` and return the seconds to wait before sending."""
+        pass
+
+
+class InMemoryBucketStore(BucketStore):
+    """Buckets shared by the threads and event loops of one process."""
+
+    def __init__(self):
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, key: str, amount: float, capacity: float, rate: float, now: float) -> float:
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (capacity, now))
+            tokens, wait = take(tokens, updated_at, amount, capacity, rate, now)
+            self._buckets[key] = (tokens, now)
+            return wait
+
+
+class FileBucketStore(BucketStore):
+    """Buckets in a JSON file guarded by an exclusive lock, shared by processes on one node."""
+
+    blocking = True
+
+    def __init__(self, path: str):
+        if fcntl is None:
+            raise RuntimeError("The file rate limit backend needs fcntl (not available on Windows)")
+        self.path = path
+        self._lock = threading.Lock()
+
+    def reserve(self, key: str, amount: float, capacity: float, rate: float, now: float) -> float:
+        with self._lock, open(self.path, 'a+') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                content = f.read()
+                buckets = json.loads(content) if content else {}
+                tokens, updated_at = buckets.get(key, (capacity, now))
+                tokens, wait = take(tokens, updated_at, amount, capacity, rate, now)
+                buckets[key] = (tokens, now)
+                f.seek(0)
+                f.truncate()
+                json.dump(buckets, f)
+                f.flush()
+                return wait
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class MongoBucketStore(BucketStore):
+    """Buckets in a MongoDB collection, shared by every node; updated with compare-and-set."""
+
+    blocking = True
+
+    def __init__(self, collection=None):
+        self._collection = collection
+
+    @property
+    def collection(self):
+        if self._collection is None:
+            from src.core.database.factory import get_database_connection
+            self._collection = get_database_connection().db[LLMConfig.get_rate_limit_config().collection]
+        return self._collection
+
+    def reserve(self, key: str, amount: float, capacity: float, rate: float, now: float) -> float:
+        from pymongo.errors import DuplicateKeyError
+
+        for _ in range(MAX_CAS_ATTEMPTS):
+            doc = self.collection.find_one({'_id': key})
+            if doc is None:
+                tokens, wait = take(capacity, now, amount, capacity, rate, now)
+                try:
+                    self.collection.insert_one({'_id': key, 'tokens': tokens, 'updated_at': now})
+                    return wait
+                except DuplicateKeyError:
+                    continue
+            tokens, wait = take(doc['tokens'], doc['updated_at'], amount, capacity, rate, now)
+            result = self.collection.update_one(
+                {'_id': key, 'tokens': doc['tokens'], 'updated_at': doc['updated_at']},
+                {'$set': {'tokens': tokens, 'updated_at': now}}
+            )
+            if result.modified_count:
+                return wait
+        raise RuntimeError(f"Too much contention on rate limit bucket {key}")
+
+
+class RateLimiter:
+    """
+    Per provider and model request and token budgets.
+
+    Each budget is a token bucket refilled at ``headroom * limit / 60`` per second and
+    holding ``burst_seconds`` worth of tokens. Callers reserve before sending and sleep
+    off any debt, which keeps throughput steady just under the provider limit. If a
+    shared store fails, the limiter degrades to a per-process bucket and keeps going.
+    """
+
+    def __init__(self, store: Optional[BucketStore] = None, config: Optional[RateLimitConfig] = None,
+                 clock=time.time):
+        self.config = config or LLMConfig.get_rate_limit_config()
+        self.store = store or InMemoryBucketStore()
+        self._fallback = self.store if isinstance(self.store, InMemoryBucketStore) else InMemoryBucketStore()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.throttled = 0
+        self.waited_seconds = 0.0
+
+    def reserve(self, provider: str, model: str, tokens: int) -> float:
+        """
+        Reserve one request and ``tokens`` tokens for a provider's model.
+
+        Returns:
+            float: Seconds to wait before sending the request
+        """
+        rpm, tpm = LLMConfig.get_rate_limits(provider, model)
+        wait = 0.0
+        if rpm:
+            wait = max(wait, self._reserve(f"{provider}:{model}:requests", 1, rpm))
+        if tpm:
+            wait = max(wait, self._reserve(f"{provider}:{model}:tokens", tokens, tpm))
+        if wait > 0:
+            with self._lock:
+                self.throttled += 1
+                self.waited_seconds += wait
+            logger.debug(f"Rate limiting {provider} {model}: waiting {wait:.2f}s")
+        return wait
+
+    def acquire(self, provider: str, model: str, tokens: int) -> None:
+        """Block until a request of ``tokens`` tokens fits in the provider's budget."""
+        wait = self.reserve(provider, model, tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, provider: str, model: str, tokens: int) -> None:
+        """Async version of acquire."""
+        if self.store.blocking:
+            wait = await asyncio.to_thread(self.reserve, provider, model, tokens)
+        else:
+            wait = self.reserve(provider, model, tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'backend': type(self.store).__name__,
+            'throttled': self.throttled,
+            'waited_seconds': round(self.waited_seconds, 3)
+        }
+
+    def _reserve(self, key: str, amount: float, per_minute: int) -> float:
+        rate = per_minute * self.config.headroom / 60
+        capacity = max(rate * self.config.burst_seconds, 1.0)
+        now = self._clock()
+        try:
+            return self.store.reserve(key, amount, capacity, rate, now)
+        except Exception as e:
+            logger.warning(f"Shared rate limit bucket unavailable, using the local one: {e}")
+            return self._fallback.reserve(key, amount, capacity, rate, now)
+
+
+class ConcurrencyLimiter:
+    """
+    Process-wide cap on in-flight requests per provider.
+
+    Every caller in the process (resume section pools, batch jobs, job workers and
+    async requests) takes its slot from the same per-provider semaphore, so
+    ``LLMConfig.get_max_concurrency`` bounds the provider rather than each caller.
+    """
+
+    def __init__(self, limits: Callable[[str], int] = LLMConfig.get_max_concurrency):
+        self._limits = limits
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def slot(self, provider: str) -> Iterator[None]:
+        """Hold one of the provider's request slots, waiting for a free one."""
+        semaphore = self._semaphore(provider)
+        semaphore.acquire()
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+    @asynccontextmanager
+    async def aslot(self, provider: str) -> AsyncIterator[None]:
+        """Async version of slot; waits without blocking the event loop."""
+        semaphore = self._semaphore(provider)
+        while not semaphore.acquire(blocking=False):
+            await asyncio.sleep(SLOT_POLL_SECONDS)
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+    def _semaphore(self, provider: str) -> threading.BoundedSemaphore:
+        semaphore = self._semaphores.get(provider)
+        if semaphore is None:
+            with self._lock:
+                semaphore = self._semaphores.setdefault(
+                    provider, threading.BoundedSemaphore(self._limits(provider)))
+        return semaphore
+
+
+_concurrency_limiter: Optional[ConcurrencyLimiter] = None
+_concurrency_limiter_lock = threading.Lock()
+
+
+def get_concurrency_limiter() -> ConcurrencyLimiter:
+    """Get the process-wide in-flight request limiter."""
+    global _concurrency_limiter
+    if _concurrency_limiter is None:
+        with _concurrency_limiter_lock:
+            if _concurrency_limiter is None:
+                _concurrency_limiter = ConcurrencyLimiter()
+    return _concurrency_limiter
+
+
+_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the process-wide rate limiter for the configured backend."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                config = LLMConfig.get_rate_limit_config()
+                if config.backend == 'mongo':
+                    store = MongoBucketStore()
+                elif config.backend == 'file':
+                    store = FileBucketStore(config.file_path)
+                else:
+                    store = InMemoryBucketStore()
+                _rate_limiter = RateLimiter(store, config)
+    return _rate_limiter
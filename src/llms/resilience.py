@@ -0,0 +1,193 @@
+"""Retry, circuit breaker and hedging helpers used by LLMRunner."""
+
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+import logging
+
+from config.llm_config import ResilienceConfig
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class CircuitBreaker:
+    """
+    Per-provider circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and calls fail fast
+    for ``reset_seconds``; then a single probe call is let through (half-open) and its
+    outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name: str, failure_threshold: int, reset_seconds: float,
+                 clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if self._clock() - self._opened_at >= self.reset_seconds:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow_request(self) -> bool:
+        """Whether a call may be made now; reserves the probe slot when half-open."""
+        with self._lock:
+            state = self.state
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info(f"Circuit for {self.name} closed")
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning(f"Circuit for {self.name} opened after {self._failures} failures")
+                self._opened_at = self._clock()
+            self._probing = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {'state': self.state, 'consecutive_failures': self._failures}
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(provider: str, config: ResilienceConfig) -> CircuitBreaker:
+    """Get the process-wide circuit breaker for a provider."""
+    breaker = _breakers.get(provider)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.setdefault(provider, CircuitBreaker(
+                provider, config.breaker_failure_threshold, config.breaker_reset_seconds
+            ))
+    return breaker
+
+
+def get_circuit_breaker_stats() -> Dict[str, Dict[str, Any]]:
+    """Get the state of every provider's circuit breaker."""
+    return {provider: breaker.get_stats() for provider, breaker in list(_breakers.items())}
+
+
+def backoff_delay(attempt: int, config: ResilienceConfig, retry_after: Optional[float] = None) -> Optional[float]:
+    """
+    Get the wait before retry number ``attempt`` (0-based).
+
+    A server's Retry-After is honored as given; otherwise the delay is drawn with full
+    jitter from an exponentially growing window. Returns None when Retry-After asks for
+    more than ``backoff_max_seconds``, meaning the caller should fail over instead.
+    """
+    if retry_after is not None:
+        return retry_after if retry_after <= config.backoff_max_seconds else None
+    window = min(config.backoff_max_seconds, config.backoff_base_seconds * (2 ** attempt))
+    return random.uniform(0, window)
+
+
+def _start_call(fn: Callable[[], T]) -> 'Future[T]':
+    """Run ``fn`` on a thread of its own, so hedged calls never queue behind each other."""
+    future: 'Future[T]' = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+    threading.Thread(target=run, name="llm-hedged-call", daemon=True).start()
+    return future
+
+
+def call_hedged(fn: Callable[[], T], hedge_after: float,
+                before_hedge: Optional[Callable[[], None]] = None) -> T:
+    """
+    Call ``fn`` and, if it has not finished after ``hedge_after`` seconds, start a
+    second identical call; the first successful result wins.
+
+    ``before_hedge`` runs before the second call is sent, e.g. to reserve its rate
+    limit budget; the second call is dropped if the first one finished meanwhile.
+    """
+    if hedge_after <= 0:
+        return fn()
+    pending = {_start_call(fn)}
+    done, pending = wait(pending, timeout=hedge_after)
+    if not done and before_hedge:
+        before_hedge()
+        done, pending = wait(pending, timeout=0)
+    if not done:
+        logger.info(f"No response after {hedge_after}s, sending hedged request")
+        pending.add(_start_call(fn))
+    return _first_success(done, pending)
+
+
+def _first_success(done, pending):
+    error = None
+    while True:
+        for future in done:
+            if future.exception() is None:
+                # The losing request cannot be interrupted and finishes in the background
+                for other in pending:
+                    other.cancel()
+                return future.result()
+            error = future.exception()
+        if not pending:
+            raise error
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+
+async def acall_hedged(fn: Callable[[], Awaitable[T]], hedge_after: float,
+                       before_hedge: Optional[Callable[[], Awaitable[None]]] = None) -> T:
+    """Async version of call_hedged; the losing request is cancelled."""
+    if hedge_after <= 0:
+        return await fn()
+    pending = {asyncio.ensure_future(fn())}
+    done, pending = await asyncio.wait(pending, timeout=hedge_after)
+    if not done and before_hedge:
+        await before_hedge()
+        done, pending = await asyncio.wait(pending, timeout=0)
+    if not done:
+        logger.info(f"No response after {hedge_after}s, sending hedged request")
+        pending.add(asyncio.ensure_future(fn()))
+    error = None
+    try:
+        while True:
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+            if not pending:
+                raise error
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in pending:
+            task.cancel()
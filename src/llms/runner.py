@@ -1,17 +1,42 @@
+import asyncio
 import logging
-from typing import Any, Dict, Tuple
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
 from .strategies.base import LLMStrategy
+from .rate_limiter import (ConcurrencyLimiter, RateLimiter, estimate_tokens, get_concurrency_limiter,
+                           get_rate_limiter)
+from .resilience import CircuitBreaker, acall_hedged, backoff_delay, call_hedged, get_circuit_breaker
+from .utils.errors import APIError, CircuitOpenError, ConfigurationError
 from src.generator.utils.string_utils import get_company_name_and_job_title
 from src.llms.strategies import OpenAIStrategy, ClaudeStrategy, OllamaStrategy, GeminiStrategy
 from ..loaders.prompt_loader import PromptLoader
-from config.llm_config import LLMConfig
+from config.llm_config import LLMConfig, ResilienceConfig
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
+FOLDER_NAME_FALLBACK = "error_company_name|error_job_title"
+
 class LLMRunner:
+    """
+    Runs prompts against the configured LLM strategy.
+
+    Every call goes through a resilience layer: transient errors are retried with
+    jittered exponential backoff (honoring Retry-After), each provider has a circuit
+    breaker, slow calls can be hedged, and once a provider gives up the next one in
+    ``LLMConfig.RESILIENCE.failover_chain`` is tried. Each attempt first reserves its
+    estimated request and token cost from the provider's rate limit budget, and holds
+    one of the provider's process-wide in-flight slots while the request runs (a hedged
+    duplicate shares its request's slot).
+    """
+
     def __init__(self, strategy: LLMStrategy):
         self.strategy = strategy
         self.prompt_loader = PromptLoader()
+        self._failover_strategies: Dict[str, Optional[LLMStrategy]] = {}
+        self.rate_limiter: RateLimiter = get_rate_limiter()
+        self.concurrency_limiter: ConcurrencyLimiter = get_concurrency_limiter()
 
     @classmethod
     def create_with_config(cls, model_type: str, model_name: str, temperature: float, prompt_loader: PromptLoader) -> 'LLMRunner':
@@ -54,16 +79,70 @@ class LLMRunner:
         if not strategy_class:
             raise ValueError(f"Unsupported model type: {model_type}")
             
-        new_strategy = strategy_class(self.prompt_loader.get_system_prompt())
+        # The system prompt does not change with the model; reuse it instead of re-reading it
+        new_strategy = strategy_class(self.strategy.system_instruction)
         new_strategy.model = model_name
         new_strategy.temperature = temperature
         self.strategy = new_strategy
+        self._failover_strategies = {}
+
+    @property
+    def provider(self) -> str:
+        """Name of the provider backing the current strategy (e.g. 'Claude')."""
+        return self.strategy.provider
+
+    @property
+    def max_concurrency(self) -> int:
+        """
+        Maximum number of in-flight requests allowed for the current provider.
+
+        The limit is enforced process-wide by the concurrency limiter; callers use it
+        to size their fan-out so no more work is queued than can run.
+        """
+        return LLMConfig.get_max_concurrency(self.provider)
 
     def generate_content(self, prompt: str, data: str, job_description: str) -> str:
-        return self.strategy.generate_content(prompt, data, job_description)
+        return self._call(lambda strategy: strategy.generate_content(prompt, data, job_description),
+                          (prompt, data, job_description))
 
     def create_company_name_and_job_title(self, naming_prompt: str, job_description: str) -> Tuple[str, str]:
-        return get_company_name_and_job_title(self.strategy.create_folder_name(naming_prompt, job_description))
+        try:
+            folder_name = self._call(lambda strategy: strategy.create_folder_name(naming_prompt, job_description),
+                                     (naming_prompt, None, job_description))
+        except APIError as e:
+            logger.error(f"Could not create folder name: {e}")
+            folder_name = FOLDER_NAME_FALLBACK
+        return get_company_name_and_job_title(folder_name)
+
+    async def agenerate_content(self, prompt: str, data: str, job_description: str) -> str:
+        return await self._acall(lambda strategy: strategy.agenerate_content(prompt, data, job_description),
+                                 (prompt, data, job_description))
+
+    async def agenerate_many(self, requests: Iterable[Tuple[str, str, str]]) -> List[str]:
+        """
+        Generate content for many (prompt, data, job_description) requests on the event loop.
+
+        At most ``max_concurrency`` requests are in flight at once; results are returned
+        in request order and the first failure is raised.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def generate(prompt: str, data: str, job_description: str) -> str:
+            async with semaphore:
+                return await self.agenerate_content(prompt, data, job_description)
+
+        return await asyncio.gather(*(generate(*request) for request in requests))
+
+    async def acreate_company_name_and_job_title(self, naming_prompt: str, job_description: str) -> Tuple[str, str]:
+        try:
+            folder_name = await self._acall(
+                lambda strategy: strategy.acreate_folder_name(naming_prompt, job_description),
+                (naming_prompt, None, job_description)
+            )
+        except APIError as e:
+            logger.error(f"Could not create folder name: {e}")
+            folder_name = FOLDER_NAME_FALLBACK
+        return get_company_name_and_job_title(folder_name)
 
     def get_config(self) -> Dict[str, Any]:
         return {
@@ -76,6 +155,7 @@ class LLMRunner:
         self.strategy = self._get_ai_strategy(config['model_type'])
         self.strategy.model = config['model']
         self.strategy.temperature = config['temperature']
+        self._failover_strategies = {}
 
     def _get_ai_strategy(self, model_type: str):
         """Get the appropriate AI strategy based on model type."""
@@ -88,5 +168,124 @@ class LLMRunner:
         strategy_class = strategy_map.get(model_type)
         if not strategy_class:
             raise ValueError(f"Unsupported model type: {model_type}")
-        return strategy_class(self.prompt_loader.get_system_prompt())
+        return strategy_class(self.strategy.system_instruction)
+
+    def _strategy_chain(self) -> Iterator[LLMStrategy]:
+        """Yield the configured strategy, then the failover providers in order."""
+        yield self.strategy
+        for provider in LLMConfig.get_resilience_config().failover_chain:
+            if provider == self.strategy.provider:
+                continue
+            if provider not in self._failover_strategies:
+                self._failover_strategies[provider] = self._create_failover_strategy(provider)
+            if self._failover_strategies[provider] is not None:
+                yield self._failover_strategies[provider]
+
+    def _create_failover_strategy(self, provider: str) -> Optional[LLMStrategy]:
+        """Build a provider's strategy with its default model; None if it is not configured."""
+        try:
+            strategy = self._get_ai_strategy(provider)
+            strategy.temperature = self.strategy.temperature
+            return strategy
+        except (ConfigurationError, ValueError) as e:
+            logger.warning(f"Skipping failover provider {provider}: {e}")
+            return None
+
+    @staticmethod
+    def _estimate_tokens(strategy: LLMStrategy, prompt_parts: Tuple[Optional[str], ...]) -> int:
+        """Estimate a request's token cost from its formatted prompt and max_tokens."""
+        return estimate_tokens(strategy.system_instruction + strategy._format_prompt(*prompt_parts),
+                               strategy.max_tokens)
+
+    def _call(self, request: Callable[[LLMStrategy], T], prompt_parts: Tuple[Optional[str], ...]) -> T:
+        """
+        Run a blocking request with rate limiting, retries, circuit breaking, hedging and failover.
+
+        Args:
+            request: Sends the request with the given strategy
+            prompt_parts: (prompt, data, job_description) used to estimate the token cost
+        """
+        config = LLMConfig.get_resilience_config()
+        error: Optional[APIError] = None
+        for strategy in self._strategy_chain():
+            breaker = get_circuit_breaker(strategy.provider, config)
+            for attempt in range(config.max_retries + 1):
+                if not breaker.allow_request():
+                    error = CircuitOpenError(f"Circuit for {strategy.provider} is open")
+                    break
+                tokens = self._estimate_tokens(strategy, prompt_parts)
+                self.rate_limiter.acquire(strategy.provider, strategy.model, tokens)
+                try:
+                    with self.concurrency_limiter.slot(strategy.provider):
+                        result = call_hedged(
+                            lambda strategy=strategy: request(strategy), config.hedge_after_seconds,
+                            # The hedged duplicate is a request of its own and needs its own budget
+                            before_hedge=lambda strategy=strategy: self.rate_limiter.acquire(
+                                strategy.provider, strategy.model, tokens)
+                        )
+                except Exception as e:
+                    error = APIError.from_exception(f"{strategy.provider} API error", e)
+                    self._record_error(breaker, error)
+                    delay = self._retry_delay(strategy, error, attempt, config)
+                    if delay is None:
+                        break
+                    time.sleep(delay)
+                else:
+                    breaker.record_success()
+                    return result
+            logger.warning(f"Giving up on {strategy.provider}: {error}")
+        raise error
+
+    async def _acall(self, request: Callable[[LLMStrategy], Awaitable[T]],
+                     prompt_parts: Tuple[Optional[str], ...]) -> T:
+        """Async version of _call."""
+        config = LLMConfig.get_resilience_config()
+        error: Optional[APIError] = None
+        for strategy in self._strategy_chain():
+            breaker = get_circuit_breaker(strategy.provider, config)
+            for attempt in range(config.max_retries + 1):
+                if not breaker.allow_request():
+                    error = CircuitOpenError(f"Circuit for {strategy.provider} is open")
+                    break
+                tokens = self._estimate_tokens(strategy, prompt_parts)
+                await self.rate_limiter.aacquire(strategy.provider, strategy.model, tokens)
+                try:
+                    async with self.concurrency_limiter.aslot(strategy.provider):
+                        result = await acall_hedged(
+                            lambda strategy=strategy: request(strategy), config.hedge_after_seconds,
+                            before_hedge=lambda strategy=strategy: self.rate_limiter.aacquire(
+                                strategy.provider, strategy.model, tokens)
+                        )
+                except Exception as e:
+                    error = APIError.from_exception(f"{strategy.provider} API error", e)
+                    self._record_error(breaker, error)
+                    delay = self._retry_delay(strategy, error, attempt, config)
+                    if delay is None:
+                        break
+                    await asyncio.sleep(delay)
+                else:
+                    breaker.record_success()
+                    return result
+            logger.warning(f"Giving up on {strategy.provider}: {error}")
+        raise error
+
+    @staticmethod
+    def _record_error(breaker: CircuitBreaker, error: APIError) -> None:
+        """Count only transient failures against the provider's circuit."""
+        if error.retryable:
+            breaker.record_failure()
+        else:
+            # The provider answered; bad input or credentials say nothing about its health
+            breaker.record_success()
 
+    @staticmethod
+    def _retry_delay(strategy: LLMStrategy, error: APIError, attempt: int,
+                     config: ResilienceConfig) -> Optional[float]:
+        """Seconds to wait before retrying ``strategy``, or None to give up on it."""
+        if not error.retryable or attempt >= config.max_retries:
+            return None
+        delay = backoff_delay(attempt, config, error.retry_after)
+        if delay is not None:
+            logger.warning(f"{strategy.provider} request failed ({error}), "
+                           f"retry {attempt + 1}/{config.max_retries} in {delay:.1f}s")
+        return delay
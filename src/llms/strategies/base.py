@@ -1,10 +1,15 @@
 from abc import ABC, abstractmethod
+import asyncio
 import logging
-from typing import Tuple
+from typing import Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 class LLMStrategy(ABC):
+    provider: str = ""
+    # Completion budget requested from the provider; used for rate limit estimates
+    max_tokens: Optional[int] = None
+
     def __init__(self, system_instruction: str):
         self._model: str = ""
         self._temperature: float = 0.1
@@ -31,15 +36,31 @@ class LLMStrategy(ABC):
         else:
             raise ValueError("Temperature must be between 0.0 and 1.0")
 
-    def _format_prompt(self, prompt: str, data: str = None, job_description: str = None) -> str:
-        formatted_prompt = f"{prompt}\n\n"
-        if data:
-            formatted_prompt += (f"Here is the personal information in JSON format:\n"
-                               f"<data> \n{data}\n </data>\n\n")
+    def _prompt_blocks(self, prompt: str, data: str = None, job_description: str = None) -> Tuple[str, str]:
+        """
+        Split the user message into a shared prefix and a request-specific suffix.
+
+        Every section generated for one job sends the same job description, so it comes
+        first, right after the system prompt; the section data and instruction come
+        last. That keeps the longest possible common prefix across the section fan-out,
+        which provider-side prompt caching can reuse.
+
+        Returns:
+            Tuple[str, str]: The cacheable job description block and the rest of the message
+        """
+        shared = ""
         if job_description:
-            formatted_prompt += (f"Job Description:\n"
-                               f"<job_description> \n{job_description}\n </job_description>\n\n")
-        return formatted_prompt
+            shared = (f"Job Description:\n"
+                      f"<job_description> \n{job_description}\n </job_description>\n\n")
+        specific = ""
+        if data:
+            specific += (f"Here is the personal information in JSON format:\n"
+                         f"<data> \n{data}\n </data>\n\n")
+        specific += f"{prompt}\n\n"
+        return shared, specific
+
+    def _format_prompt(self, prompt: str, data: str = None, job_description: str = None) -> str:
+        return "".join(self._prompt_blocks(prompt, data, job_description))
 
     @abstractmethod
     def generate_content(self, prompt: str, data: str, job_description: str) -> str:
@@ -48,3 +69,16 @@ class LLMStrategy(ABC):
     @abstractmethod
     def create_folder_name(self, prompt: str, job_description: str)  -> str:
         pass
+
+    async def agenerate_content(self, prompt: str, data: str, job_description: str) -> str:
+        """
+        Async version of generate_content.
+
+        Providers override this with their native async client; the default runs the
+        blocking call in a worker thread so every strategy can be awaited.
+        """
+        return await asyncio.to_thread(self.generate_content, prompt, data, job_description)
+
+    async def acreate_folder_name(self, prompt: str, job_description: str) -> str:
+        """Async version of create_folder_name; see agenerate_content."""
+        return await asyncio.to_thread(self.create_folder_name, prompt, job_description)
@@ -1,13 +1,22 @@
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
+from typing import Any, Dict
 from .base import LLMStrategy
+from ..client_registry import ProviderClientRegistry
 from config.llm_config import LLMConfig
 from config.logger_config import setup_logger
 from ..utils.errors import APIError, ConfigurationError
 from ..utils.response import process_api_response
+from ..utils.usage import record_usage
 
 logger = setup_logger(__name__)
 
+# Anthropic caches the prompt up to each marked block for five minutes
+CACHE_CONTROL = {"type": "ephemeral"}
+
 class ClaudeStrategy(LLMStrategy):
+    provider = "Claude"
+    max_tokens = LLMConfig.CLAUDE_MODEL.max_tokens
+
     def __init__(self, system_instruction: str):
         super().__init__(system_instruction)
         self._model = LLMConfig.CLAUDE_MODEL.name
@@ -15,38 +24,75 @@ class ClaudeStrategy(LLMStrategy):
         api_key = LLMConfig.get_provider_config("Claude")
         if not api_key:
             raise ConfigurationError(LLMConfig.MISSING_API_KEY_ERROR.format("Claude"))
-        self.client = Anthropic(api_key=api_key)
+        self._api_key = api_key
+        self.client = ProviderClientRegistry.get_anthropic_client(api_key)
+
+    @property
+    def async_client(self) -> AsyncAnthropic:
+        """Shared async client for the running event loop"""
+        return ProviderClientRegistry.get_async_anthropic_client(self._api_key)
+
+    def _request(self, shared: str, specific: str) -> Dict[str, Any]:
+        """
+        Build a request with prompt cache breakpoints after the system prompt and after
+        the shared job description, so the section fan-out for one job reuses both.
+        """
+        content = [{"type": "text", "text": specific}]
+        if shared:
+            content.insert(0, {"type": "text", "text": shared, "cache_control": CACHE_CONTROL})
+        return dict(
+            model=self.model,
+            max_tokens=LLMConfig.CLAUDE_MODEL.max_tokens,
+            system=[{"type": "text", "text": self.system_instruction, "cache_control": CACHE_CONTROL}],
+            temperature=self.temperature,
+            messages=[
+                {"role": "user", "content": content}
+            ]
+        )
 
     def generate_content(self, prompt: str, data: str, job_description: str) -> str:
         try:
             logger.info(f"Sending request to Claude API with model: {self.model}")
             response = self.client.messages.create(
-                model=self.model,
-                max_tokens=LLMConfig.CLAUDE_MODEL.max_tokens,
-                system=self.system_instruction,
-                temperature=self.temperature,
-                messages=[
-                    {"role": "user", "content": self._format_prompt(prompt, data, job_description)}
-                ]
+                **self._request(*self._prompt_blocks(prompt, data, job_description))
             )
+            record_usage(response, "Claude")
             return process_api_response(response, "Claude")
         except Exception as e:
             logger.error(f"Claude API error: {e}")
-            raise APIError(f"Claude API error: {e}")
+            raise APIError.from_exception("Claude API error", e)
+
+    async def agenerate_content(self, prompt: str, data: str, job_description: str) -> str:
+        try:
+            logger.info(f"Sending async request to Claude API with model: {self.model}")
+            response = await self.async_client.messages.create(
+                **self._request(*self._prompt_blocks(prompt, data, job_description))
+            )
+            record_usage(response, "Claude")
+            return process_api_response(response, "Claude")
+        except Exception as e:
+            logger.error(f"Claude API error: {e}")
+            raise APIError.from_exception("Claude API error", e)
 
     def create_folder_name(self, prompt: str, job_description: str) -> str:
         try:
             response = self.client.messages.create(
-                model=self.model,
-                max_tokens=LLMConfig.CLAUDE_MODEL.max_tokens,
-                system=self.system_instruction,
-                temperature=self.temperature,
-                messages=[
-                    {"role": "user", "content": self._format_prompt(prompt, job_description=job_description)}
-                ]
+                **self._request(*self._prompt_blocks(prompt, job_description=job_description))
             )
+            record_usage(response, "Claude")
             result = process_api_response(response, "Claude")
             return result
         except Exception as e:
             logger.error(f"Error in create_folder_name: {e}")
-            return "error_company_name|error_job_title"
\ No newline at end of file
+            raise APIError.from_exception("Claude API error", e)
+
+    async def acreate_folder_name(self, prompt: str, job_description: str) -> str:
+        try:
+            response = await self.async_client.messages.create(
+                **self._request(*self._prompt_blocks(prompt, job_description=job_description))
+            )
+            record_usage(response, "Claude")
+            return process_api_response(response, "Claude")
+        except Exception as e:
+            logger.error(f"Error in acreate_folder_name: {e}")
+            raise APIError.from_exception("Claude API error", e)
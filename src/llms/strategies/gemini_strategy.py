@@ -1,14 +1,18 @@
 import os
-import google.generativeai as genai
 from .base import LLMStrategy
+from ..client_registry import ProviderClientRegistry
 from config.llm_config import LLMConfig
 from config.logger_config import setup_logger
 from ..utils.errors import APIError, ConfigurationError
 from ..utils.response import process_api_response
+from ..utils.usage import record_usage
 
 logger = setup_logger(__name__)
 
 class GeminiStrategy(LLMStrategy):
+    provider = "Gemini"
+    max_tokens = LLMConfig.GEMINI_MODEL.max_tokens
+
     def __init__(self, system_instruction: str):
         super().__init__(system_instruction)
         self._model_name = LLMConfig.GEMINI_MODEL.name
@@ -18,10 +22,14 @@ class GeminiStrategy(LLMStrategy):
         if not api_key:
             raise ConfigurationError(LLMConfig.MISSING_API_KEY_ERROR.format("Gemini"))
             
-        genai.configure(api_key=api_key)
-        self._model = genai.GenerativeModel(
-            model_name=self._model_name,
-            generation_config={
+        self._api_key = api_key
+        self._model = self._load_model()
+
+    def _load_model(self):
+        return ProviderClientRegistry.get_gemini_model(
+            self._api_key,
+            self._model_name,
+            {
                 "temperature": self.temperature,
                 "top_p": 0.95,
                 "top_k": 40,
@@ -38,16 +46,8 @@ class GeminiStrategy(LLMStrategy):
         if not value:
             raise ValueError("Model name cannot be empty")
         self._model_name = value
-        # Recreate the model instance with new name
-        self._model = genai.GenerativeModel(
-            model_name=self._model_name,
-            generation_config={
-                "temperature": self.temperature,
-                "top_p": 0.95,
-                "top_k": 40,
-                "max_output_tokens": 8192,
-            }
-        )
+        # Switch to the shared model instance for the new name
+        self._model = self._load_model()
 
     def generate_content(self, prompt: str, data: str, job_description: str) -> str:
         try:
@@ -55,18 +55,44 @@ class GeminiStrategy(LLMStrategy):
             response = self._model.generate_content(
                 self._format_prompt(prompt, data, job_description)
             )
+            record_usage(response, "Gemini")
+            return process_api_response(response, "Gemini")
+        except Exception as e:
+            logger.error(f"Gemini API error: {e}")
+            raise APIError.from_exception("Gemini API error", e)
+
+    async def agenerate_content(self, prompt: str, data: str, job_description: str) -> str:
+        try:
+            logger.info(f"Sending async request to Gemini API with model: {self.model}")
+            response = await self._model.generate_content_async(
+                self._format_prompt(prompt, data, job_description)
+            )
+            record_usage(response, "Gemini")
             return process_api_response(response, "Gemini")
         except Exception as e:
             logger.error(f"Gemini API error: {e}")
-            raise APIError(f"Gemini API error: {e}")
+            raise APIError.from_exception("Gemini API error", e)
 
     def create_folder_name(self, prompt: str, job_description: str) -> str:
         try:
             response = self._model.generate_content(
                 self._format_prompt(prompt, job_description=job_description)
             )
+            record_usage(response, "Gemini")
             result = process_api_response(response, "Gemini")
             return result.strip().replace('"', '').replace("'", "")
         except Exception as e:
             logger.error(f"Error in create_folder_name: {e}")
-            return "error_company_name|error_job_title" 
\ No newline at end of file
+            raise APIError.from_exception("Gemini API error", e)
+
+    async def acreate_folder_name(self, prompt: str, job_description: str) -> str:
+        try:
+            response = await self._model.generate_content_async(
+                self._format_prompt(prompt, job_description=job_description)
+            )
+            record_usage(response, "Gemini")
+            result = process_api_response(response, "Gemini")
+            return result.strip().replace('"', '').replace("'", "")
+        except Exception as e:
+            logger.error(f"Error in acreate_folder_name: {e}")
+            raise APIError.from_exception("Gemini API error", e)
@@ -1,71 +1,112 @@
 import os
 import requests
+import httpx
 import json
+from typing import Any, Dict, Iterable
 from .base import LLMStrategy
+from ..client_registry import ProviderClientRegistry
 from config.llm_config import LLMConfig
 from config.logger_config import setup_logger
-from ..utils.errors import APIError, ConfigurationError
+from ..utils.errors import APIError, ConfigurationError, RETRYABLE_STATUS_CODES, parse_retry_after
 from ..utils.response import process_api_response
 
 logger = setup_logger(__name__)
 
+FOLDER_NAME_SYSTEM_PROMPT = "Create a concise folder name using underscores for this job application."
+
 class OllamaStrategy(LLMStrategy):
+    provider = "Ollama"
+    max_tokens = LLMConfig.OLLAMA_MODEL.default_options["num_predict"]
+
     def __init__(self, system_instruction: str):
         super().__init__(system_instruction)
         self._model = LLMConfig.OLLAMA_MODEL.name
         self._temperature = LLMConfig.OLLAMA_MODEL.default_temperature
         self.base_url = LLMConfig.get_provider_config("Ollama")
+        self.session = ProviderClientRegistry.get_ollama_session(self.base_url)
 
-    def _process_ollama_response(self, response: requests.Response) -> str:
-        """Process streaming response from Ollama API."""
-        if not response.ok:
-            raise APIError(f"Ollama API request failed with status {response.status_code}")
-        
+    def _request(self, system: str, prompt: str) -> Dict[str, Any]:
+        return {
+            "model": self.model,
+            "system": system,
+            "prompt": prompt,
+            "temperature": self.temperature,
+            "stream": True,
+            **LLMConfig.OLLAMA_MODEL.default_options
+        }
+
+    @staticmethod
+    def _parse_stream(lines: Iterable) -> str:
         try:
             # Get the last response from streaming output
             content = ""
-            for line in response.iter_lines():
+            for line in lines:
                 if line:
-                    content = json.loads(line.decode('utf-8'))['response']
+                    if isinstance(line, bytes):
+                        line = line.decode('utf-8')
+                    content = json.loads(line)['response']
             return content.strip()
         except json.JSONDecodeError as e:
             raise APIError(f"Failed to parse Ollama API response: {e}")
 
+    @staticmethod
+    def _status_error(response) -> APIError:
+        return APIError(
+            f"Ollama API request failed with status {response.status_code}",
+            status_code=response.status_code,
+            retry_after=parse_retry_after(response.headers),
+            retryable=response.status_code in RETRYABLE_STATUS_CODES
+        )
+
+    def _process_ollama_response(self, response: requests.Response) -> str:
+        """Process streaming response from Ollama API."""
+        if not response.ok:
+            raise self._status_error(response)
+        return self._parse_stream(response.iter_lines())
+
+    async def _apost(self, payload: Dict[str, Any]) -> str:
+        """Stream a generate request with httpx and return the processed response."""
+        client = ProviderClientRegistry.get_async_ollama_client(self.base_url)
+        async with client.stream("POST", "/api/generate", json=payload) as response:
+            if response.is_error:
+                raise self._status_error(response)
+            return self._parse_stream([line async for line in response.aiter_lines()])
+
     def generate_content(self, prompt: str, data: str, job_description: str) -> str:
         try:
             logger.info(f"Sending request to Ollama API with model: {self.model}")
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/generate",
-                json={
-                    "model": self.model,
-                    "system": self.system_instruction,
-                    "prompt": self._format_prompt(prompt, data, job_description),
-                    "temperature": self.temperature,
-                    "stream": True,
-                    **LLMConfig.OLLAMA_MODEL.default_options
-                },
+                json=self._request(self.system_instruction, self._format_prompt(prompt, data, job_description)),
                 stream=True
             )
             return self._process_ollama_response(response)
         except requests.RequestException as e:
             logger.error(f"Ollama API request error: {e}")
-            raise APIError(f"Ollama API request error: {e}")
+            raise APIError.from_exception("Ollama API request error", e)
         except Exception as e:
             logger.error(f"Ollama API error: {e}")
-            raise APIError(f"Ollama API error: {e}")
+            raise APIError.from_exception("Ollama API error", e)
+
+    async def agenerate_content(self, prompt: str, data: str, job_description: str) -> str:
+        try:
+            logger.info(f"Sending async request to Ollama API with model: {self.model}")
+            return await self._apost(
+                self._request(self.system_instruction, self._format_prompt(prompt, data, job_description))
+            )
+        except httpx.HTTPError as e:
+            logger.error(f"Ollama API request error: {e}")
+            raise APIError.from_exception("Ollama API request error", e)
+        except Exception as e:
+            logger.error(f"Ollama API error: {e}")
+            raise APIError.from_exception("Ollama API error", e)
 
     def create_folder_name(self, prompt: str, job_description: str) -> str:
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/generate",
-                json={
-                    "model": self.model,
-                    "system": "Create a concise folder name using underscores for this job application.",
-                    "prompt": self._format_prompt(prompt, job_description=job_description),
-                    "temperature": self.temperature,
-                    "stream": True,
-                    **LLMConfig.OLLAMA_MODEL.default_options
-                },
+                json=self._request(FOLDER_NAME_SYSTEM_PROMPT,
+                                   self._format_prompt(prompt, job_description=job_description)),
                 stream=True
             )
             result = self._process_ollama_response(response)
@@ -75,4 +116,14 @@ class OllamaStrategy(LLMStrategy):
 
         except Exception as e:
             logger.error(f"Error in create_folder_name: {e}")
-            return "error_company_name|error_job_title"
\ No newline at end of file
+            raise APIError.from_exception("Ollama API error", e)
+
+    async def acreate_folder_name(self, prompt: str, job_description: str) -> str:
+        try:
+            result = await self._apost(
+                self._request(FOLDER_NAME_SYSTEM_PROMPT, self._format_prompt(prompt, job_description=job_description))
+            )
+            return result.strip().replace('"', '').replace("'", "")
+        except Exception as e:
+            logger.error(f"Error in acreate_folder_name: {e}")
+            raise APIError.from_exception("Ollama API error", e)
@@ -1,16 +1,20 @@
-from openai import OpenAI
+from openai import AsyncOpenAI
 import os
 from .base import LLMStrategy
+from ..client_registry import ProviderClientRegistry
 from config.llm_config import LLMConfig
 from config.logger_config import setup_logger
 from ..utils.errors import APIError, ConfigurationError
 from ..utils.response import process_api_response
-from typing import Tuple
-from src.generator.utils.string_utils import sanitize_filename
+from ..utils.usage import record_usage
+from typing import Any, Dict
 
 logger = setup_logger(__name__)
 
 class OpenAIStrategy(LLMStrategy):
+    provider = "OpenAI"
+    max_tokens = LLMConfig.OPENAI_MODEL.max_tokens
+
     def __init__(self, system_instruction: str):
         super().__init__(system_instruction)
         self._model = LLMConfig.OPENAI_MODEL.name
@@ -18,41 +22,72 @@ class OpenAIStrategy(LLMStrategy):
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ConfigurationError(LLMConfig.MISSING_API_KEY_ERROR.format("OpenAI"))
-        self.client = OpenAI(api_key=api_key)
+        self._api_key = api_key
+        self.client = ProviderClientRegistry.get_openai_client(api_key)
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """Shared async client for the running event loop"""
+        return ProviderClientRegistry.get_async_openai_client(self._api_key)
+
+    def _request(self, content: str) -> Dict[str, Any]:
+        # OpenAI caches long prompt prefixes automatically; the system prompt and the
+        # job description lead every request so the section fan-out shares them
+        return dict(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": self.system_instruction},
+                {"role": "user", "content": content}
+            ],
+            temperature=self.temperature,
+            max_tokens=LLMConfig.OPENAI_MODEL.max_tokens,
+            **LLMConfig.OPENAI_MODEL.default_options
+        )
 
     def generate_content(self, prompt: str, data: str, job_description: str) -> str:
         try:
             logger.info(f"Sending request to OpenAI API with model: {self.model}")
             response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": self.system_instruction},
-                    {"role": "user", "content": self._format_prompt(prompt, data, job_description)}
-                ],
-                temperature=self.temperature,
-                max_tokens=LLMConfig.OPENAI_MODEL.max_tokens,
-                **LLMConfig.OPENAI_MODEL.default_options
+                **self._request(self._format_prompt(prompt, data, job_description))
+            )
+            record_usage(response, "OpenAI")
+            return process_api_response(response, "OpenAI")
+        except Exception as e:
+            logger.error(f"OpenAI API error: {e}")
+            raise APIError.from_exception("OpenAI API error", e)
+
+    async def agenerate_content(self, prompt: str, data: str, job_description: str) -> str:
+        try:
+            logger.info(f"Sending async request to OpenAI API with model: {self.model}")
+            response = await self.async_client.chat.completions.create(
+                **self._request(self._format_prompt(prompt, data, job_description))
             )
+            record_usage(response, "OpenAI")
             return process_api_response(response, "OpenAI")
         except Exception as e:
             logger.error(f"OpenAI API error: {e}")
-            raise APIError(f"OpenAI API error: {e}")
+            raise APIError.from_exception("OpenAI API error", e)
 
     def create_folder_name(self, prompt: str, job_description: str)  -> str:
         try:
             response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": self.system_instruction},
-                    {"role": "user", "content": self._format_prompt(prompt, job_description=job_description)}
-                ],
-                temperature=self.temperature,
-                max_tokens=LLMConfig.OPENAI_MODEL.max_tokens,
-                **LLMConfig.OPENAI_MODEL.default_options
+                **self._request(self._format_prompt(prompt, job_description=job_description))
             )
+            record_usage(response, "OpenAI")
             result = process_api_response(response, "OpenAI")
             return result
 
         except Exception as e:
             logger.error(f"Error in create_folder_name: {e}")
-            return "error_company_name|error_job_title"
\ No newline at end of file
+            raise APIError.from_exception("OpenAI API error", e)
+
+    async def acreate_folder_name(self, prompt: str, job_description: str) -> str:
+        try:
+            response = await self.async_client.chat.completions.create(
+                **self._request(self._format_prompt(prompt, job_description=job_description))
+            )
+            record_usage(response, "OpenAI")
+            return process_api_response(response, "OpenAI")
+        except Exception as e:
+            logger.error(f"Error in acreate_folder_name: {e}")
+            raise APIError.from_exception("OpenAI API error", e)
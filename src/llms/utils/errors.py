@@ -1,10 +1,57 @@
+from typing import Optional
+
+# Statuses worth retrying: timeouts, conflicts, rate limits and server-side failures
+# (529 is Anthropic's "overloaded")
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 425, 429, 500, 502, 503, 504, 529})
+
+# Transport failures carry no status code; recognise them by exception class name so
+# the SDK (openai, anthropic, httpx, requests, google) does not have to be imported here
+TRANSIENT_ERROR_NAMES = ("Timeout", "Connection", "NetworkError", "ProtocolError")
+
 class LLMError(Exception):
     """Base exception class for LLM-related errors."""
     pass
 
 class APIError(LLMError):
     """Raised when an API request fails."""
-    pass
+
+    def __init__(self, message: str, status_code: Optional[int] = None,
+                 retry_after: Optional[float] = None, retryable: bool = False):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self.retryable = retryable
+
+    @classmethod
+    def from_exception(cls, message: str, error: Exception) -> 'APIError':
+        """
+        Wrap a provider SDK exception, keeping its status code and Retry-After hint.
+
+        Args:
+            message: Message prefix, e.g. "OpenAI API error"
+            error: The exception raised by the provider SDK or HTTP library
+
+        Returns:
+            APIError: The wrapped error; ``retryable`` is set for transient failures
+        """
+        if isinstance(error, APIError):
+            return error
+        response = getattr(error, 'response', None)
+        status_code = getattr(error, 'status_code', None) or getattr(response, 'status_code', None)
+        if status_code is None and isinstance(getattr(error, 'code', None), int):
+            status_code = error.code  # google.api_core exceptions
+        retryable = (status_code in RETRYABLE_STATUS_CODES if status_code is not None
+                     else _is_transient(error))
+        return cls(f"{message}: {error}", status_code=status_code,
+                   retry_after=parse_retry_after(getattr(response, 'headers', None)),
+                   retryable=retryable)
+
+class CircuitOpenError(APIError):
+    """Raised when a provider's circuit breaker is open and the call is not attempted."""
+
+    def __init__(self, message: str):
+        # The provider may well be back by the time the request is tried again later
+        super().__init__(message, retryable=True)
 
 class ConfigurationError(LLMError):
     """Raised when there's a configuration issue."""
@@ -12,4 +59,19 @@ class ConfigurationError(LLMError):
 
 class ResponseError(LLMError):
     """Raised when there's an issue with the API response."""
-    pass 
\ No newline at end of file
+    pass
+
+def parse_retry_after(headers) -> Optional[float]:
+    """Read a Retry-After header given in seconds; HTTP dates are ignored."""
+    if not headers:
+        return None
+    try:
+        value = headers.get('retry-after') or headers.get('Retry-After')
+        return max(0.0, float(value)) if value is not None else None
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+def _is_transient(error: Exception) -> bool:
+    return isinstance(error, (ConnectionError, TimeoutError)) or any(
+        name in cls.__name__ for cls in type(error).__mro__ for name in TRANSIENT_ERROR_NAMES
+    )
@@ -0,0 +1,75 @@
+import threading
+from typing import Any, Dict
+from config.logger_config import setup_logger
+
+logger = setup_logger(__name__)
+
+class PromptCacheStats:
+    """Process-wide input token counts per provider, including prompt cache reads and writes."""
+
+    _lock = threading.Lock()
+    _stats: Dict[str, Dict[str, int]] = {}
+
+    @classmethod
+    def record(cls, provider: str, input_tokens: int, cached_tokens: int = 0, cache_write_tokens: int = 0) -> None:
+        with cls._lock:
+            stats = cls._stats.setdefault(provider, {
+                'requests': 0, 'input_tokens': 0, 'cached_tokens': 0, 'cache_write_tokens': 0
+            })
+            stats['requests'] += 1
+            stats['input_tokens'] += input_tokens
+            stats['cached_tokens'] += cached_tokens
+            stats['cache_write_tokens'] += cache_write_tokens
+        logger.info(f"{provider} usage: {input_tokens} input tokens, {cached_tokens} read from prompt cache, "
+                    f"{cache_write_tokens} written to prompt cache")
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Dict[str, Any]]:
+        """
+        Get token counts per provider.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Totals plus the share of input tokens served from cache
+        """
+        with cls._lock:
+            return {
+                provider: {**stats, 'cache_hit_ratio': round(stats['cached_tokens'] / stats['input_tokens'], 3)
+                           if stats['input_tokens'] else 0.0}
+                for provider, stats in cls._stats.items()
+            }
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls._lock:
+            cls._stats = {}
+
+def _count(obj: Any, name: str) -> int:
+    value = getattr(obj, name, 0)
+    return value if isinstance(value, int) else 0
+
+def record_usage(response: Any, provider: str) -> None:
+    """
+    Record input and prompt-cache token counts from a provider response.
+
+    ``input_tokens`` always counts the whole prompt, cached or not. Responses without
+    usage data are ignored; usage reporting never fails a request.
+    """
+    try:
+        if hasattr(response, 'choices'):  # OpenAI: cached tokens are a subset of prompt_tokens
+            usage = getattr(response, 'usage', None)
+            if usage is not None:
+                PromptCacheStats.record(provider, _count(usage, 'prompt_tokens'),
+                                        _count(getattr(usage, 'prompt_tokens_details', None), 'cached_tokens'))
+        elif hasattr(response, 'content'):  # Claude: input_tokens excludes cache reads and writes
+            usage = getattr(response, 'usage', None)
+            if usage is not None:
+                cached = _count(usage, 'cache_read_input_tokens')
+                written = _count(usage, 'cache_creation_input_tokens')
+                PromptCacheStats.record(provider, _count(usage, 'input_tokens') + cached + written, cached, written)
+        elif provider == "Gemini":
+            usage = getattr(response, 'usage_metadata', None)
+            if usage is not None:
+                PromptCacheStats.record(provider, _count(usage, 'prompt_token_count'),
+                                        _count(usage, 'cached_content_token_count'))
+    except Exception as e:
+        logger.debug(f"Could not read {provider} usage: {e}")
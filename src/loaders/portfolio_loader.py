@@ -1,7 +1,6 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import logging
-from src.core.database.factory import get_unit_of_work
-from src.core.dto.portfolio.portfolio import PortfolioDTO
+from src.core.dto.user_context import UserContext
 from config.config import test_user_id
 
 logger = logging.getLogger(__name__)
@@ -15,34 +14,23 @@ class PortfolioLoader:
     combining information from both portfolio and profile collections.
     
     Attributes:
-        uow: Unit of Work instance for database operations
         portfolio: PortfolioDTO instance containing combined portfolio and profile data
     """
 
-    def __init__(self, user_id: str):
+    def __init__(self, user_id: str, user_context: Optional[UserContext] = None):
         """
-        Initialize MongoDB connection and load data for a specific user.
+        Load portfolio data for a specific user.
         
         Args:
             user_id (str): The user ID to load portfolio data for
+            user_context (Optional[UserContext]): Preloaded user snapshot; loaded from
+                MongoDB when not provided
             
         Raises:
             ValueError: If portfolio or profile is not found for the user
         """
-        self.uow = get_unit_of_work()
-        with self.uow:
-            # Get portfolio data
-            raw_portfolio = self.uow.portfolios.get_by_user_id(user_id)
-            if not raw_portfolio:
-                raise ValueError(f"Portfolio not found for user {user_id}")
-            
-            # Get profile data
-            raw_profile = self.uow.profiles.get_by_user_id(user_id)
-            if not raw_profile:
-                raise ValueError(f"Profile not found for user {user_id}")
-            
-            # Combine the data for DTO
-            self.portfolio = PortfolioDTO.from_db_models(raw_portfolio, raw_profile)
+        user_context = user_context or UserContext.load(user_id)
+        self.portfolio = user_context.portfolio_dto
 
     def get_section_data(self, section: str) -> Any:
         """
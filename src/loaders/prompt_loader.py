@@ -3,6 +3,7 @@ from string import Template
 from typing import Dict, Any, Optional
 from config.settings import PROMPTS_DIR
 from src.core.database.factory import get_unit_of_work
+from src.core.dto.user_context import UserContext
 from config.config import test_user_id
 import logging
 
@@ -14,17 +15,20 @@ class PromptLoader:
     A class to load prompts from a specified directory.
     """
 
-    def __init__(self, user_id: Optional[str] = None):
+    def __init__(self, user_id: Optional[str] = None, user_context: Optional[UserContext] = None):
         """
         Initialize the PromptLoader with a base directory path and user_id.
         
         Args:
             user_id: Optional user ID (can be either user_id or _id)
+            user_context: Optional preloaded user snapshot; when given, preferences and
+                life story are read from it instead of MongoDB
         """
         self.prompt_dir = PROMPTS_DIR
         self.user_id = user_id
+        self.user_context = user_context
         self.uow = get_unit_of_work()
-        self._preferences = None
+        self._preferences = user_context.preferences if user_context else None
 
     @property
     def preferences(self) -> Optional[Dict[str, Any]]:
@@ -71,7 +75,9 @@ class PromptLoader:
                         variables[category] = values
                             
             # Add life story if loading cover letter prompt
-            if filename == 'cover_letter_prompt.txt' and self.user_id:
+            if filename == 'cover_letter_prompt.txt' and self.user_context:
+                variables['life_story'] = self.user_context.life_story or "No personal story available."
+            elif filename == 'cover_letter_prompt.txt' and self.user_id:
                 try:
                     with self.uow as uow:
                         # Try first with user_id field
@@ -126,6 +132,7 @@ class PromptLoader:
 
     def refresh_preferences(self) -> None:
         """Force reload of user preferences"""
+        self.user_context = None
         self._preferences = None
         _ = self.preferences  # Trigger reload
 
@@ -0,0 +1,151 @@
+import string
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+import logging
+
+from config.cache_config import CacheConfig
+from src.core.database.factory import get_unit_of_work
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ParsedTemplate:
+    """A tex header together with the placeholders it expects."""
+
+    name: str
+    content: str
+    fields: FrozenSet[str]
+
+    @classmethod
+    def parse(cls, name: str, content: str) -> 'ParsedTemplate':
+        try:
+            fields = frozenset(
+                field.split('.', 1)[0].split('[', 1)[0]
+                for _, field, _, _ in string.Formatter().parse(content)
+                if field and not field[0].isdigit()
+            )
+        except ValueError:
+            # Not a str.format template (e.g. raw LaTeX); formatting will report it
+            fields = frozenset()
+        return cls(name=name, content=content, fields=fields)
+
+
+class TemplateRegistry:
+    """
+    Process-wide, in-memory copy of the tex_headers and preambles collections.
+
+    Everything is loaded once and looked up by name / type from a dict. The registry
+    polls the collections' newest ``updated_at`` (and document count) at most every
+    ``refresh_seconds`` and reloads when they change; ``reload()`` forces a reload.
+    """
+
+    def __init__(self, uow=None, refresh_seconds: Optional[float] = None):
+        self.uow = uow or get_unit_of_work()
+        self.refresh_seconds = (CacheConfig.get_template_registry_config().refresh_seconds
+                                if refresh_seconds is None else refresh_seconds)
+        self._lock = threading.Lock()
+        self._templates: Dict[str, ParsedTemplate] = {}
+        self._preambles: Dict[str, str] = {}
+        self._version: Optional[Tuple[Any, ...]] = None
+        self._checked_at = 0.0
+        self._indexes_created = False
+
+    def get_template(self, name: str) -> ParsedTemplate:
+        """
+        Get a parsed tex header by name.
+
+        Raises:
+            ValueError: If the template does not exist
+        """
+        self._refresh_if_stale()
+        template = self._templates.get(name)
+        if template is None:
+            # Added since the last load; fetch just this one by its indexed name
+            with self.uow:
+                header = self.uow.tex_headers.get_by_name(name)
+            if header is None:
+                raise ValueError(f"Template '{name}' not found in the database")
+            template = ParsedTemplate.parse(header.name, header.content)
+            with self._lock:
+                self._templates = {**self._templates, name: template}
+        return template
+
+    def get_preamble(self, preamble_type: str) -> Optional[str]:
+        """Get preamble content by type (e.g. 'resume_preamble'), or None if missing."""
+        self._refresh_if_stale()
+        content = self._preambles.get(preamble_type)
+        if content is None:
+            with self.uow:
+                preamble = self.uow.preambles.get_by_type(preamble_type)
+            if preamble is None:
+                return None
+            content = preamble.content
+            with self._lock:
+                self._preambles = {**self._preambles, preamble_type: content}
+        return content
+
+    def reload(self) -> None:
+        """Reload every tex header and preamble from MongoDB."""
+        with self.uow:
+            self._ensure_indexes()
+            version = self._fetch_version()
+            headers = self.uow.tex_headers.get_all()
+            preambles = self.uow.preambles.get_all()
+
+        templates = {h.name: ParsedTemplate.parse(h.name, h.content) for h in headers}
+        preamble_map = {p.type: p.content for p in preambles}
+        with self._lock:
+            self._templates = templates
+            self._preambles = preamble_map
+            self._version = version
+            self._checked_at = time.monotonic()
+        logger.info(f"Loaded {len(templates)} tex headers and {len(preamble_map)} preambles")
+
+    def _refresh_if_stale(self) -> None:
+        if self._version is None:
+            self.reload()
+            return
+
+        if time.monotonic() - self._checked_at < self.refresh_seconds:
+            return
+        self._checked_at = time.monotonic()
+        try:
+            with self.uow:
+                version = self._fetch_version()
+        except Exception as e:
+            logger.warning(f"Template registry version check failed: {e}")
+            return
+        if version != self._version:
+            logger.info("Tex headers or preambles changed, reloading")
+            self.reload()
+
+    def _fetch_version(self) -> Tuple[Any, ...]:
+        version = []
+        for collection in (self.uow.tex_headers.collection, self.uow.preambles.collection):
+            newest = collection.find_one({}, sort=[('updated_at', -1)], projection={'updated_at': 1})
+            version.append(collection.count_documents({}))
+            version.append(newest.get('updated_at') if newest else None)
+        return tuple(version)
+
+    def _ensure_indexes(self) -> None:
+        if not self._indexes_created:
+            self.uow.tex_headers.collection.create_index('name')
+            self.uow.preambles.collection.create_index('type')
+            self._indexes_created = True
+
+
+_template_registry: Optional[TemplateRegistry] = None
+_template_registry_lock = threading.Lock()
+
+
+def get_template_registry() -> TemplateRegistry:
+    """Get the process-wide template registry."""
+    global _template_registry
+    if _template_registry is None:
+        with _template_registry_lock:
+            if _template_registry is None:
+                _template_registry = TemplateRegistry()
+    return _template_registry
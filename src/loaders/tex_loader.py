@@ -1,18 +1,17 @@
 # Testing is done - Successful
 from src.core.exceptions.database_exceptions import DatabaseError
 import logging
-from src.core.database.factory import get_unit_of_work
+from src.loaders.template_registry import TemplateRegistry, get_template_registry
 
 class TexLoader:
     """A class for loading LaTeX template files from MongoDB."""
 
-    def __init__(self):
+    def __init__(self, registry: TemplateRegistry = None):
         """
-        Initialize the TexLoader with a MongoDB UnitOfWork.
+        Initialize the TexLoader on top of the process-wide template registry.
         """
-        self.uow = get_unit_of_work()
+        self.registry = registry or get_template_registry()
         self.logger = logging.getLogger(__name__)
-        self._cached_templates = {}
 
     def get_template(self, name: str) -> str:
         """
@@ -28,20 +27,7 @@ class TexLoader:
             ValueError: If the template is not found.
         """
         try:
-            # Use cached template if available
-            if name in self._cached_templates:
-                return self._cached_templates[name]
-
-            with self.uow:
-                headers = self.uow.tex_headers.get_all()
-                for header in headers:
-                    if header.name == name:
-                        # Cache the template for future use
-                        self._cached_templates[name] = header.content
-                        self.uow.commit()
-                        return header.content
-                self.uow.commit()
-                raise ValueError(f"Template '{name}' not found in the database")
+            return self.registry.get_template(name).content
         except DatabaseError as e:
             self.logger.error(f"Database error while retrieving template '{name}': {str(e)}")
             raise ValueError(f"Error retrieving template '{name}': {str(e)}")
@@ -60,9 +46,18 @@ class TexLoader:
         Raises:
             ValueError: If the template is not found or formatting fails.
         """
-        template = self.get_template(template_name)
         try:
-            return template.format(**kwargs)
+            template = self.registry.get_template(template_name)
+        except DatabaseError as e:
+            self.logger.error(f"Database error while retrieving template '{template_name}': {str(e)}")
+            raise ValueError(f"Error retrieving template '{template_name}': {str(e)}")
+
+        missing = template.fields.difference(kwargs)
+        if missing:
+            self.logger.error(f"KeyError in template '{template_name}': {sorted(missing)}")
+            raise ValueError(f"Missing key in template '{template_name}': {', '.join(sorted(missing))}")
+        try:
+            return template.content.format(**kwargs)
         except KeyError as e:
             self.logger.error(f"KeyError in template '{template_name}': {e}")
             raise ValueError(f"Missing key in template '{template_name}': {e}")
@@ -72,4 +67,4 @@ class TexLoader:
 
 if __name__ == '__main__':
     tex_loader = TexLoader()
-    print(tex_loader.get_template("personal_information"))
\ No newline at end of file
+    print(tex_loader.get_template("personal_information"))
@@ -0,0 +1,110 @@
+"""
+Generation worker: leases queued resume / cover letter jobs from MongoDB and runs them.
+
+Start as many workers as needed, on any machine that can reach the database; each
+job is leased by exactly one of them, and jobs of a worker that dies are picked up
+again once its lease expires. With GENERATION_JOB_DISPATCH=thread the API process runs
+one lease loop of its own (see ``GenerationWorker.start``), so retried and orphaned
+jobs are picked up without a separate worker.
+
+    python -m src.worker --concurrency 2
+    python -m src.worker --drain    # run until the queue is empty, then exit
+"""
+
+import argparse
+import logging
+import signal
+import threading
+from typing import Callable, Optional
+
+from config.job_config import JobConfig
+from src.generator.job_runner import GenerationJobRunner
+
+logger = logging.getLogger(__name__)
+
+
+class GenerationWorker:
+    """Runs ``concurrency`` lease loops, each with its own GenerationJobRunner."""
+
+    def __init__(self, concurrency: int = 1, poll_interval: Optional[float] = None,
+                 runner_factory: Callable[[], GenerationJobRunner] = GenerationJobRunner):
+        self.concurrency = concurrency
+        self.poll_interval = (JobConfig.get_generation_job_config().worker_poll_interval
+                              if poll_interval is None else poll_interval)
+        self.runner_factory = runner_factory
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._processed = 0
+
+    def run(self, drain: bool = False) -> int:
+        """
+        Process jobs until stopped.
+
+        Args:
+            drain: Exit once no runnable job is left instead of polling for new ones
+
+        Returns:
+            int: Number of job attempts processed
+        """
+        threads = [
+            threading.Thread(target=self._loop, args=(drain,), name=f"generation-worker-{i}")
+            for i in range(self.concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return self._processed
+
+    def start(self) -> threading.Thread:
+        """
+        Run the lease loops in a background daemon thread, e.g. inside the API process.
+
+        Returns:
+            threading.Thread: The thread, which exits after ``stop``
+        """
+        thread = threading.Thread(target=self.run, name="generation-worker", daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self) -> None:
+        """Stop leasing new jobs; jobs already running are finished first."""
+        self._stop.set()
+
+    def _loop(self, drain: bool) -> None:
+        runner = self.runner_factory()
+        logger.info(f"Worker {runner.worker_id} started")
+        while not self._stop.is_set():
+            try:
+                job = runner.run_next()
+            except Exception as e:
+                # Database hiccups must not kill the worker; try again after a pause
+                logger.error(f"Worker {runner.worker_id} could not lease a job: {e}")
+                self._stop.wait(self.poll_interval)
+                continue
+            if job:
+                with self._lock:
+                    self._processed += 1
+            elif drain:
+                break
+            else:
+                self._stop.wait(self.poll_interval)
+        logger.info(f"Worker {runner.worker_id} stopped")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--concurrency', type=int, default=1, help="jobs run in parallel by this process")
+    parser.add_argument('--drain', action='store_true', help="exit once the queue is empty")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    worker = GenerationWorker(concurrency=args.concurrency)
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: worker.stop())
+    processed = worker.run(drain=args.drain)
+    logger.info(f"Processed {processed} job attempts")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,57 @@
+from types import SimpleNamespace
 import pytest
 import mongomock
 from src.core.database.connections.mongo_connection import MongoConnection
-from src.core.database.unit_of_work.mongo_unit_of_work import MongoUnitOfWork
+from src.core.database.unit_of_work.mongo_unit_of_work import MongoUnitOfWork, AsyncMongoUnitOfWork
+
+
+class _AsyncCursor:
+    """Motor-style cursor over a mongomock cursor"""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def sort(self, *args, **kwargs):
+        self._cursor = self._cursor.sort(*args, **kwargs)
+        return self
+
+    def limit(self, limit):
+        self._cursor = self._cursor.limit(limit)
+        return self
+
+    async def to_list(self, length=None):
+        docs = list(self._cursor)
+        return docs if length is None else docs[:length]
+
+
+class _AsyncCollection:
+    """Motor-style collection whose I/O methods are coroutines"""
+
+    def __init__(self, collection):
+        self._collection = collection
+
+    def find(self, *args, **kwargs):
+        return _AsyncCursor(self._collection.find(*args, **kwargs))
+
+    def aggregate(self, pipeline):
+        return _AsyncCursor(self._collection.aggregate(pipeline))
+
+    def __getattr__(self, name):
+        method = getattr(self._collection, name)
+
+        async def call(*args, **kwargs):
+            return method(*args, **kwargs)
+        return call
+
+
+class _AsyncDatabase:
+    def __init__(self, db):
+        self._db = db
+
+    def __getitem__(self, name):
+        return _AsyncCollection(self._db[name])
+
+    __getattr__ = __getitem__
 
 @pytest.fixture
 def mongo_connection():
@@ -16,3 +66,11 @@ def mongo_connection():
 def mongo_uow(mongo_connection):
     """Create MongoDB Unit of Work"""
     return MongoUnitOfWork(mongo_connection)
+
+
+@pytest.fixture
+def async_uow_for():
+    """Build an async Unit of Work over a mongomock database"""
+    def factory(db):
+        return AsyncMongoUnitOfWork(SimpleNamespace(db=_AsyncDatabase(db), session=None))
+    return factory
@@ -0,0 +1,68 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+import pytest
+from src.api.services import execution
+from src.api.services.execution import BoundedExecutor, ServiceBusyError, run_generation
+from src.latex.utils.errors import CompileQueueFullError
+
+
+def test_blocking_work_leaves_event_loop_responsive():
+    executor = BoundedExecutor("test", max_workers=1, max_queue=0, retry_after=5)
+    release = threading.Event()
+
+    async def scenario():
+        work = asyncio.create_task(executor.run(lambda: release.wait(5) and "done"))
+        # The loop keeps serving other coroutines while the call blocks its thread
+        await asyncio.sleep(0.01)
+        ticks = 0
+        for _ in range(3):
+            await asyncio.sleep(0)
+            ticks += 1
+        release.set()
+        return ticks, await work
+
+    assert asyncio.run(scenario()) == (3, "done")
+    assert executor.get_stats()["pending"] == 0
+    executor.shutdown()
+
+
+def test_full_executor_rejects_with_retry_after():
+    executor = BoundedExecutor("test", max_workers=1, max_queue=1, retry_after=7)
+    release = threading.Event()
+
+    async def scenario():
+        running = [asyncio.create_task(executor.run(release.wait, 5)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        with pytest.raises(ServiceBusyError) as busy:
+            await executor.run(lambda: None)
+        release.set()
+        await asyncio.gather(*running)
+        return busy.value, await executor.run(lambda: "accepted again")
+
+    error, result = asyncio.run(scenario())
+    assert error.retry_after == 7
+    assert result == "accepted again"
+    assert executor.get_stats()["rejected"] == 1
+    executor.shutdown()
+
+
+def test_generation_refused_while_compile_queue_is_full(monkeypatch):
+    monkeypatch.setattr(execution, "get_compile_service", lambda: SimpleNamespace(is_full=True))
+    called = []
+
+    with pytest.raises(ServiceBusyError):
+        asyncio.run(run_generation(called.append, 1))
+    assert called == []
+
+
+def test_compile_queue_full_during_generation_maps_to_busy(monkeypatch):
+    monkeypatch.setattr(execution, "get_compile_service", lambda: SimpleNamespace(is_full=False))
+    monkeypatch.setattr(execution, "_llm_executor", BoundedExecutor("llm", 1, 0, 30))
+
+    def generate():
+        raise CompileQueueFullError("LaTeX compile queue is full (2 jobs)")
+
+    with pytest.raises(ServiceBusyError) as busy:
+        asyncio.run(run_generation(generate))
+    assert "compile queue is full" in str(busy.value)
@@ -0,0 +1,75 @@
+import asyncio
+import mongomock
+import pytest
+from src.core.database.models import Resume, User, GenerationJob
+from src.core.database.repositories import ResumeRepository
+from src.core.database.repositories.async_repositories import AsyncMongoResumeRepository
+
+
+@pytest.fixture
+def db():
+    return mongomock.MongoClient()["test_db"]
+
+
+def test_resume_repository_matches_sync_mapping(db, async_uow_for):
+    uow = async_uow_for(db)
+    assert isinstance(uow.resumes, AsyncMongoResumeRepository)
+
+    async def scenario():
+        resume = await uow.resumes.add(Resume(user_id="user", career_summary="Engineer"))
+        fetched = await uow.resumes.get_by_id(resume.id)
+        fetched.career_summary = "Senior engineer"
+        assert await uow.resumes.update(fetched)
+        return resume, await uow.resumes.get_all_by_user("user"), await uow.resumes.get_by_id("not-an-id")
+
+    resume, listed, missing = asyncio.run(scenario())
+    sync_resume = ResumeRepository(type("Connection", (), {"db": db})).get_by_id(resume.id)
+    assert listed == [sync_resume]
+    assert listed[0].career_summary == "Senior engineer"
+    assert missing is None
+
+
+def test_user_lookup_and_preferences(db, async_uow_for):
+    uow = async_uow_for(db)
+
+    async def scenario():
+        user = await uow.users.add(User(user_id="user", email="user@example.com", hashed_password="x"))
+        await uow.users.update_preferences("user", {"llm_preferences": {"model_type": "Claude"}})
+        return (user, await uow.users.get_by_user_id("user"),
+                await uow.users.get_preferences("user"), await uow.users.get_by_id("user"))
+
+    user, by_user_id, preferences, invalid = asyncio.run(scenario())
+    assert by_user_id.id == user.id
+    assert preferences == {"llm_preferences": {"model_type": "Claude"}}
+    assert invalid is None
+
+
+def test_last_resume_id_uses_newest_resume(db, async_uow_for):
+    uow = async_uow_for(db)
+
+    async def scenario():
+        await uow.resumes.add(Resume(user_id="user", title="First"))
+        second = await uow.resumes.add(Resume(user_id="user", title="Second"))
+        return second.id, await uow.get_last_resume_id("user"), await uow.get_last_resume_id("nobody")
+
+    newest, last, none = asyncio.run(scenario())
+    assert last == newest
+    assert none is None
+
+
+def test_job_listing_and_events(db, async_uow_for):
+    uow = async_uow_for(db)
+    db["generation_job_events"].insert_many([
+        {"job_id": "job", "type": "progress", "data": {"progress": 0.5}},
+        {"job_id": "job", "type": "done", "data": {}},
+    ])
+
+    async def scenario():
+        job = await uow.jobs.add(GenerationJob(user_id="user", job_type="resume", params={}))
+        events = await uow.jobs.get_events("job")
+        return job, await uow.jobs.get_all_by_user("user"), events, await uow.jobs.get_events("job", events[0]["id"])
+
+    job, jobs, events, after_first = asyncio.run(scenario())
+    assert [j.id for j in jobs] == [job.id]
+    assert [e["type"] for e in events] == ["progress", "done"]
+    assert [e["type"] for e in after_first] == ["done"]
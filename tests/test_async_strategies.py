@@ -0,0 +1,91 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock
+import httpx
+import pytest
+import src.generator  # noqa: F401  (src.llms and src.generator import each other; load generator first)
+from src.llms.rate_limiter import ConcurrencyLimiter
+from src.llms.runner import LLMRunner
+from src.llms.strategies import LLMStrategy, OpenAIStrategy, ClaudeStrategy, OllamaStrategy
+from src.llms.client_registry import ProviderClientRegistry
+
+
+class EchoStrategy(LLMStrategy):
+    provider = "Echo"
+
+    def generate_content(self, prompt, data, job_description):
+        return f"{prompt}:{data}"
+
+    def create_folder_name(self, prompt, job_description):
+        return "Acme|Engineer"
+
+
+@pytest.mark.parametrize("strategy_class,env_var", [
+    (OpenAIStrategy, "OPENAI_API_KEY"),
+    (ClaudeStrategy, "ANTHROPIC_API_KEY"),
+])
+def test_async_request_matches_sync_request(strategy_class, env_var, monkeypatch):
+    monkeypatch.setenv(env_var, "test_key")
+    strategy = strategy_class("system")
+    if strategy_class is OpenAIStrategy:
+        response = Mock(choices=[Mock(message=Mock(content="Async response"))])
+        sync_create, async_create = Mock(return_value=response), AsyncMock(return_value=response)
+        strategy.client = Mock(chat=Mock(completions=Mock(create=sync_create)))
+        async_client = Mock(chat=Mock(completions=Mock(create=async_create)))
+        monkeypatch.setattr(ProviderClientRegistry, "get_async_openai_client", lambda api_key: async_client)
+    else:
+        response = Mock(spec=["content"], content=[Mock(text="Async response")])
+        sync_create, async_create = Mock(return_value=response), AsyncMock(return_value=response)
+        strategy.client = Mock(messages=Mock(create=sync_create))
+        async_client = Mock(messages=Mock(create=async_create))
+        monkeypatch.setattr(ProviderClientRegistry, "get_async_anthropic_client", lambda api_key: async_client)
+
+    assert asyncio.run(strategy.agenerate_content("prompt", "data", "job")) == "Async response"
+    strategy.generate_content("prompt", "data", "job")
+    assert async_create.await_args == sync_create.call_args
+
+
+def test_ollama_streams_with_httpx(monkeypatch):
+    seen = {}
+
+    def handler(request):
+        seen["body"] = json.loads(request.content)
+        lines = [json.dumps({"response": "partial"}), json.dumps({"response": " Acme_Engineer "})]
+        return httpx.Response(200, content="\n".join(lines).encode())
+
+    monkeypatch.setattr(ProviderClientRegistry, "get_async_ollama_client",
+                        lambda base_url: httpx.AsyncClient(base_url=base_url, transport=httpx.MockTransport(handler)))
+    strategy = OllamaStrategy("system")
+
+    assert asyncio.run(strategy.agenerate_content("prompt", "data", "job")) == "Acme_Engineer"
+    assert seen["body"]["system"] == "system"
+    assert seen["body"]["stream"] is True
+
+
+def test_default_async_methods_wrap_sync_ones():
+    strategy = EchoStrategy("system")
+    runner = LLMRunner(strategy)
+    assert asyncio.run(runner.agenerate_content("prompt", "data", "job")) == "prompt:data"
+    assert asyncio.run(runner.acreate_company_name_and_job_title("naming", "job")) == ("acme", "engineer")
+
+
+def test_generate_many_bounds_concurrency_and_keeps_order(monkeypatch):
+    strategy = EchoStrategy("system")
+    in_flight, peak = 0, 0
+
+    async def agenerate_content(prompt, data, job_description):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001 * (10 - int(prompt)))
+        in_flight -= 1
+        return prompt
+
+    strategy.agenerate_content = agenerate_content
+    runner = LLMRunner(strategy)
+    runner.concurrency_limiter = ConcurrencyLimiter(limits=lambda provider: 3)
+    monkeypatch.setattr(LLMRunner, "max_concurrency", 3)
+
+    results = asyncio.run(runner.agenerate_many((str(i), "", "") for i in range(10)))
+    assert results == [str(i) for i in range(10)]
+    assert peak == 3
@@ -0,0 +1,90 @@
+import asyncio
+import json
+from unittest.mock import Mock, patch
+import mongomock
+import pytest
+from src.core.database.models import Resume
+from src.generator.batch import BatchGenerator, BatchItem, dedupe, job_fingerprint, load_batch
+from src.generator.generator_manager import GenerationType
+from src.generator.utils.job_info import JobInfo
+from src.api.services.job_service import JobService
+
+
+def test_load_batch_reads_jsonl_and_csv(tmp_path):
+    jsonl = tmp_path / "jobs.jsonl"
+    jsonl.write_text('{"id": "acme", "job_description": "Python developer"}\n\n"Data engineer"\n', encoding="utf-8")
+    csv_file = tmp_path / "jobs.csv"
+    csv_file.write_text('id,job_description\n,"Go developer, remote"\nx,\n', encoding="utf-8")
+
+    assert load_batch(jsonl) == [BatchItem("acme", "Python developer"), BatchItem("2", "Data engineer")]
+    assert load_batch(csv_file) == [BatchItem("1", "Go developer, remote")]
+
+    jsonl.write_text('"Python developer"\n\n{"title": "no description"}\n', encoding="utf-8")
+    with pytest.raises(ValueError, match="line 3 of"):
+        load_batch(jsonl)
+
+
+def test_dedupe_ignores_case_and_whitespace():
+    items = [BatchItem("1", "Python  developer\n"), BatchItem("2", "Go developer"), BatchItem("3", "python developer")]
+
+    unique, duplicates = dedupe(items)
+    assert [item.id for item in unique] == ["1", "2"]
+    assert duplicates == {"3": "1"}
+    assert job_fingerprint("A  b") == job_fingerprint("a b")
+
+
+def fake_manager(job_description=None, **kwargs):
+    if "fail" in job_description:
+        raise ValueError("Cannot generate content for positions requiring security clearance")
+    yield "Done", 1.0
+    yield Resume(_id=f"resume-{job_description}", user_id="user")
+
+
+def test_batch_loads_context_once_and_streams_manifest(tmp_path):
+    context = Mock(preferences={"llm_preferences": {"model_type": "Claude", "model_name": "m", "temperature": 0.1},
+                                "section_preferences": {"skills": "Process"}})
+    managers = []
+
+    def make_manager(user_id):
+        manager = Mock()
+        manager.generate.side_effect = fake_manager
+        managers.append(manager)
+        return manager
+
+    items = [BatchItem("a", "one"), BatchItem("b", "fail"), BatchItem("c", "ONE "), BatchItem("d", "two")]
+    with patch("src.generator.batch.UserContext.load", return_value=context) as load, \
+            patch("src.generator.batch.GeneratorManager", side_effect=make_manager), \
+            patch("src.generator.batch.JobInfo.extract_from_description",
+                  side_effect=lambda text, runner: JobInfo("Acme", text, text)), \
+            patch("src.generator.batch.OutputManager"):
+        summary = BatchGenerator("user", concurrency=2, options={"temperature": 0.5}).run(
+            items, tmp_path / "out" / "results.jsonl")
+
+    load.assert_called_once_with("user")
+    assert (summary.total, summary.succeeded, summary.failed, summary.duplicates) == (4, 2, 1, 1)
+    assert summary.jobs_per_minute > 0
+    assert len(managers) == 3
+    assert all(m.generate.call_args.kwargs["user_context"] is context for m in managers)
+    managers[0].configure_llm.assert_called_once_with(model_type="Claude", model_name="m", temperature=0.5)
+
+    results = {r["id"]: r for r in map(json.loads, (tmp_path / "out" / "results.jsonl").read_text().splitlines())}
+    assert results["a"]["resume_id"] == "resume-one"
+    assert results["a"]["job_title"] == "one"
+    assert results["b"]["status"] == "failed" and "clearance" in results["b"]["error"]
+    assert (results["c"]["status"], results["c"]["duplicate_of"]) == ("duplicate", "a")
+    assert all(r["seconds"] >= 0 for r in results.values())
+
+
+def test_batch_api_queues_distinct_postings(async_uow_for, monkeypatch):
+    dispatched = []
+    monkeypatch.setattr("src.api.services.job_service.dispatch_job", dispatched.append)
+    service = JobService(async_uow_for(mongomock.MongoClient().db))
+
+    jobs, duplicates = asyncio.run(service.submit_batch(
+        "user", GenerationType.BOTH, ["Python developer", "Go developer", "python  developer"],
+        {"model_type": "Claude"}))
+
+    assert duplicates == 1
+    assert [job.params["job_description"] for job in jobs] == ["Python developer", "Go developer"]
+    assert all(job.job_type == "both" and job.params["model_type"] == "Claude" for job in jobs)
+    assert dispatched == [job.id for job in jobs]
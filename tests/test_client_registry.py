@@ -0,0 +1,50 @@
+import asyncio
+from unittest.mock import Mock
+import mongomock
+import pytest
+from src.core.database.connections import client_registry
+from src.core.database.connections.client_registry import MongoClientRegistry
+from src.core.database.factory import get_unit_of_work, get_connection_stats
+
+
+@pytest.fixture(autouse=True)
+def mock_registry(monkeypatch):
+    """Back the registry with mongomock and start from an empty registry."""
+    monkeypatch.setattr(client_registry, "MongoClient", lambda uri, event_listeners, **kwargs: mongomock.MongoClient())
+    monkeypatch.setattr(client_registry, "AsyncIOMotorClient", lambda uri, event_listeners, io_loop, **kwargs: Mock())
+    MongoClientRegistry._reset_after_fork()
+    yield
+    MongoClientRegistry.close_all()
+
+
+def test_unit_of_work_shares_one_client():
+    first = get_unit_of_work()
+    second = get_unit_of_work()
+    assert first.connection.client is second.connection.client
+    assert get_connection_stats()["clients"] == 1
+
+
+def test_clients_are_not_reused_after_fork(monkeypatch):
+    client = MongoClientRegistry.get_client("mongodb://localhost")
+    monkeypatch.setattr(client_registry.os, "getpid", lambda: -1)
+    assert MongoClientRegistry.get_client("mongodb://localhost") is not client
+
+
+def test_close_all_clears_registry():
+    MongoClientRegistry.get_client("mongodb://localhost")
+    MongoClientRegistry.close_all()
+    assert get_connection_stats()["clients"] == 0
+
+
+def test_async_clients_are_scoped_to_their_event_loop():
+    async def get_clients():
+        return (MongoClientRegistry.get_async_client("mongodb://localhost"),
+                MongoClientRegistry.get_async_client("mongodb://localhost"))
+
+    first, same = asyncio.run(get_clients())
+    other, _ = asyncio.run(get_clients())
+    assert first is same
+    assert other is not first
+    # The client of the closed loop is closed once another loop needs one
+    first.close.assert_called_once()
+    assert get_connection_stats()["clients"] == 1
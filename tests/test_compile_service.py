@@ -0,0 +1,93 @@
+import os
+import subprocess
+import threading
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+from src.latex.compile_service import LatexCompileService
+from src.latex.utils.errors import CompileQueueFullError, CompileTimeoutError
+
+DOCUMENT = "\\documentclass{article}\n\\begin{document}\nHello\n\\end{document}\n"
+
+
+def fake_pdflatex(args, cwd, **kwargs):
+    jobname = next(a.split("=", 1)[1] for a in args if a.startswith("-jobname="))
+    (Path(cwd) / f"{jobname}.pdf").write_bytes(b"%PDF " + b",".join(sorted(p.name.encode() for p in Path(cwd).iterdir())))
+    return Mock(returncode=0, stdout="", stderr="")
+
+
+@pytest.fixture
+def service(tmp_path):
+    service = LatexCompileService(max_workers=1, max_queue=1, queue_timeout=0,
+                                  build_root=tmp_path, memory_limit_mb=0)
+    yield service
+    service.shutdown()
+
+
+def test_compile_runs_in_sandbox_with_assets(service, tmp_path):
+    with patch("src.latex.compile_service.subprocess.run", side_effect=fake_pdflatex) as run:
+        pdf = service.compile(DOCUMENT, jobname="resume", assets={"signature.jpg": b"img"})
+
+    assert pdf == b"%PDF resume.tex,signature.jpg"
+    sandbox = run.call_args.kwargs["cwd"]
+    assert Path(sandbox).parent == tmp_path
+    assert not Path(sandbox).exists()
+
+
+def test_rejects_jobs_when_queue_is_full(service):
+    release = threading.Event()
+
+    def blocking_run(args, cwd, **kwargs):
+        release.wait(5)
+        return fake_pdflatex(args, cwd)
+
+    with patch("src.latex.compile_service.subprocess.run", side_effect=blocking_run):
+        running = service.submit(DOCUMENT)
+        queued = service.submit(DOCUMENT)
+        with pytest.raises(CompileQueueFullError):
+            service.submit(DOCUMENT)
+        release.set()
+        assert running.result() and queued.result()
+    assert service.pending == 0
+
+
+def test_timeout_raises(service):
+    with patch("src.latex.compile_service.subprocess.run",
+               side_effect=subprocess.TimeoutExpired("pdflatex", 1)):
+        with pytest.raises(CompileTimeoutError):
+            service.compile(DOCUMENT)
+
+
+def test_failed_compile_returns_none(service):
+    with patch("src.latex.compile_service.subprocess.run",
+               return_value=Mock(returncode=1, stdout="! Undefined control sequence", stderr="")):
+        assert service.compile(DOCUMENT) is None
+
+
+@pytest.mark.skipif(os.name != "posix", reason="the memory limit needs a POSIX shell")
+def test_memory_limit_is_set_by_a_shell_wrapper(tmp_path):
+    service = LatexCompileService(max_workers=1, build_root=tmp_path, memory_limit_mb=256)
+    try:
+        with patch("src.latex.compile_service.subprocess.run", side_effect=fake_pdflatex) as run:
+            assert service.compile(DOCUMENT)
+    finally:
+        service.shutdown()
+
+    args = run.call_args.args[0]
+    assert args[:3] == ["sh", "-c", 'ulimit -v 262144 && exec "$@"']
+    assert args[4] == "pdflatex"
+    assert "preexec_fn" not in run.call_args.kwargs
+
+
+def test_format_timeout_falls_back_to_cold_compile(service):
+    format_cache = Mock(prepare=Mock(return_value=("resume_fmt", "body")), get_env=Mock(return_value={}))
+
+    def hang_with_format(args, cwd, **kwargs):
+        if any(a.startswith("-fmt=") for a in args):
+            raise subprocess.TimeoutExpired("pdflatex", 1)
+        return fake_pdflatex(args, cwd)
+
+    with patch("src.latex.compile_service.subprocess.run", side_effect=hang_with_format):
+        assert service.compile(DOCUMENT, format_cache=format_cache)
+    format_cache.mark_failed.assert_called_once_with("resume_fmt")
@@ -0,0 +1,56 @@
+import asyncio
+import mongomock
+import pytest
+from src.api.schemas.cover_letter import CoverLetterResponse
+from src.api.services import cover_letter_service
+from src.api.services.cover_letter_service import CoverLetterService
+from src.core.database.models import Resume
+from src.generator.utils.job_info import JobInfo
+
+
+@pytest.fixture
+def db():
+    return mongomock.MongoClient()["test_db"]
+
+
+@pytest.fixture
+def service(db, async_uow_for):
+    return CoverLetterService(async_uow_for(db))
+
+
+def add_resume(service, **fields):
+    async def add():
+        async with service.uow:
+            return await service.uow.resumes.add(Resume(user_id="user", **fields))
+    return asyncio.run(add())
+
+
+def test_generate_returns_cover_letter_response(db, service, monkeypatch):
+    resume = add_resume(service, model_type="ClaudeStrategy")
+
+    async def fake_run_generation(fn, user_id, job_description, resume_id, llm_preferences):
+        db["resumes"].update_one(
+            {}, {"$set": {"cover_letter_content": "Dear hiring manager", "cover_letter_pdf": b"%PDF"}})
+        return JobInfo("Acme", "Engineer", job_description)
+    monkeypatch.setattr(cover_letter_service, "run_generation", fake_run_generation)
+
+    response = asyncio.run(service.generate_cover_letter("user", "Python developer", resume.id))
+
+    assert isinstance(response, CoverLetterResponse)
+    assert (response.id, response.resume_id) == (resume.id, resume.id)
+    assert (response.company_name, response.job_title) == ("Acme", "Engineer")
+    assert response.content == "Dear hiring manager"
+    assert response.model_type == "ClaudeStrategy"
+
+
+def test_get_and_list_read_cover_letters_from_resumes(service):
+    with_letter = add_resume(service, cover_letter_content="Dear team", cover_letter_pdf=b"%PDF")
+    add_resume(service)
+
+    letter = asyncio.run(service.get_cover_letter("user", with_letter.id))
+    listed = asyncio.run(service.list_cover_letters("user"))
+
+    assert letter.content == "Dear team"
+    assert [item.id for item in listed] == [with_letter.id]
+    assert asyncio.run(service.get_cover_letter("someone_else", with_letter.id)) is None
+    assert asyncio.run(service.list_cover_letters("someone_else")) == []
@@ -0,0 +1,47 @@
+from unittest.mock import Mock, patch
+from src.latex.utils.format_cache import LatexFormatCache, split_preamble
+
+DOCUMENT = """\\documentclass{article}
+\\usepackage{hyperref}
+\\graphicspath{{.}}
+\\begin{document}
+Hello
+\\end{document}
+"""
+
+
+def test_split_preamble_keeps_settings_after_last_package():
+    head, rest = split_preamble(DOCUMENT)
+    assert head.endswith("\\usepackage{hyperref}\n")
+    assert rest.startswith("\\graphicspath{{.}}")
+    assert split_preamble("no document here") is None
+
+
+def test_format_name_changes_with_preamble():
+    head, _ = split_preamble(DOCUMENT)
+    assert LatexFormatCache.format_name(head) != LatexFormatCache.format_name(head.replace("hyperref", "xcolor"))
+
+
+def test_prepare_builds_format_once(tmp_path):
+    cache = LatexFormatCache(cache_dir=tmp_path)
+
+    def fake_run(args, cwd, **kwargs):
+        name = next(a.split("=", 1)[1] for a in args if a.startswith("-jobname="))
+        (tmp_path / cwd / f"{name}.fmt").write_bytes(b"fmt")
+        return Mock(returncode=0, stdout="")
+
+    with patch("src.latex.utils.format_cache.subprocess.run", side_effect=fake_run) as run:
+        name, content = cache.prepare(DOCUMENT)
+        assert cache.prepare(DOCUMENT)[0] == name
+        assert run.call_count == 1
+
+    assert (tmp_path / f"{name}.fmt").exists()
+    assert "\\endofdump\n\\graphicspath" in content
+
+
+def test_prepare_gives_up_after_failed_build(tmp_path):
+    cache = LatexFormatCache(cache_dir=tmp_path)
+    with patch("src.latex.utils.format_cache.subprocess.run", side_effect=FileNotFoundError("pdflatex")) as run:
+        assert cache.prepare(DOCUMENT) is None
+        assert cache.prepare(DOCUMENT) is None
+        assert run.call_count == 1
@@ -0,0 +1,157 @@
+import time
+from unittest.mock import Mock, patch
+import mongomock
+import pytest
+from src.core.database.connections import client_registry
+from src.core.database.connections.client_registry import MongoClientRegistry
+from src.core.database.factory import get_unit_of_work
+from src.core.database.models import GenerationRun, Resume
+from src.generator.generator_manager import GenerationType, GeneratorManager
+from src.generator.resume_generator import ResumeGenerator
+
+SECTIONS = {"career_summary": "process", "skills": "process", "work_experience": "process"}
+
+
+@pytest.fixture
+def uow(monkeypatch):
+    client = mongomock.MongoClient()
+    monkeypatch.setattr(client_registry, "MongoClient", lambda uri, event_listeners, **kwargs: client)
+    MongoClientRegistry._reset_after_fork()
+    yield get_unit_of_work()
+    MongoClientRegistry.close_all()
+
+
+@pytest.fixture
+def llm():
+    runner = Mock(provider="Claude", max_concurrency=1)
+    runner.get_config.return_value = {"type": "ClaudeStrategy", "model": "claude", "temperature": 0.1}
+    runner.generate_content.side_effect = lambda prompt, data, job: f"{prompt} from {data}"
+    return runner
+
+
+@pytest.fixture
+def resume_generator(uow, llm):
+    """ResumeGenerator running sections, checkpoints and saving for real, with mocked loaders and compiler."""
+    generator = ResumeGenerator.__new__(ResumeGenerator)
+    generator.user_id = "user"
+    generator.uow = uow
+    generator.use_cache = False
+    generator.section_cache = Mock()
+    generator.user_context = Mock(preferences={})
+    generator.portfolio_loader = Mock(get_section_data=lambda section: {"about": section})
+    generator.relevance_ranker = Mock(select=lambda section, data, job_description, preferences: data)
+    generator.prompt_loader = Mock(get_section_prompt=lambda section: f"Write the {section}")
+    generator.latex_compiler = Mock(generate_pdf=Mock(return_value=b"%PDF"))
+    generator.llm_runner = llm
+    return generator
+
+
+@pytest.fixture
+def manager(resume_generator, llm, tmp_path):
+    cover_letters = Mock()
+    with patch("src.generator.generator_manager.PromptLoader"), \
+            patch("src.generator.generator_manager.LLMRunner.create_with_config", return_value=llm), \
+            patch("src.generator.generator_manager.ResumeGenerator", return_value=resume_generator), \
+            patch("src.generator.generator_manager.CoverLetterGenerator", return_value=cover_letters), \
+            patch("src.generator.generator_manager.UserContext.load",
+                  return_value=Mock(feature_preferences={"check_clearance": False, "auto_save": False})):
+        manager = GeneratorManager("user")
+        manager.configure_llm("Claude", "claude", 0.1)
+        manager.cover_letters = cover_letters
+        manager.output_manager = Mock(output_dir=str(tmp_path))
+        manager.output_manager.get_job_info.return_value = Mock(company_name="Acme", job_title="Engineer",
+                                                                job_description="Python developer")
+        yield manager
+
+
+def generate(manager, generation_type=GenerationType.RESUME):
+    return list(manager.generate(generation_type, "Python developer", SECTIONS, manager.output_manager))
+
+
+def fail_on(llm, section):
+    succeed = llm.generate_content.side_effect
+
+    def generate_content(prompt, data, job):
+        if section in prompt:
+            raise RuntimeError("provider down")
+        return succeed(prompt, data, job)
+    llm.generate_content.side_effect = generate_content
+    return succeed
+
+
+def test_failed_run_resumes_only_missing_sections(manager, llm, resume_generator, uow):
+    succeed = fail_on(llm, "work_experience")
+    with pytest.raises(RuntimeError):
+        generate(manager)
+
+    run = uow.runs.get_by_id(manager.run_id)
+    assert run.status == "failed" and "provider down" in run.error
+    assert set(run.sections) == {"career_summary", "skills"}
+    assert set(run.section_fingerprints) == {"career_summary", "skills"}
+    assert run.llm_settings == {"model_type": "Claude", "model_name": "claude", "temperature": 0.1}
+    assert run.resume_id is None
+
+    llm.generate_content.reset_mock()
+    llm.generate_content.side_effect = succeed
+    resume = list(manager.resume_run(run.id))[-1]
+
+    assert [c.args[0] for c in llm.generate_content.call_args_list] == ["Write the work_experience"]
+    assert isinstance(resume, Resume)
+    assert resume.career_summary == run.sections["career_summary"]
+    assert set(resume.section_fingerprints) == set(SECTIONS)
+    run = uow.runs.get_by_id(run.id)
+    assert (run.status, run.resume_id) == ("succeeded", resume.id)
+
+    # Nothing is left to do: the saved resume is returned without compiling again
+    assert list(manager.resume_run(run.id))[-1].id == resume.id
+    assert llm.generate_content.call_count == 1
+    assert resume_generator.latex_compiler.generate_pdf.call_count == 1
+
+
+def test_failed_cover_letter_resumes_without_redoing_resume(manager, llm, resume_generator, uow):
+    manager.cover_letters.generate_cover_letter.side_effect = [RuntimeError("compile failed"), "Saved"]
+    with pytest.raises(RuntimeError):
+        generate(manager, GenerationType.BOTH)
+    run = uow.runs.get_by_id(manager.run_id)
+    assert run.resume_id and not run.cover_letter_done
+
+    results = list(manager.resume_run(run.id))
+    assert results[-1] == ("Cover letter generation: Saved", 1.0)
+    assert llm.generate_content.call_count == len(SECTIONS)
+    assert resume_generator.latex_compiler.generate_pdf.call_count == 1
+    assert manager.cover_letters.generate_cover_letter.call_args.kwargs["resume_id"] == run.resume_id
+    assert uow.runs.get_by_id(run.id).cover_letter_done
+
+
+def test_runs_belong_to_their_user(manager, uow):
+    generate(manager)
+    with pytest.raises(ValueError, match="not found"):
+        list(GeneratorManager("someone_else").resume_run(manager.run_id))
+
+
+def test_abandoned_section_checkpoints_to_its_own_run(resume_generator, llm, uow):
+    succeed = llm.generate_content.side_effect
+
+    def slow_skills(prompt, data, job):
+        if "skills" in prompt:
+            time.sleep(0.3)
+        return succeed(prompt, data, job)
+    llm.generate_content.side_effect = slow_skills
+    resume_generator.hardcoder = Mock(hardcode_section=lambda section: f"hardcoded {section}")
+    output_manager = Mock()
+    output_manager.get_job_info.return_value = Mock(company_name="Acme", job_title="Engineer",
+                                                    job_description="job")
+    sections = {"career_summary": "process", "skills": "process"}
+    first, second = (uow.runs.add(GenerationRun(user_id="user", generation_type="resume", job_description="job"))
+                     for _ in range(2))
+
+    list(resume_generator.generate_resume("job", sections, output_manager, run=first, latency_budget=0.1))
+    llm.generate_content.side_effect = succeed
+    list(resume_generator.generate_resume("job", {"career_summary": "process"}, output_manager, run=second))
+    fingerprints = dict(resume_generator.section_fingerprints)
+    time.sleep(0.4)
+
+    # The skills thread abandoned by the first call finishes during the second one
+    assert set(uow.runs.get_by_id(first.id).sections) == {"career_summary", "skills"}
+    assert set(uow.runs.get_by_id(second.id).sections) == {"career_summary"}
+    assert resume_generator.section_fingerprints == fingerprints == {"career_summary": fingerprints["career_summary"]}
@@ -0,0 +1,210 @@
+import asyncio
+import time
+from dataclasses import replace
+from datetime import datetime
+from unittest.mock import Mock, patch
+import mongomock
+import pytest
+from bson import ObjectId
+from src.core.database.connections import client_registry
+from src.core.database.connections.client_registry import MongoClientRegistry
+from src.core.database.factory import get_unit_of_work
+from src.core.database.models import Resume
+from src.generator.generator_manager import GenerationType
+from src.generator.job_runner import GenerationJobRunner
+from src.api.services.job_service import JobService
+from config.job_config import JobConfig
+from src.llms.utils.errors import APIError
+from src.worker import GenerationWorker
+
+
+@pytest.fixture
+def runner(monkeypatch):
+    client = mongomock.MongoClient()
+    monkeypatch.setattr(client_registry, "MongoClient", lambda uri, event_listeners, **kwargs: client)
+    MongoClientRegistry._reset_after_fork()
+    yield GenerationJobRunner(get_unit_of_work(), progress_interval=0)
+    MongoClientRegistry.close_all()
+
+
+def fake_manager(results):
+    manager = Mock()
+    manager.generate.side_effect = lambda **kwargs: iter(results)
+    return manager
+
+
+def run_with(runner, job, manager):
+    with patch("src.generator.job_runner.GeneratorManager", return_value=manager), \
+            patch("src.generator.job_runner.JobInfo"), \
+            patch("src.generator.job_runner.OutputManager"):
+        return runner.run(job.id)
+
+
+def test_resume_job_records_progress_and_result(runner):
+    job = runner.create_job("user", GenerationType.RESUME, "Python developer",
+                            {"model_type": "Claude", "temperature": None})
+    assert job.status == "queued"
+    assert job.params == {"model_type": "Claude", "job_description": "Python developer"}
+
+    resume = Resume(_id="resume-1", user_id="user")
+    finished = run_with(runner, job, fake_manager([("Processing skills...", 0.5), ("Done", 1.0), resume]))
+
+    assert finished.status == "succeeded"
+    assert finished.resume_id == "resume-1"
+    assert finished.progress == 1.0
+    assert finished.message == "Done"
+    assert finished.started_at and finished.finished_at
+
+
+def test_failed_job_keeps_error(runner):
+    job = runner.create_job("user", GenerationType.RESUME, "Python developer")
+    manager = Mock()
+    manager.generate.side_effect = ValueError("Cannot generate content for positions requiring security clearance")
+
+    finished = run_with(runner, job, manager)
+    assert finished.status == "failed"
+    assert "security clearance" in finished.error
+
+
+def test_job_runs_only_once(runner):
+    job = runner.create_job("user", GenerationType.RESUME, "Python developer")
+    run_with(runner, job, fake_manager([("Done", 1.0)]))
+    assert run_with(runner, job, fake_manager([])) is None
+
+
+def test_events_are_streamed_as_sse(runner, async_uow_for):
+    job = runner.create_job("user", GenerationType.RESUME, "Python developer")
+
+    def generate(**kwargs):
+        yield "Processing skills...", 0.5
+        kwargs["on_section"]("skills", "\\section{Skills}")
+        yield Resume(_id="resume-1", user_id="user")
+
+    manager = Mock()
+    manager.generate.side_effect = generate
+    run_with(runner, job, manager)
+
+    with runner.uow:
+        events = runner.uow.jobs.get_events(job.id)
+    assert [e["type"] for e in events] == ["progress", "progress", "section", "done"]
+
+    async def collect(last_event_id=None):
+        service = JobService(async_uow_for(runner.uow.connection.db))
+        return [chunk async for chunk in service.stream_events(job.id, last_event_id)]
+
+    chunks = asyncio.run(collect())
+    assert chunks[-1].startswith(f"id: {events[-1]['id']}\nevent: done\n")
+    assert '"resume_id": "resume-1"' in chunks[-1]
+    assert len(asyncio.run(collect(events[1]["id"]))) == 2
+
+
+def test_event_stream_ends_for_finished_or_missing_job_without_final_event(runner, async_uow_for, monkeypatch):
+    monkeypatch.setattr(JobConfig, "GENERATION_JOBS", replace(JobConfig.GENERATION_JOBS, event_poll_interval=0))
+    job = run_with(runner, runner.create_job("user", GenerationType.RESUME, "Python developer"),
+                   fake_manager([("Done", 1.0), Resume(_id="resume-1", user_id="user")]))
+    # The events expired before the client connected
+    runner.uow.jobs.events.delete_many({})
+
+    async def collect(job_id):
+        service = JobService(async_uow_for(runner.uow.connection.db))
+        return [chunk async for chunk in service.stream_events(job_id)]
+
+    chunks = asyncio.run(collect(job.id))
+    assert chunks == ['event: done\ndata: {"resume_id": "resume-1", "message": "Done"}\n\n']
+    assert asyncio.run(collect(str(ObjectId()))) == ['event: error\ndata: {"error": "Job not found"}\n\n']
+
+
+def expire_lease(runner, job_id):
+    runner.uow.jobs.collection.update_one({"_id": ObjectId(job_id)}, {"$set": {"lease_expires_at": datetime(2000, 1, 1)}})
+
+
+def test_crashed_workers_job_is_leased_again_and_stale_result_discarded(runner):
+    job = runner.create_job("user", GenerationType.RESUME, "Python developer")
+    with runner.uow:
+        assert runner.uow.jobs.lease("crashed-worker", 60).id == job.id
+        # Still leased: nobody else can take it
+        assert runner.uow.jobs.lease("other-worker", 60) is None
+
+    expire_lease(runner, job.id)
+    finished = run_with(runner, job, fake_manager([("Done", 1.0)]))
+    assert finished.status == "succeeded"
+    assert finished.attempts == 2
+    assert finished.worker_id == runner.worker_id
+
+    with runner.uow:
+        # The crashed worker coming back can neither renew nor overwrite the result
+        assert not runner.uow.jobs.heartbeat(job.id, "crashed-worker", 60)
+        assert not runner.uow.jobs.mark_failed(job.id, "late", worker_id="crashed-worker")
+        assert runner.uow.jobs.get_by_id(job.id).status == "succeeded"
+
+
+def test_transient_failures_are_retried_until_max_attempts(runner):
+    runner.config = replace(runner.config, max_attempts=2, retry_delay_seconds=0)
+    job = runner.create_job("user", GenerationType.RESUME, "Python developer")
+    manager = Mock()
+    manager.generate.side_effect = APIError("Claude API error: overloaded", status_code=529, retryable=True)
+
+    retried = run_with(runner, job, manager)
+    assert retried.status == "queued"
+    assert "overloaded" in retried.error
+    assert retried.worker_id is None
+
+    failed = run_with(runner, job, manager)
+    assert failed.status == "failed"
+    assert failed.attempts == 2
+
+
+def test_job_abandoned_too_often_is_failed(runner):
+    runner.config = replace(runner.config, max_attempts=1)
+    job = runner.create_job("user", GenerationType.RESUME, "Python developer")
+    with runner.uow:
+        runner.uow.jobs.lease("crashed-worker", 60)
+    expire_lease(runner, job.id)
+
+    manager = fake_manager([("Done", 1.0)])
+    finished = run_with(runner, job, manager)
+    assert finished.status == "failed"
+    assert "Gave up after 1 attempts" in finished.error
+    manager.generate.assert_not_called()
+
+
+def test_worker_drains_queue_running_each_job_once(runner):
+    jobs = [runner.create_job("user", GenerationType.RESUME, f"Job {i}") for i in range(6)]
+    manager = fake_manager([("Done", 1.0)])
+
+    with patch("src.generator.job_runner.GeneratorManager", return_value=manager), \
+            patch("src.generator.job_runner.JobInfo"), \
+            patch("src.generator.job_runner.OutputManager"):
+        worker = GenerationWorker(concurrency=3, poll_interval=0,
+                                  runner_factory=lambda: GenerationJobRunner(runner.uow, progress_interval=0))
+        assert worker.run(drain=True) == 6
+
+    with runner.uow:
+        finished = [runner.uow.jobs.get_by_id(job.id) for job in jobs]
+    assert all(job.status == "succeeded" and job.attempts == 1 for job in finished)
+    assert len({job.worker_id for job in finished}) <= 3
+
+
+def test_background_worker_picks_up_retried_job(runner):
+    runner.config = replace(runner.config, retry_delay_seconds=0)
+    job = runner.create_job("user", GenerationType.RESUME, "Python developer")
+    manager = Mock()
+    manager.generate.side_effect = [APIError("Claude API error: overloaded", status_code=529, retryable=True),
+                                    iter([("Done", 1.0)])]
+
+    with patch("src.generator.job_runner.GeneratorManager", return_value=manager), \
+            patch("src.generator.job_runner.JobInfo"), \
+            patch("src.generator.job_runner.OutputManager"):
+        assert runner.run(job.id).status == "queued"
+        worker = GenerationWorker(poll_interval=0.01,
+                                  runner_factory=lambda: GenerationJobRunner(runner.uow, progress_interval=0))
+        thread = worker.start()
+        deadline = time.monotonic() + 5
+        while runner._get(job.id).status == "queued" and time.monotonic() < deadline:
+            time.sleep(0.01)
+        worker.stop()
+        thread.join(timeout=5)
+
+    finished = runner._get(job.id)
+    assert (finished.status, finished.attempts) == ("succeeded", 2)
+    assert not thread.is_alive()
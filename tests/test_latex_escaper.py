@@ -0,0 +1,22 @@
+from src.latex.utils import LatexEscaper, sanitize_text
+
+
+def test_escape_text_escapes_every_special_character():
+    assert LatexEscaper.escape_text("R&D 100% $5 #1 a_b {x} ~ ^ <>") == (
+        "R\\&D 100\\% \\$5 \\#1 a\\_b \\{x\\} \\textasciitilde{} \\textasciicircum{} \\textless{}\\textgreater{}"
+    )
+    # A leading special character used to stop escaping after the first replacement
+    assert LatexEscaper.escape_text("$5 & up") == "\\$5 \\& up"
+    assert LatexEscaper.escape_text("\\textbf{keep}") == "\\textbf{keep}"
+    assert LatexEscaper.escape_text(42) == "42"
+
+
+def test_escape_many_and_tree():
+    assert LatexEscaper.escape_many(["a_b", 1]) == ["a\\_b", "1"]
+    tree = {"skills": [{"C&C++": ["50%", 3]}], "dates": ("a_b",)}
+    assert LatexEscaper.escape_tree(tree) == {"skills": [{"C&C++": ["50\\%", 3]}], "dates": ("a\\_b",)}
+
+
+def test_sanitize_text_drops_control_characters():
+    assert sanitize_text(b"line\x00one\r\n") == "lineone"
+    assert sanitize_text("caf\u00e9\u200b") == "cafe\u0301"
@@ -0,0 +1,184 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+import httpx
+import pytest
+import src.generator  # noqa: F401  (src.llms and src.generator import each other; load generator first)
+from config.llm_config import LLMConfig, ResilienceConfig
+from src.llms import resilience, runner as runner_module
+from src.llms.resilience import CircuitBreaker
+from src.llms.runner import LLMRunner
+from src.llms.strategies import LLMStrategy
+from src.llms.utils.errors import APIError, CircuitOpenError
+
+
+class ScriptedStrategy(LLMStrategy):
+    """Raises the scripted errors in order, then returns its provider name."""
+
+    provider = "Primary"
+
+    def __init__(self, *errors, provider=None):
+        super().__init__("system")
+        self.errors = list(errors)
+        self.calls = 0
+        if provider:
+            self.provider = provider
+
+    def generate_content(self, prompt, data, job_description):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return self.provider
+
+    def create_folder_name(self, prompt, job_description):
+        return self.generate_content(prompt, None, job_description)
+
+
+def rate_limited(retry_after=None):
+    return APIError("429 Too Many Requests", status_code=429, retry_after=retry_after, retryable=True)
+
+
+@pytest.fixture(autouse=True)
+def resilience_config(monkeypatch):
+    monkeypatch.setattr(resilience, "_breakers", {})
+    sleeps = []
+    monkeypatch.setattr(runner_module, "time", SimpleNamespace(sleep=sleeps.append))
+    config = ResilienceConfig(max_retries=3, backoff_base_seconds=0.5, backoff_max_seconds=30,
+                              breaker_failure_threshold=5, breaker_reset_seconds=60,
+                              hedge_after_seconds=0, failover_chain=[])
+    monkeypatch.setattr(LLMConfig, "RESILIENCE", config)
+    return config, sleeps
+
+
+def test_transient_errors_are_retried_honoring_retry_after(resilience_config):
+    config, sleeps = resilience_config
+    strategy = ScriptedStrategy(rate_limited(retry_after=7), rate_limited())
+
+    assert LLMRunner(strategy).generate_content("prompt", "data", "job") == "Primary"
+    assert strategy.calls == 3
+    assert sleeps[0] == 7
+    assert 0 <= sleeps[1] <= config.backoff_base_seconds * 2
+
+
+def test_failover_chain_is_used_when_a_provider_gives_up(resilience_config, monkeypatch):
+    config, sleeps = resilience_config
+    config.failover_chain = ["Secondary"]
+    primary = ScriptedStrategy(APIError("401 Unauthorized", status_code=401))
+    secondary = ScriptedStrategy(provider="Secondary")
+    runner = LLMRunner(primary)
+    monkeypatch.setattr(runner, "_get_ai_strategy", lambda provider: secondary)
+
+    assert runner.generate_content("prompt", "data", "job") == "Secondary"
+    # Non-retryable errors move on to the next provider right away
+    assert primary.calls == 1 and sleeps == []
+
+    config.failover_chain = []
+    failing = LLMRunner(ScriptedStrategy(*[APIError("bad request", status_code=400)] * 2))
+    assert failing.create_company_name_and_job_title("naming", "job") == ("errorcompanyname", "errorjobtitle")
+
+
+def test_circuit_breaker_opens_and_probes_after_reset(resilience_config):
+    config, _ = resilience_config
+    config.breaker_failure_threshold = 2
+    config.max_retries = 0
+    strategy = ScriptedStrategy(*[rate_limited()] * 3)
+    runner = LLMRunner(strategy)
+
+    for _ in range(2):
+        with pytest.raises(APIError):
+            runner.generate_content("prompt", "data", "job")
+    with pytest.raises(CircuitOpenError):
+        runner.generate_content("prompt", "data", "job")
+    assert strategy.calls == 2
+
+    now = [0.0]
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_seconds=10, clock=lambda: now[0])
+    breaker.record_failure()
+    assert not breaker.allow_request()
+    now[0] = 10
+    assert breaker.allow_request() and not breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_slow_requests_are_hedged(resilience_config):
+    config, _ = resilience_config
+    config.hedge_after_seconds = 0.05
+    release = threading.Event()
+    calls = []
+
+    def slow_then_fast():
+        calls.append(None)
+        if len(calls) == 1:
+            release.wait(2)
+            return "slow"
+        return "fast"
+
+    started = time.monotonic()
+    assert resilience.call_hedged(slow_then_fast, config.hedge_after_seconds) == "fast"
+    assert time.monotonic() - started < 1
+    release.set()
+
+    async def aslow_then_fast(delays=[1.0, 0.0]):
+        delay = delays.pop(0)
+        await asyncio.sleep(delay)
+        return delay
+
+    assert asyncio.run(resilience.acall_hedged(aslow_then_fast, 0.05)) == 0.0
+
+
+def test_hedging_reserves_budget_and_does_not_cap_concurrency():
+    reserved = []
+    release = threading.Event()
+    calls = []
+
+    def slow_then_fast():
+        calls.append(None)
+        if len(calls) == 1:
+            release.wait(2)
+            return "slow"
+        return "fast"
+
+    assert resilience.call_hedged(slow_then_fast, 0.05, before_hedge=lambda: reserved.append(None)) == "fast"
+    assert len(reserved) == 1
+    release.set()
+
+    # Many concurrent calls faster than hedge_after all finish at once and send no duplicates
+    calls.clear()
+
+    def call():
+        calls.append(None)
+        time.sleep(0.1)
+        return "ok"
+
+    threads = [threading.Thread(target=resilience.call_hedged, args=(call, 0.5)) for _ in range(20)]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.monotonic() - started < 0.4
+    assert len(calls) == 20
+
+
+def test_non_retryable_errors_do_not_open_the_circuit(resilience_config):
+    config, _ = resilience_config
+    config.breaker_failure_threshold = 1
+    strategy = ScriptedStrategy(*[APIError("400 Bad Request", status_code=400)] * 3)
+    runner = LLMRunner(strategy)
+
+    for _ in range(3):
+        with pytest.raises(APIError):
+            runner.generate_content("prompt", "data", "job")
+    assert strategy.calls == 3
+    assert resilience.get_circuit_breaker_stats()["Primary"]["state"] == CircuitBreaker.CLOSED
+
+
+def test_api_error_keeps_status_and_retry_after():
+    response = httpx.Response(503, headers={"Retry-After": "12"}, request=httpx.Request("POST", "http://x"))
+    error = APIError.from_exception("Ollama API error", httpx.HTTPStatusError("boom", request=response.request,
+                                                                              response=response))
+    assert (error.status_code, error.retry_after, error.retryable) == (503, 12.0, True)
+    assert APIError.from_exception("OpenAI API error", httpx.ConnectTimeout("timed out")).retryable
+    assert not APIError.from_exception("OpenAI API error", ValueError("bad prompt")).retryable
@@ -0,0 +1,49 @@
+import mongomock
+import pytest
+from src.latex.utils.pdf_cache import PdfCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return PdfCache(directory=tmp_path, max_bytes=10, use_mongo=False)
+
+
+def test_key_covers_compiler_and_assets():
+    key = PdfCache.make_key("tex", "pdfTeX 3.14", {"signature.jpg": b"a"})
+    assert key == PdfCache.make_key("tex", "pdfTeX 3.14", {"signature.jpg": b"a"})
+    assert key != PdfCache.make_key("tex", "pdfTeX 3.15", {"signature.jpg": b"a"})
+    assert key != PdfCache.make_key("tex", "pdfTeX 3.14", {"signature.jpg": b"b"})
+
+
+def test_get_and_set(cache):
+    assert cache.get("ab01") is None
+    cache.set("ab01", b"%PDF")
+    assert cache.get("ab01") == b"%PDF"
+    assert cache.get_stats()["hit_ratio"] == 0.5
+
+
+def test_evicts_least_recently_used(cache):
+    cache.set("aa", b"12345")
+    cache.set("bb", b"12345")
+    cache.get("aa")
+    cache.set("cc", b"12345")
+    assert cache.get("bb") is None
+    assert cache.get("aa") == b"12345"
+    assert cache.get_stats()["size_bytes"] == 10
+
+
+def test_mongo_backfills_local_disk(tmp_path):
+    collection = mongomock.MongoClient()["test_db"]["pdf_cache"]
+    PdfCache(directory=tmp_path / "a", collection=collection, use_mongo=True).set("ab01", b"%PDF")
+    other = PdfCache(directory=tmp_path / "b", collection=collection, use_mongo=True)
+    assert other.get("ab01") == b"%PDF"
+    assert other.get_stats()["mongo_hits"] == 1
+    assert (tmp_path / "b" / "ab" / "ab01.pdf").exists()
+
+
+def test_mongo_entries_expire(tmp_path):
+    collection = mongomock.MongoClient()["test_db"]["pdf_cache"]
+    PdfCache(directory=tmp_path, collection=collection, use_mongo=True, ttl_seconds=60).set("ab01", b"%PDF")
+    ttl_index = next(index for index in collection.index_information().values()
+                     if index["key"] == [("created_at", 1)])
+    assert ttl_index["expireAfterSeconds"] == 60
@@ -0,0 +1,23 @@
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, Mock
+from src.api.services import portfolio_service
+from src.api.services.portfolio_service import PortfolioService
+
+
+def test_portfolio_update_invalidates_off_the_event_loop(monkeypatch):
+    uow = MagicMock()
+    uow.__aenter__.return_value = uow
+    uow.portfolios.get_by_user_id = AsyncMock(return_value=Mock())
+    uow.portfolios.update = AsyncMock(return_value=True)
+    uow.commit = AsyncMock()
+    invalidated_on = []
+    cache = Mock(invalidate_user=lambda user_id: invalidated_on.append(threading.current_thread()))
+    monkeypatch.setattr(portfolio_service, "get_section_cache", lambda: cache)
+
+    async def update():
+        await PortfolioService(uow).update_portfolio("user", {})
+        return threading.current_thread()
+
+    loop_thread = asyncio.run(update())
+    assert len(invalidated_on) == 1 and invalidated_on[0] is not loop_thread
@@ -0,0 +1,67 @@
+from types import SimpleNamespace
+import pytest
+import src.generator  # noqa: F401  (src.llms and src.generator import each other; load generator first)
+from src.llms.strategies import ClaudeStrategy, LLMStrategy
+from src.llms.utils.usage import PromptCacheStats, record_usage
+
+
+class EchoStrategy(LLMStrategy):
+    provider = "Echo"
+
+    def generate_content(self, prompt, data, job_description):
+        return prompt
+
+    def create_folder_name(self, prompt, job_description):
+        return "Acme|Engineer"
+
+
+@pytest.fixture(autouse=True)
+def reset_stats():
+    PromptCacheStats.reset()
+    yield
+    PromptCacheStats.reset()
+
+
+def test_sections_for_one_job_share_a_prefix():
+    strategy = EchoStrategy("system")
+    skills = strategy._format_prompt("Write the skills section", '{"skills": []}', "Senior engineer at Acme")
+    summary = strategy._format_prompt("Write the summary", '{"summary": ""}', "Senior engineer at Acme")
+
+    shared, _ = strategy._prompt_blocks("Write the summary", '{"summary": ""}', "Senior engineer at Acme")
+    assert skills.startswith(shared) and summary.startswith(shared)
+    assert "Senior engineer at Acme" in shared
+    # The section-specific instruction comes last
+    assert skills.rstrip().endswith("Write the skills section")
+    assert skills.index("<data>") > skills.index("<job_description>")
+
+
+def test_claude_request_sets_cache_breakpoints(monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test_key")
+    strategy = ClaudeStrategy("system prompt")
+
+    request = strategy._request(*strategy._prompt_blocks("Write the summary", "data", "job"))
+    assert request["system"][0]["cache_control"] == {"type": "ephemeral"}
+    shared, specific = request["messages"][0]["content"]
+    assert "job" in shared["text"] and shared["cache_control"] == {"type": "ephemeral"}
+    assert "Write the summary" in specific["text"] and "cache_control" not in specific
+
+    # Without a job description there is nothing shared to mark
+    request = strategy._request(*strategy._prompt_blocks("Name the folder"))
+    assert len(request["messages"][0]["content"]) == 1
+
+
+def test_cached_tokens_are_reported_per_provider():
+    claude = SimpleNamespace(content=[SimpleNamespace(text="ok")], usage=SimpleNamespace(
+        input_tokens=100, cache_read_input_tokens=1500, cache_creation_input_tokens=0))
+    openai = SimpleNamespace(choices=[], usage=SimpleNamespace(
+        prompt_tokens=2000, prompt_tokens_details=SimpleNamespace(cached_tokens=1024)))
+
+    record_usage(claude, "Claude")
+    record_usage(openai, "OpenAI")
+    record_usage(SimpleNamespace(content=[]), "Claude")  # no usage data: ignored
+
+    stats = PromptCacheStats.get_stats()
+    assert stats["Claude"]["input_tokens"] == 1600
+    assert stats["Claude"]["cached_tokens"] == 1500
+    assert stats["Claude"]["requests"] == 1
+    assert stats["OpenAI"]["cache_hit_ratio"] == 0.512
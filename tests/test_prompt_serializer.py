@@ -0,0 +1,65 @@
+import json
+import src.generator  # noqa: F401  (src.llms and src.generator import each other; load generator first)
+from src.generator.utils.prompt_serializer import (
+    get_serialization_stats, serialize_cover_letter_context, serialize_section, strip_latex
+)
+
+
+WORK_EXPERIENCE = [
+    {
+        "_id": "abc123",
+        "job_title": "Senior Engineer",
+        "company": "R\\&D Labs",
+        "location": "",
+        "time": "2020 - Present",
+        "responsibilities": ["Cut build times by 40\\%", ""],
+        "internal_notes": "not for the model"
+    },
+    {"job_title": "", "company": "", "responsibilities": []}
+]
+
+
+def test_section_data_is_compact_canonical_json():
+    serialized = serialize_section("work_experience", WORK_EXPERIENCE)
+
+    assert json.loads(serialized) == [{
+        "company": "R&D Labs",
+        "job_title": "Senior Engineer",
+        "responsibilities": ["Cut build times by 40%"],
+        "time": "2020 - Present"
+    }]
+    assert serialized == json.dumps(json.loads(serialized), sort_keys=True, separators=(",", ":"))
+    # Key order in the source does not change the prompt
+    reordered = [dict(reversed(list(item.items()))) for item in WORK_EXPERIENCE]
+    assert serialize_section("work_experience", reordered) == serialized
+    assert len(serialized) < len(str(WORK_EXPERIENCE)) / 2
+
+
+def test_empty_sections_serialize_to_nothing():
+    assert serialize_section("awards", []) == ""
+    assert serialize_section("awards", None) == ""
+    assert serialize_section("skills", [{"Languages": ["Python", ""]}]) == '[{"Languages":["Python"]}]'
+
+
+def test_cover_letter_context_strips_latex():
+    latex = r"""\section{Experience}
+\begin{itemize}[leftmargin=*]
+  \item \textbf{Senior Engineer} at R\&D Labs \hfill 2020 % layout tweak
+  \item Led \href{https://example.com}{the build team}, 40\% faster \\
+\end{itemize}"""
+    assert strip_latex(latex) == ("Experience\n- Senior Engineer at R&D Labs 2020\n"
+                                  "- Led the build team (https://example.com), 40% faster")
+
+    context = json.loads(serialize_cover_letter_context({
+        "work_experience": latex, "awards": "", "personal_information": {"name": "Ada", "phone": ""}
+    }))
+    assert context == {"personal_information": {"name": "Ada"}, "work_experience": strip_latex(latex)}
+
+
+def test_token_savings_are_reported():
+    before = get_serialization_stats()
+    serialize_section("work_experience", WORK_EXPERIENCE)
+    after = get_serialization_stats()
+
+    assert after["calls"] == before["calls"] + 1
+    assert after["tokens_saved"] > before["tokens_saved"]
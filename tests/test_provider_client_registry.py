@@ -0,0 +1,46 @@
+import asyncio
+import pytest
+import src.generator  # noqa: F401  (src.llms and src.generator import each other; load generator first)
+from src.llms.client_registry import ProviderClientRegistry
+from src.llms.runner import LLMRunner
+from src.llms.strategies import OpenAIStrategy, ClaudeStrategy
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    ProviderClientRegistry._reset_after_fork()
+    yield
+    ProviderClientRegistry.close_all()
+
+
+def test_clients_are_shared_per_api_key():
+    first = ProviderClientRegistry.get_openai_client("key-a")
+    assert ProviderClientRegistry.get_openai_client("key-a") is first
+    assert ProviderClientRegistry.get_openai_client("key-b") is not first
+    assert ProviderClientRegistry.get_stats()["clients"] == 2
+
+
+def test_strategies_are_views_over_shared_clients(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test_key")
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test_key")
+    runner = LLMRunner(OpenAIStrategy("system prompt"))
+    client = runner.strategy.client
+
+    runner.update_config("Claude", "claude-3-5-sonnet-20241022", 0.2)
+    runner.update_config("OpenAI", "gpt-4o", 0.3)
+
+    assert runner.strategy.client is client
+    assert runner.strategy.system_instruction == "system prompt"
+    assert ClaudeStrategy("system").client is ProviderClientRegistry.get_anthropic_client("test_key")
+    assert ProviderClientRegistry.get_stats()["clients"] == 2
+
+
+def test_async_clients_are_scoped_to_their_event_loop():
+    async def get_clients():
+        return (ProviderClientRegistry.get_async_ollama_client("http://localhost:11434"),
+                ProviderClientRegistry.get_async_ollama_client("http://localhost:11434"))
+
+    first, same = asyncio.run(get_clients())
+    other, _ = asyncio.run(get_clients())
+    assert first is same
+    assert other is not first
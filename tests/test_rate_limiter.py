@@ -0,0 +1,139 @@
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+import mongomock
+import pytest
+import src.generator  # noqa: F401  (src.llms and src.generator import each other; load generator first)
+from config.llm_config import RateLimitConfig
+from src.llms.rate_limiter import (
+    ConcurrencyLimiter, FileBucketStore, InMemoryBucketStore, MongoBucketStore, RateLimiter, estimate_tokens
+)
+from src.llms.runner import LLMRunner
+from src.llms.strategies import LLMStrategy
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class EchoStrategy(LLMStrategy):
+    provider = "TestProv"
+    max_tokens = 100
+
+    def generate_content(self, prompt, data, job_description):
+        return prompt
+
+    def create_folder_name(self, prompt, job_description):
+        return "Acme|Engineer"
+
+
+@pytest.fixture
+def config(monkeypatch):
+    # One request per second and ten tokens per second, with one second of burst
+    monkeypatch.setenv("TESTPROV_RPM", "60")
+    monkeypatch.setenv("TESTPROV_TPM", "600")
+    return RateLimitConfig(backend="memory", headroom=1.0, burst_seconds=1.0, file_path="",
+                           collection="llm_rate_limits", limits={})
+
+
+def test_requests_are_spaced_evenly_instead_of_bursting(config):
+    clock = FakeClock()
+    limiter = RateLimiter(InMemoryBucketStore(), config, clock=clock)
+
+    waits = [limiter.reserve("TestProv", "model", 1) for _ in range(4)]
+    assert waits == pytest.approx([0, 1, 2, 3])
+
+    clock.now += 10
+    assert limiter.reserve("TestProv", "model", 1) == 0
+    # Budgets are kept per model
+    assert limiter.reserve("TestProv", "other-model", 1) == 0
+    assert limiter.get_stats()["throttled"] == 3
+
+
+def test_token_budget_uses_prompt_and_max_tokens(config):
+    limiter = RateLimiter(InMemoryBucketStore(), config, clock=FakeClock())
+    tokens = estimate_tokens("x" * 80, max_tokens=10)
+
+    assert tokens == 30
+    # 10 tokens of burst, then 20 tokens of debt at 10 tokens per second
+    assert limiter.reserve("TestProv", "model", tokens) == pytest.approx(2)
+
+
+@pytest.mark.parametrize("make_store", [
+    lambda tmp_path: MongoBucketStore(mongomock.MongoClient().db.llm_rate_limits),
+    lambda tmp_path: FileBucketStore(str(tmp_path / "buckets.json")),
+])
+def test_shared_stores_enforce_one_budget_across_workers(config, make_store, tmp_path):
+    store, clock = make_store(tmp_path), FakeClock()
+    worker_a = RateLimiter(store, config, clock=clock)
+    worker_b = RateLimiter(store, config, clock=clock)
+
+    assert worker_a.reserve("TestProv", "model", 1) == 0
+    assert worker_b.reserve("TestProv", "model", 1) == pytest.approx(1)
+    assert worker_a.reserve("TestProv", "model", 1) == pytest.approx(2)
+
+
+def test_runner_reserves_estimated_cost_and_survives_store_failures(config):
+    broken_store = Mock(blocking=True)
+    broken_store.reserve.side_effect = ConnectionError("mongo down")
+    limiter = RateLimiter(broken_store, config, clock=FakeClock())
+    assert limiter.reserve("TestProv", "model", 1) == 0
+
+    strategy = EchoStrategy("system")
+    strategy.model = "model"
+    runner = LLMRunner(strategy)
+    runner.rate_limiter = Mock(spec=RateLimiter)
+
+    runner.generate_content("prompt", "data", "job")
+    expected = estimate_tokens("system" + strategy._format_prompt("prompt", "data", "job"), 100)
+    runner.rate_limiter.acquire.assert_called_once_with("TestProv", "model", expected)
+
+
+def test_in_flight_cap_is_shared_by_every_caller():
+    limiter = ConcurrencyLimiter(limits=lambda provider: 2)
+    in_flight, peak = 0, 0
+    lock = threading.Lock()
+
+    class SlowStrategy(EchoStrategy):
+        def generate_content(self, prompt, data, job_description):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return prompt
+
+    # Separate runners, as separate jobs and resumes would have
+    runners = []
+    for _ in range(6):
+        runner = LLMRunner(SlowStrategy("system"))
+        runner.rate_limiter = Mock(spec=RateLimiter)
+        runner.concurrency_limiter = limiter
+        runners.append(runner)
+    threads = [threading.Thread(target=r.generate_content, args=("p", "d", "j")) for r in runners]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert peak == 2
+
+    async def hold_both_then_wait():
+        with limiter.slot("TestProv"), limiter.slot("TestProv"):
+            waiter = asyncio.ensure_future(_take_async_slot(limiter))
+            await asyncio.sleep(0.1)
+            assert not waiter.done()
+        await asyncio.wait_for(waiter, 1)
+
+    asyncio.run(hold_both_then_wait())
+
+
+async def _take_async_slot(limiter):
+    async with limiter.aslot("TestProv"):
+        return True
@@ -0,0 +1,69 @@
+import copy
+import pytest
+from config.ranking_config import SectionRankingConfig
+from src.generator.relevance_ranker import BM25Scorer, RelevanceRanker, top_k
+
+JOB = "Backend engineer: Python, Kubernetes and PostgreSQL for distributed services"
+
+
+def make_config(**overrides):
+    values = dict(enabled=True, item_multiplier=2, bullet_multiplier=2, k1=1.5, b=0.75)
+    values.update(overrides)
+    return SectionRankingConfig(**values)
+
+
+def job(i, bullets):
+    return {'job_title': f"Role {i}", 'company': f"Company {i}", 'responsibilities': bullets}
+
+
+def test_bm25_ranks_matching_documents_first():
+    documents = [
+        "Organised quarterly sales meetings and vendor budgets",
+        "Built distributed Python services on Kubernetes backed by PostgreSQL",
+        "Wrote Python scripts for reporting",
+    ]
+    scores = BM25Scorer().score(documents, JOB)
+
+    assert scores.argmax() == 1
+    assert scores[2] > scores[0] == 0
+    # Ties keep the earlier item and results stay in their original order
+    assert top_k(scores, 2) == [1, 2]
+    assert top_k(scores, 5) == [0, 1, 2]
+
+
+def test_select_keeps_multiple_of_preference_cap_in_original_order():
+    jobs = [job(i, ["Managed vendor budgets"]) for i in range(10)]
+    jobs[7]['responsibilities'] = ["Scaled PostgreSQL on Kubernetes"]
+    jobs[2]['responsibilities'] = ["Built Python services"]
+    ranker = RelevanceRanker(make_config())
+
+    selected = ranker.select('work_experience', jobs, JOB, {'work_experience_details': {'max_jobs': 1}})
+
+    assert [item['company'] for item in selected] == ["Company 2", "Company 7"]
+    # Without preferences the defaults apply (max_jobs=4, so eight are kept)
+    assert len(ranker.select('work_experience', jobs, JOB)) == 8
+
+
+def test_select_trims_bullets_without_mutating_input():
+    bullets = ["Filed expense reports", "Tuned PostgreSQL queries", "Ran team lunches",
+               "Deployed Python on Kubernetes", "Updated the wiki"]
+    jobs = [job(0, bullets)]
+    original = copy.deepcopy(jobs)
+    ranker = RelevanceRanker(make_config(bullet_multiplier=1))
+
+    selected = ranker.select('work_experience', jobs, JOB,
+                             {'work_experience_details': {'max_jobs': 3, 'bullet_points_per_job': 2}})
+
+    assert selected[0]['responsibilities'] == ["Tuned PostgreSQL queries", "Deployed Python on Kubernetes"]
+    assert jobs == original
+
+
+@pytest.mark.parametrize("config, section, data, job_description", [
+    (make_config(enabled=False), 'projects', [{'name': str(i)} for i in range(50)], JOB),
+    (make_config(), 'skills', [{'name': str(i)} for i in range(50)], JOB),
+    (make_config(), 'projects', [{'name': "one"}], JOB),
+    (make_config(), 'projects', [{'name': str(i)} for i in range(50)], ""),
+    (make_config(), 'career_summary', {'summary': "text"}, JOB),
+])
+def test_select_passes_through_when_nothing_to_rank(config, section, data, job_description):
+    assert RelevanceRanker(config).select(section, data, job_description) == data
@@ -0,0 +1,180 @@
+import time
+import mongomock
+import pytest
+from unittest.mock import Mock
+from src.core.database.connections import client_registry
+from src.core.database.connections.client_registry import MongoClientRegistry
+from src.core.database.factory import get_unit_of_work
+from src.generator.resume_generator import ResumeGenerator
+
+
+SECTIONS = {
+    "personal_information": "process",
+    "career_summary": "process",
+    "skills": "process",
+    "work_experience": "skip",
+}
+
+
+@pytest.fixture
+def generator():
+    """ResumeGenerator with mocked collaborators and a slow LLM."""
+    generator = ResumeGenerator.__new__(ResumeGenerator)
+    generator.user_id = "test_user"
+    generator.llm_runner = Mock(provider="Claude", max_concurrency=4)
+
+    def slow_process_section(section, process_type, job_description, **kwargs):
+        if process_type == "skip":
+            return ""
+        # Earlier sections take longer, so they finish last
+        time.sleep(0.2 if section == "personal_information" else 0.05)
+        return f"content for {section}"
+
+    generator.process_section = Mock(side_effect=slow_process_section)
+    generator._generate_and_save_resume = Mock(return_value=Mock(id="resume_id"))
+    return generator
+
+
+def _run(generator, concurrent):
+    output_manager = Mock()
+    results = list(generator.generate_resume("job", SECTIONS, output_manager, concurrent=concurrent))
+    content_dict = generator._generate_and_save_resume.call_args.kwargs["content_dict"]
+    return results, content_dict
+
+
+def test_concurrent_generation_preserves_section_order(generator):
+    results, content_dict = _run(generator, concurrent=True)
+
+    progress = [r for r in results if isinstance(r, tuple)]
+    assert len(progress) == len(SECTIONS) + 1
+    assert [p for _, p in progress] == sorted(p for _, p in progress)
+    # The slow section finishes last but still comes first in the document
+    assert progress[len(SECTIONS) - 1][0] == "Processing personal_information..."
+    assert list(content_dict)[0] == "personal_information"
+    assert content_dict["personal_information"] == "content for personal_information"
+    assert content_dict["work_experience"] == ""
+    assert results[-1].id == "resume_id"
+
+
+def test_concurrent_generation_is_bounded_by_slowest_section(generator):
+    start = time.monotonic()
+    _run(generator, concurrent=True)
+    assert time.monotonic() - start < 0.3
+
+
+def test_sequential_generation_matches_concurrent_output(generator):
+    _, concurrent_content = _run(generator, concurrent=True)
+    _, sequential_content = _run(generator, concurrent=False)
+    assert concurrent_content == sequential_content
+
+
+def test_concurrent_generation_propagates_errors(generator):
+    generator.process_section.side_effect = RuntimeError("provider down")
+    with pytest.raises(RuntimeError):
+        _run(generator, concurrent=True)
+
+
+@pytest.mark.parametrize("max_concurrency, fallbacks", [
+    (4, {"personal_information"}),
+    # One LLM call at a time: the sections queued behind the slow one miss the budget too
+    (1, {"personal_information", "career_summary", "skills"}),
+])
+def test_latency_budget_hardcodes_late_sections(generator, max_concurrency, fallbacks):
+    generator.llm_runner.max_concurrency = max_concurrency
+    generator.hardcoder = Mock(hardcode_section=lambda section: f"hardcoded {section}")
+
+    start = time.monotonic()
+    list(generator.generate_resume("job", SECTIONS, Mock(), concurrent=False, latency_budget=0.1))
+
+    assert time.monotonic() - start < 0.2
+    content_dict = generator._generate_and_save_resume.call_args.kwargs["content_dict"]
+    assert set(generator.fallback_sections) == fallbacks
+    for section in SECTIONS:
+        if section in fallbacks:
+            assert content_dict[section] == f"hardcoded {section}"
+    assert content_dict["work_experience"] == ""
+    if max_concurrency > 1:
+        assert content_dict["career_summary"] == "content for career_summary"
+
+
+@pytest.fixture
+def incremental_generator(monkeypatch):
+    """ResumeGenerator running process_section for real against mocked loaders and LLM."""
+    client = mongomock.MongoClient()
+    monkeypatch.setattr(client_registry, "MongoClient", lambda uri, event_listeners, **kwargs: client)
+    MongoClientRegistry._reset_after_fork()
+    generator = ResumeGenerator.__new__(ResumeGenerator)
+    generator.user_id = "test_user"
+    generator.uow = get_unit_of_work()
+    generator.use_cache = False
+    generator.section_cache = Mock()
+    generator.base_sections = {}
+    generator.section_fingerprints = {}
+    generator.user_context = Mock(preferences={})
+    generator.portfolio = {"career_summary": {"summary": "Backend engineer"}, "skills": ["Python"]}
+    generator.portfolio_loader = Mock(get_section_data=lambda section: generator.portfolio[section])
+    generator.relevance_ranker = Mock(select=lambda section, data, job_description, preferences: data)
+    generator.prompt_loader = Mock(get_section_prompt=lambda section: f"Write the {section}")
+    generator.latex_compiler = Mock(generate_pdf=Mock(return_value=b"%PDF"))
+    generator.llm_runner = Mock(provider="Claude", max_concurrency=1)
+    generator.llm_runner.get_config.return_value = {"type": "Claude", "model": "claude", "temperature": 0.1}
+    generator.llm_runner.generate_content.side_effect = lambda prompt, data, job: f"{prompt} from {data}"
+    yield generator
+    MongoClientRegistry.close_all()
+
+
+def _generate(generator, base_resume_id=None):
+    output_manager = Mock()
+    output_manager.get_job_info.return_value = Mock(company_name="Acme", job_title="Engineer",
+                                                    job_description="job")
+    sections = {"career_summary": "process", "skills": "process"}
+    return list(generator.generate_resume("job", sections, output_manager, base_resume_id=base_resume_id))[-1]
+
+
+def test_incremental_regeneration_only_regenerates_changed_sections(incremental_generator):
+    first = _generate(incremental_generator)
+    assert set(first.section_fingerprints) == {"career_summary", "skills"}
+    assert incremental_generator.llm_runner.generate_content.call_count == 2
+
+    incremental_generator.portfolio["skills"] = ["Python", "Go"]
+    second = _generate(incremental_generator, base_resume_id=first.id)
+
+    assert incremental_generator.llm_runner.generate_content.call_count == 3
+    assert second.career_summary == first.career_summary
+    assert second.skills != first.skills and "Go" in second.skills
+    assert second.section_fingerprints["career_summary"] == first.section_fingerprints["career_summary"]
+    assert second.section_fingerprints["skills"] != first.section_fingerprints["skills"]
+
+    # A change of model invalidates every section
+    incremental_generator.llm_runner.get_config.return_value["temperature"] = 0.7
+    _generate(incremental_generator, base_resume_id=second.id)
+    assert incremental_generator.llm_runner.generate_content.call_count == 5
+
+
+def test_incremental_regeneration_requires_own_base_resume(incremental_generator):
+    resume = _generate(incremental_generator)
+    incremental_generator.user_id = "someone_else"
+    with pytest.raises(ValueError, match="not found"):
+        _generate(incremental_generator, base_resume_id=resume.id)
+
+
+def test_fallback_sections_are_saved_without_fingerprints(incremental_generator):
+    generate_content = incremental_generator.llm_runner.generate_content.side_effect
+
+    def slow_skills(prompt, data, job):
+        if "skills" in prompt:
+            time.sleep(0.3)
+        return generate_content(prompt, data, job)
+    incremental_generator.llm_runner.generate_content.side_effect = slow_skills
+    incremental_generator.hardcoder = Mock(hardcode_section=lambda section: f"hardcoded {section}")
+
+    output_manager = Mock()
+    output_manager.get_job_info.return_value = Mock(company_name="Acme", job_title="Engineer",
+                                                    job_description="job")
+    sections = {"career_summary": "process", "skills": "process"}
+    resume = list(incremental_generator.generate_resume("job", sections, output_manager, latency_budget=0.1))[-1]
+
+    assert resume.skills == "hardcoded skills"
+    assert resume.fallback_sections == ["skills"]
+    # Only fully generated sections can be reused by a later incremental regeneration
+    assert set(resume.section_fingerprints) == {"career_summary"}
@@ -0,0 +1,49 @@
+import mongomock
+import pytest
+from src.generator.utils.section_cache import SectionCache
+
+
+@pytest.fixture
+def collection():
+    return mongomock.MongoClient()["test_db"]["section_cache"]
+
+
+@pytest.fixture
+def cache(collection):
+    return SectionCache(collection=collection, max_memory_entries=2, ttl_seconds=60)
+
+
+def make_key(job_description="Python developer", temperature=0.1):
+    return SectionCache.make_key("prompt", {"skills": ["Python"]}, job_description, "ClaudeStrategy", "claude", temperature)
+
+
+def test_key_ignores_job_description_whitespace():
+    assert make_key("Python   developer\n") == make_key("Python developer")
+    assert make_key(temperature=0.2) != make_key()
+
+
+def test_get_and_set(cache):
+    key = make_key()
+    assert cache.get(key) is None
+    cache.set(key, "content", "user", "skills")
+    assert cache.get(key) == "content"
+    assert cache.get_stats()["memory_hits"] == 1
+    assert cache.get_stats()["misses"] == 1
+
+
+def test_falls_back_to_mongo_after_eviction(cache, collection):
+    keys = [make_key(str(i)) for i in range(3)]
+    for key in keys:
+        cache.set(key, key, "user", "skills")
+    assert cache.get_stats()["memory_entries"] == 2
+    assert cache.get(keys[0]) == keys[0]
+    assert cache.get_stats()["memory_hits"] == 0
+    assert collection.index_information()["created_at_1"]["expireAfterSeconds"] == 60
+
+
+def test_invalidate_user(cache):
+    cache.set(make_key("a"), "a", "user", "skills")
+    cache.set(make_key("b"), "b", "other", "skills")
+    assert cache.invalidate_user("user") == 1
+    assert cache.get(make_key("a")) is None
+    assert cache.get(make_key("b")) == "b"
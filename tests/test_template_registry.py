@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta
+import mongomock
+import pytest
+from src.core.database.connections import client_registry
+from src.core.database.connections.client_registry import MongoClientRegistry
+from src.core.database.factory import get_unit_of_work
+from src.loaders.template_registry import TemplateRegistry
+from src.loaders.tex_loader import TexLoader
+from config.config import MONGODB_DATABASE
+
+
+@pytest.fixture
+def db(monkeypatch):
+    client = mongomock.MongoClient()
+    monkeypatch.setattr(client_registry, "MongoClient", lambda uri, event_listeners, **kwargs: client)
+    MongoClientRegistry._reset_after_fork()
+
+    db = client[MONGODB_DATABASE]
+    now = datetime.utcnow()
+    db.tex_headers.insert_one({"name": "award_item", "content": "\\item{{{name}: {explanation}}}",
+                               "created_at": now, "updated_at": now})
+    db.preambles.insert_one({"name": "resume", "type": "resume_preamble", "content": "\\documentclass{article}"})
+    yield db
+    MongoClientRegistry.close_all()
+
+
+def test_lookups_are_served_from_memory(db):
+    registry = TemplateRegistry(uow=get_unit_of_work(), refresh_seconds=3600)
+    loader = TexLoader(registry)
+
+    assert loader.safe_format_template("award_item", name="A", explanation="B") == "\\item{A: B}"
+    assert registry.get_preamble("resume_preamble") == "\\documentclass{article}"
+
+    db.tex_headers.update_one({"name": "award_item"}, {"$set": {"content": "changed {name}"}})
+    assert registry.get_template("award_item").fields == {"name", "explanation"}
+    with pytest.raises(ValueError, match="explanation"):
+        loader.safe_format_template("award_item", name="A")
+
+
+def test_reloads_when_updated_at_changes(db):
+    registry = TemplateRegistry(uow=get_unit_of_work(), refresh_seconds=0)
+    assert registry.get_template("award_item").fields == {"name", "explanation"}
+
+    db.tex_headers.update_one({"name": "award_item"},
+                              {"$set": {"content": "{name}", "updated_at": datetime.utcnow() + timedelta(seconds=1)}})
+    assert registry.get_template("award_item").content == "{name}"
+
+
+def test_missing_template_is_fetched_by_name(db):
+    registry = TemplateRegistry(uow=get_unit_of_work(), refresh_seconds=3600)
+    registry.reload()
+    db.tex_headers.insert_one({"name": "new", "content": "x", "created_at": datetime.utcnow(),
+                               "updated_at": datetime.utcnow()})
+
+    assert registry.get_template("new").content == "x"
+    with pytest.raises(ValueError):
+        registry.get_template("unknown")
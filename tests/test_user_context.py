@@ -0,0 +1,78 @@
+from datetime import datetime
+import mongomock
+import pytest
+from src.core.database.connections import client_registry
+from src.core.database.connections.client_registry import MongoClientRegistry
+from src.core.dto.user_context import UserContext
+from src.loaders.prompt_loader import PromptLoader
+from config.config import MONGODB_DATABASE
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """Shared mongomock database seeded with one user."""
+    client = mongomock.MongoClient()
+    monkeypatch.setattr(client_registry, "MongoClient", lambda uri, event_listeners, **kwargs: client)
+    MongoClientRegistry._reset_after_fork()
+
+    db = client[MONGODB_DATABASE]
+    now = datetime.utcnow()
+    db.users.insert_one({
+        "user_id": "test_user",
+        "email": "test@example.com",
+        "hashed_password": "hash",
+        "preferences": {"feature_preferences": {"check_clearance": False}}
+    })
+    db.portfolios.insert_one({
+        "user_id": "test_user",
+        "profile_id": "profile",
+        "career_summary": {"job_titles": ["Engineer"], "years_of_experience": "5", "default_summary": "R&D"},
+        "skills": [{"Languages": ["Python", "C#"]}],
+        "created_at": now,
+        "updated_at": now
+    })
+    db.profiles.insert_one({
+        "user_id": "test_user",
+        "personal_information": {"full_name": "Jane Doe", "email": "jane@example.com"},
+        "life_story": "Grew up coding.",
+        "signature": {"content_type": "image/jpeg", "filename": "sig.jpg", "image": b"\xff\xd8"},
+        "created_at": now,
+        "updated_at": now
+    })
+    yield db
+    MongoClientRegistry.close_all()
+
+
+def test_load_user_context(db):
+    context = UserContext.load("test_user")
+
+    assert context.user.email == "test@example.com"
+    assert context.feature_preferences["check_clearance"] is False
+    assert context.portfolio.career_summary.default_summary == "R&D"
+    assert context.portfolio_dto.name == "Jane Doe"
+    assert context.personal_information["name"] == "Jane Doe"
+    assert context.life_story == "Grew up coding."
+    assert context.signature == b"\xff\xd8"
+
+
+def test_load_user_context_without_user_document(db):
+    db.users.delete_many({})
+    context = UserContext.load("test_user")
+    assert context.user is None
+    assert context.preferences == {}
+    assert context.profile.user_id == "test_user"
+
+
+def test_load_user_context_missing_portfolio(db):
+    db.portfolios.delete_many({})
+    with pytest.raises(ValueError):
+        UserContext.load("test_user")
+
+
+def test_prompt_loader_uses_context_preferences(db):
+    context = UserContext.load("test_user")
+    db.users.delete_many({})
+
+    prompt_loader = PromptLoader(user_id="test_user", user_context=context)
+    assert prompt_loader.preferences == context.preferences
+    assert "Grew up coding." in prompt_loader.get_cover_letter_prompt()